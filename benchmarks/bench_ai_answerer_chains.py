@@ -0,0 +1,51 @@
+"""
+Micro-benchmark of the per-question chain overhead in AiAnswerer.
+
+Compares rebuilding the 13 section chains on every textbox question (the
+previous behaviour) with looking them up in the registry built at __init__.
+The LLM is a stub, so only prompt/chain construction and invocation are timed.
+
+Usage: python benchmarks/bench_ai_answerer_chains.py [iterations]
+"""
+import os
+import sys
+import timeit
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+# Stub LLM only: skip the search engine key validation done on config import
+os.environ.setdefault("ENV", "test")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from constants import LEGAL_AUTHORIZATION, QUESTION, RESUME_SECTION  # noqa: E402
+from llm.ai_answerer import SECTION_TEMPLATES, AiAnswerer  # noqa: E402
+
+
+def stub_llm(messages):
+    return AIMessage(content="Yes")
+
+
+def main(iterations: int) -> None:
+    logger.remove()
+    with patch("llm.ai_answerer.AIAdapter"), \
+         patch("llm.ai_answerer.TensorZeroChatModelWrapper", return_value=stub_llm):
+        answerer = AiAnswerer({}, "api_key")
+    answerer.set_resume(MagicMock(legal_authorization="Authorized"))
+    inputs = {RESUME_SECTION: "Authorized", QUESTION: "Are you allowed to work in the EU?"}
+
+    def rebuild_per_question():
+        chains = {section: answerer._create_chain(template) for section, template in SECTION_TEMPLATES.items()}
+        chains[LEGAL_AUTHORIZATION].invoke(inputs)
+
+    def registry_lookup():
+        answerer.section_chains[LEGAL_AUTHORIZATION].invoke(inputs)
+
+    for name, func in (("rebuild per question", rebuild_per_question), ("registry lookup", registry_lookup)):
+        seconds = timeit.timeit(func, number=iterations)
+        print(f"{name:<22} {seconds / iterations * 1000:8.3f} ms/question")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,65 @@
+"""
+Micro-benchmark of the blacklist check done for every search result.
+
+Compares re.search over the look_ahead_patterns strings (the previous
+is_blacklisted) with the BlacklistMatcher compiled once in set_parameters,
+for blacklists of a few hundred entries.
+
+Usage: python benchmarks/bench_blacklist_matcher.py [iterations]
+"""
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from regex_utils import BlacklistMatcher, look_ahead_patterns  # noqa: E402
+
+WORDS = [
+    "senior", "junior", "staff", "principal", "data", "software", "platform", "backend", "frontend",
+    "engineer", "developer", "manager", "analyst", "scientist", "sales", "marketing", "support",
+    "intern", "lead", "director", "security", "mobile", "cloud", "devops", "qa", "product",
+]
+
+
+def random_terms(count, words_per_term, rng):
+    return [" ".join(rng.sample(WORDS, words_per_term)) + f" x{i}" for i in range(count)]
+
+
+def main(iterations: int) -> None:
+    rng = random.Random(42)
+    title_blacklist = random_terms(300, 2, rng)
+    company_blacklist = [f"Company {i} Inc" for i in range(300)]
+    location_blacklist = [f"City {i}" for i in range(100)]
+    jobs = [
+        (" ".join(rng.sample(WORDS, 3)).title(), f"Company {rng.randint(0, 1000)} GmbH", "Berlin, Germany")
+        for _ in range(100)
+    ]
+
+    title_patterns = look_ahead_patterns(title_blacklist)
+    company_patterns = look_ahead_patterns(company_blacklist)
+    location_patterns = look_ahead_patterns(location_blacklist)
+
+    def regex_per_pattern():
+        for title, company, location in jobs:
+            (
+                any(re.search(pattern, title, re.IGNORECASE) for pattern in title_patterns)
+                or any(re.search(pattern, company, re.IGNORECASE) for pattern in company_patterns)
+                or any(re.search(pattern, location, re.IGNORECASE) for pattern in location_patterns)
+            )
+
+    matcher = BlacklistMatcher(title_blacklist, company_blacklist, location_blacklist)
+
+    def compiled_matcher():
+        for title, company, location in jobs:
+            matcher.is_blacklisted(title, company, location)
+
+    for name, function in (("re.search per pattern", regex_per_pattern), ("BlacklistMatcher", compiled_matcher)):
+        seconds = min(timeit.repeat(function, number=iterations, repeat=3))
+        print(f"{name:>22}: {seconds / iterations / len(jobs) * 1e6:9.2f} us per job")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
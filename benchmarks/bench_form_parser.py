@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of the offline Lever application form parser.
+
+Times parse_form_sections over the saved application pages in
+tests/resources/lever_application_pages and over a synthetic form of
+40 questions mixing text, email, dropdown and radio fields. The live
+element-by-element path costs between 5 and 10 WebDriver round trips
+per question on the same forms.
+
+Usage: python benchmarks/bench_form_parser.py [iterations]
+"""
+import glob
+import os
+import sys
+import timeit
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+os.environ.setdefault("ENV", "test")
+
+from job_portals.lever.application_page import parse_form_sections  # noqa: E402
+
+QUESTIONS = [
+    "<input type='text' name='cards[{i}]'>",
+    "<input type='email' name='cards[{i}]'>",
+    "<select name='cards[{i}]'><option>Select...</option><option>Yes</option><option>No</option></select>",
+    "<label><input type='radio' name='cards[{i}]' value='Yes'>Yes</label>"
+    "<label><input type='radio' name='cards[{i}]' value='No'>No</label>",
+]
+
+
+def synthetic_form(question_count: int) -> str:
+    questions = "".join(
+        f"<li class='application-question custom-question'>"
+        f"<div class='application-label'>Question {i}<span class='required'>✱</span></div>"
+        f"<div class='application-field'>{QUESTIONS[i % len(QUESTIONS)].format(i=i)}</div></li>"
+        for i in range(question_count)
+    )
+    return (
+        "<html><body><form><div class='section application-form page-centered'>"
+        f"<ul>{questions}</ul></div></form></body></html>"
+    )
+
+
+def main(iterations: int) -> None:
+    pages = {"synthetic form of 40 questions": synthetic_form(40)}
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, "tests", "resources", "lever_application_pages", "*", "*_application_page.html"))):
+        with open(path, encoding="utf-8") as file:
+            pages[os.path.basename(path)] = file.read()
+
+    for name, page_source in pages.items():
+        question_count = sum(len(section) for section in parse_form_sections(page_source))
+        seconds = min(timeit.repeat(lambda: parse_form_sections(page_source), number=iterations, repeat=3))
+        print(f"{name}: {question_count} questions, {seconds / iterations * 1000:.2f} ms per parse")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
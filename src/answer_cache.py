@@ -0,0 +1,306 @@
+import json
+import math
+import os
+import re
+import threading
+import traceback
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from logger import logger
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x1F\x7F]")
+_WORDS = re.compile(r"[a-z0-9]+(?:\.[a-z0-9]+)*")
+
+# Spelling variants that application forms use interchangeably
+_SYNONYMS = {
+    "us": "united states",
+    "u.s": "united states",
+    "usa": "united states",
+    "u.s.a": "united states",
+    "uk": "united kingdom",
+    "u.k": "united kingdom",
+    "yrs": "years",
+    "yr": "year",
+}
+_STOP_WORDS = {
+    "a", "an", "and", "are", "at", "be", "do", "for", "have", "in", "is",
+    "of", "on", "or", "please", "the", "to", "we", "you", "your",
+}
+_CHAR_NGRAM_WEIGHT = 0.25
+_NEGATIONS = re.compile(r"\b(?:not|no|never|none|nor|neither|without|cannot)\b|n['’]t\b", re.IGNORECASE)
+_NUMBERS = re.compile(r"\d+(?:[.,]\d+)*")
+_SENTENCES = re.compile(r"[.?!:;\n]\s+|\n")
+_CASED_WORDS = re.compile(r"[A-Za-z][A-Za-z0-9.&'’+#-]*")
+
+
+def sanitize_question(text: str) -> str:
+    sanitized_text = text.lower().strip().replace('"', "").replace("\\", "")
+    sanitized_text = (
+        _CONTROL_CHARS.sub("", sanitized_text)
+        .replace("\n", " ")
+        .replace("\r", "")
+        .rstrip(",")
+    )
+    return sanitized_text
+
+
+def question_features(text: str) -> Counter:
+    """
+    Sparse feature vector of a question: content words, word bigrams and
+    down-weighted character trigrams (to absorb plurals and typos).
+    """
+    words = _words(text)
+    content = [word for word in words if word not in _STOP_WORDS] or words
+
+    features = Counter()
+    for word in content:
+        features["w:" + word] += 1
+    for first, second in zip(content, content[1:]):
+        features[f"b:{first} {second}"] += 1
+    padded = f" {' '.join(content)} "
+    for i in range(len(padded) - 2):
+        features["c:" + padded[i : i + 3]] += _CHAR_NGRAM_WEIGHT
+    return features
+
+
+def _words(text: str) -> List[str]:
+    words = []
+    for word in _WORDS.findall(text.lower()):
+        words.extend(_SYNONYMS.get(word, word).split())
+    return words
+
+
+def _entity_words(text: str) -> frozenset:
+    """
+    Capitalised words (names of companies, countries, technologies, ...), lowercased.
+    The first word of a sentence only counts when it is an acronym.
+    """
+    entities = set()
+    for sentence in _SENTENCES.split(text):
+        for position, word in enumerate(_CASED_WORDS.findall(sentence)):
+            if not word[0].isupper() or word == "I":
+                continue
+            if position == 0 and not (len(word) > 1 and word.rstrip(".").isupper()):
+                continue
+            entities.update(_words(word) or [word.lower()])
+    return frozenset(entities)
+
+
+class QuestionSignature:
+    """
+    The parts of a question that flip or narrow its meaning while barely moving its
+    similarity score: negations, numbers and entity words. Two questions may only
+    share an answer when they negate alike, mention the same numbers and each one's
+    entity words all appear in the other (stored questions are often lowercased).
+    """
+
+    def __init__(self, text: str):
+        self.negations = frozenset(
+            "not" if match[:2].lower() in ("n'", "n’") else match.lower()
+            for match in _NEGATIONS.findall(text)
+        )
+        self.numbers = frozenset(_NUMBERS.findall(text))
+        self.entities = _entity_words(text)
+        self.words = frozenset(_words(text))
+
+    def is_compatible(self, other: "QuestionSignature") -> bool:
+        return (
+            self.negations == other.negations
+            and self.numbers == other.numbers
+            and self.entities <= other.words
+            and other.entities <= self.words
+        )
+
+
+class SimilarQuestionIndex:
+    """
+    Cosine-similarity search over question feature vectors.
+    An inverted index on word features restricts scoring to questions of the
+    same type sharing at least one content word with the query, and questions
+    whose QuestionSignature differs from the query's are never returned.
+    """
+
+    def __init__(self):
+        self._vectors: List[Tuple[dict, Counter, float, QuestionSignature]] = []
+        self._postings: Dict[Tuple[str, str], List[int]] = {}
+
+    def add(self, item: dict) -> None:
+        features = question_features(item["question"])
+        norm = math.sqrt(sum(weight * weight for weight in features.values()))
+        if not norm:
+            return
+        position = len(self._vectors)
+        self._vectors.append((item, features, norm, QuestionSignature(item["question"])))
+        for feature in features:
+            if feature.startswith("w:"):
+                self._postings.setdefault((item["type"], feature), []).append(position)
+
+    def search(self, question: str, question_type: str, threshold: float) -> List[Tuple[float, dict]]:
+        features = question_features(question)
+        norm = math.sqrt(sum(weight * weight for weight in features.values()))
+        if not norm:
+            return []
+
+        candidates = set()
+        for feature in features:
+            if feature.startswith("w:"):
+                candidates.update(self._postings.get((question_type, feature), ()))
+
+        signature = QuestionSignature(question)
+        matches = []
+        for position in candidates:
+            item, item_features, item_norm, item_signature = self._vectors[position]
+            if not signature.is_compatible(item_signature):
+                continue
+            dot = sum(weight * item_features.get(feature, 0) for feature, weight in features.items())
+            score = dot / (norm * item_norm)
+            if score >= threshold:
+                matches.append((score, item))
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return matches
+
+
+class AnswerCache:
+    """
+    Answers to previously seen application questions, backed by the answers JSON file.
+
+    Questions are sanitized once at load time and indexed by (sanitized_question, type),
+    so a lookup costs one dict access however large the file grows. New answers are
+    appended to the JSON array on disk in place, without re-reading or re-writing it.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._items: List[dict] = []
+        self._by_key: Dict[Tuple[str, str], dict] = {}
+        self._questions: set = set()
+        self._similar = SimilarQuestionIndex()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def items(self) -> List[dict]:
+        return self._items
+
+    def load(self) -> None:
+        logger.debug(f"Loading questions from JSON file: {self.file_path}")
+        try:
+            with open(self.file_path, "r") as f:
+                try:
+                    data = json.load(f)
+                    if not isinstance(data, list):
+                        raise ValueError(
+                            "JSON file format is incorrect. Expected a list of questions."
+                        )
+                except json.JSONDecodeError:
+                    logger.error("JSON decoding failed")
+                    data = []
+        except FileNotFoundError:
+            logger.warning("JSON file not found, starting with an empty answer cache")
+            data = []
+        except Exception:
+            tb_str = traceback.format_exc()
+            logger.error(f"Error loading questions data from JSON file: {tb_str}")
+            raise Exception(
+                f"Error loading questions data from JSON file: \nTraceback:\n{tb_str}"
+            )
+
+        self._items = []
+        self._by_key = {}
+        self._questions = set()
+        self._similar = SimilarQuestionIndex()
+        for item in data:
+            self._index(item)
+        logger.debug(f"Answer cache loaded with {len(self._items)} questions")
+
+    def _index(self, item: dict) -> None:
+        question = sanitize_question(item["question"])
+        self._items.append(item)
+        self._questions.add(question)
+        self._by_key.setdefault((question, item["type"]), item)
+        self._similar.add(item)
+
+    def get(self, question: str, question_type: str) -> Optional[dict]:
+        return self._by_key.get((sanitize_question(question), question_type))
+
+    def find_similar(
+        self,
+        question: str,
+        question_type: str,
+        threshold: float,
+        options: Optional[List[str]] = None,
+    ) -> Optional[dict]:
+        """
+        Returns the answer of the most similar cached question of the same type, or None.
+        When options are given, the cached answer must be one of them; the returned
+        answer is spelled exactly as the matching option.
+        """
+        for score, item in self._similar.search(question, question_type, threshold):
+            answer = item["answer"]
+            if options is not None:
+                answer = next(
+                    (option for option in options
+                     if str(option).strip().lower() == str(answer).strip().lower()),
+                    None,
+                )
+                if answer is None:
+                    continue
+            logger.debug(f"Reusing answer of similar question '{item['question']}' (score {score:.2f})")
+            return {"type": item["type"], "question": item["question"], "answer": answer}
+        return None
+
+    def contains_question(self, question: str) -> bool:
+        return sanitize_question(question) in self._questions
+
+    def add(self, question_data: dict) -> bool:
+        """
+        Stores a new answer in memory and appends it to the JSON file.
+
+        Returns:
+            bool: False if the question was already cached (of any type), True otherwise
+        """
+        question_data["question"] = sanitize_question(question_data["question"])
+        with self._lock:
+            if question_data["question"] in self._questions:
+                logger.debug("Question already exists, skipping save")
+                return False
+            self._index(question_data)
+            self._append_to_file(question_data)
+        logger.debug("Question data saved successfully to JSON")
+        return True
+
+    def _append_to_file(self, item: dict) -> None:
+        # Same layout as json.dump(list, indent=4), so the file stays hand-editable
+        item_json = "\n".join(
+            "    " + line for line in json.dumps(item, indent=4).splitlines()
+        )
+        try:
+            with open(self.file_path, "r+b") as f:
+                end = f.seek(0, os.SEEK_END)
+                position, last_char = self._last_non_whitespace(f, end)
+                if last_char != b"]":
+                    raise ValueError("answers file does not end with a JSON array")
+                _, previous_char = self._last_non_whitespace(f, position)
+                separator = "\n" if previous_char == b"[" else ",\n"
+                f.seek(position)
+                f.write(f"{separator}{item_json}\n]".encode("utf-8"))
+                f.truncate()
+        except (FileNotFoundError, ValueError) as e:
+            logger.warning(f"Rewriting answers file {self.file_path}: {e}")
+            with open(self.file_path, "w") as f:
+                json.dump(self._items, f, indent=4)
+
+    @staticmethod
+    def _last_non_whitespace(f, end: int) -> Tuple[int, bytes]:
+        position = end
+        while position > 0:
+            position -= 1
+            f.seek(position)
+            char = f.read(1)
+            if not char.isspace():
+                return position, char
+        return 0, b""
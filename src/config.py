@@ -1,7 +1,7 @@
 # In this file, you can set the configurations of the app.
 import os
 from dotenv import load_dotenv
-from constants import BING, BRAVE, DEBUG, GOOGLE, INFO, TRACE
+from constants import BING, BRAVE, DEBUG, GOOGLE, INFO, OUTCOME_STORE_JSONL, TRACE
 
 load_dotenv()
 
@@ -31,10 +31,98 @@ BRAVE_API_KEY = os.getenv("BRAVE_API_KEY", None)
 ALLOWED_SEARCH_ENGINES = [GOOGLE]
 DEFAULT_SEARCH_ENGINE = GOOGLE
 
+# Pooled HTTP sessions used by the search engines: keep-alive connections per host,
+# (connect, read) timeouts, and retries with exponential backoff on 429/5xx
+HTTP_POOL_SIZE = 10
+HTTP_TIMEOUT_SECONDS = (5, 30)
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+# With several ALLOWED_SEARCH_ENGINES, search them together: each page is requested from the
+# SEARCH_FEDERATION_FAN_OUT fastest engines still under their daily quota and the results merged.
+# An engine slower than SEARCH_HEDGE_AFTER_SECONDS, or failing, is backed up by the next one.
+FEDERATED_SEARCH = False
+SEARCH_FEDERATION_FAN_OUT = 2
+SEARCH_HEDGE_AFTER_SECONDS = 3
+SEARCH_ENGINE_DAILY_QUOTAS = {GOOGLE: 100, BING: 1000, BRAVE: 2000}
+SEARCH_QUOTA_FILE = "cache/search_quota.json"
+# Search result pages, keyed by engine, query, params and offset, set to None to disable.
+# Pages expire according to the date range searched (SearchTimeRange value, None when unrestricted);
+# with SEARCH_CACHE_ONLY no search request is sent and uncached pages come back empty (offline reruns)
+SEARCH_CACHE_FILE = "cache/search_results.db"
+SEARCH_CACHE_MAX_ENTRIES = 5000
+SEARCH_CACHE_TTL_SECONDS = {
+    "last_24_hours": 60 * 60,
+    "last_week": 6 * 60 * 60,
+    "last_month": 24 * 60 * 60,
+    None: 24 * 60 * 60,
+}
+SEARCH_CACHE_ONLY = False
+# Stop paging through a query after this many consecutive pages without a new, non-blacklisted job
+SEARCH_MAX_UNPRODUCTIVE_PAGES = 2
+# Search several positions at once with OR groups, e.g. ((data engineer) OR (analytics engineer)),
+# within the engine's query length; jobs are attributed back to a position by title
+SEARCH_BATCH_POSITIONS = False
+SEARCH_MAX_POSITIONS_PER_QUERY = 5
+# Requests per second allowed per search engine, shared by all search threads (None for no limit)
+SEARCH_ENGINE_RATE_LIMITS = {GOOGLE: 5, BING: 3, BRAVE: 1}
+
+# Run every position x location search concurrently before applying, instead of page by page
+DISCOVER_JOBS_UP_FRONT = False
+DISCOVERY_MAX_WORKERS = 8
+DISCOVERY_MAX_PAGES_PER_SEARCH = 10
+# Discovered jobs are screened and applied to in batches of this size
+DISCOVERY_APPLY_BATCH_SIZE = 20
+
 APPLY_ONCE_PER_COMPANY = False
 CACHE = False
 
 ANSWERS_CACHE_FILE = "answers.json"
+# Reuse the cached answer of a similarly worded question (cosine similarity, 0..1) instead of asking the LLM, set to None to disable
+ANSWER_SIMILARITY_THRESHOLD = 0.85
+# Pick the resume section and answer a free-text question in one LLM call. Off by default: the
+# combined prompt lacks the per-section answer guidance and cover letters still take a second call
+LLM_COMBINED_SECTION_ANSWER = False
+
+# Job description summaries, keyed by a hash of the summarize prompt and the description, set to None to disable
+SUMMARY_CACHE_FILE = "cache/job_summaries.db"
+SUMMARY_CACHE_MAX_ENTRIES = 5000
+
+# Opt-in local cache of LLM replies for the deterministic classification prompts
+# (question section, resume or cover letter, work preferences match), set a path to enable
+LLM_RESPONSE_CACHE_FILE = None
+LLM_RESPONSE_CACHE_MAX_ENTRIES = 10000
+LLM_RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# Upper bound on jobs screened concurrently against the LLM gateway
+LLM_MAX_CONCURRENT_REQUESTS = 8
+
+# Only count keywords_whitelist matches on whole words ("java" then doesn't match "javascript")
+KEYWORDS_WHITELIST_WHOLE_WORDS = False
+
+# Fast mode drops the human-like random pauses around browser actions, which then only wait
+# for readiness: page settled (document loaded, no new network requests for WAIT_NETWORK_IDLE_SECONDS),
+# element clickable, upload accepted. HUMAN_JITTER forces the pauses on or off, None follows FAST_MODE
+FAST_MODE = False
+HUMAN_JITTER = None
+WAIT_TIMEOUT_SECONDS = 15
+WAIT_POLL_SECONDS = 0.1
+WAIT_NETWORK_IDLE_SECONDS = 0.5
+
+# Browsers applying to the screened jobs at once, each one on its own Chrome profile
+# (chrome_profile_worker_N next to chrome_profile) with its own portal pages and applier
+APPLICATION_WORKERS = 1
+
+# Classify and parse the questions of each application form section from a single script call
+# instead of probing every question with WebDriver lookups, on portals that support it
+FORM_SNAPSHOT_PARSING = False
+# Parse those questions from driver.page_source with lxml rather than with a script run in the page
+FORM_SNAPSHOT_FROM_PAGE_SOURCE = False
+
+# Fetch and score every job of a search page over HTTP before opening any of them in the browser
+SCREEN_JOBS_BEFORE_APPLYING = False
+SCREENING_FETCH_WORKERS = 8
+
+# Backend used to record job outcomes (success, failed, skipped) in the output folder: jsonl or sqlite
+OUTCOME_STORE_BACKEND = OUTCOME_STORE_JSONL
 
 
 def validate_config():
@@ -12,6 +12,10 @@ LEVER = "lever"
 GOOGLE = "google"
 BING = "bing"
 BRAVE = "brave"
+FEDERATED = "federated"
+
+OUTCOME_STORE_JSONL = "jsonl"
+OUTCOME_STORE_SQLITE = "sqlite"
 
 SECRETS_YAML = "secrets.yaml"
 WORK_PREFERENCES_YAML = "work_preferences.yaml"
@@ -80,6 +84,16 @@ LANGUAGES = "languages"
 INTERESTS = "interests"
 COVER_LETTER = "cover_letter"
 
+# Keys of the precompiled LLM chains in AiAnswerer
+SUMMARIZE_CHAIN = "summarize"
+DETERMINE_SECTION_CHAIN = "determine_section"
+SECTION_AND_ANSWER_CHAIN = "section_and_answer"
+NUMERIC_QUESTION_CHAIN = "numeric_question"
+OPTIONS_QUESTION_CHAIN = "options_question"
+RESUME_OR_COVER_CHAIN = "resume_or_cover"
+WORK_PREFERENCES_MATCH_CHAIN = "work_preferences_match"
+JOB_SUITABILITY_CHAIN = "job_suitability"
+
 LLM_MODEL_TYPE = "llm_model_type"
 LLM_API_URL = "llm_api_url"
 LLM_MODEL = "llm_model"
@@ -0,0 +1,54 @@
+import threading
+from typing import Callable, Dict
+
+from selenium import webdriver
+
+from logger import logger
+
+
+class DriverPool:
+    """
+    Browsers of the application workers, each one on its own Chrome profile
+    (see chrome_utils.worker_profile_path). Worker 0 is the browser the bot
+    was started with, the others are started by `driver_factory` on first use
+    and quit with the pool.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        driver_factory: Callable[[int], webdriver.Chrome],
+        main_driver: webdriver.Chrome,
+    ):
+        if size < 1:
+            raise ValueError("Driver pool size must be at least 1")
+        self.size = size
+        self.driver_factory = driver_factory
+        self._drivers: Dict[int, webdriver.Chrome] = {0: main_driver}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def get(self, worker_index: int) -> webdriver.Chrome:
+        if not 0 <= worker_index < self.size:
+            raise IndexError(f"No worker {worker_index} in a pool of {self.size}")
+        with self._lock:
+            driver = self._drivers.get(worker_index)
+            if driver is None:
+                logger.info(f"Starting browser for application worker {worker_index}")
+                driver = self.driver_factory(worker_index)
+                self._drivers[worker_index] = driver
+            return driver
+
+    def quit(self) -> None:
+        """Quits the browsers started by the pool, the main one is left to its owner."""
+        with self._lock:
+            for worker_index, driver in list(self._drivers.items()):
+                if worker_index == 0:
+                    continue
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning(f"Failed to quit browser of application worker {worker_index}: {e}")
+                del self._drivers[worker_index]
@@ -33,6 +33,10 @@ class Job:
     categories: dict = field(default_factory=dict)
     # Todo: this will move to enum
     job_state: str = ""
+    # Searched position the job was attributed to
+    position: str = ""
+    # Keywords of the whitelist found in the description
+    matched_keywords: list = field(default_factory=list)
     description: str = ""
     summarize_job_description: str = ""
     recruiter_link: str = ""
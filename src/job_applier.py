@@ -8,6 +8,7 @@ import random
 import re
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Any, Tuple
 
 from httpx import HTTPStatusError
@@ -21,33 +22,34 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
-from config import ANSWERS_CACHE_FILE, CACHE
+from answer_cache import AnswerCache
+from config import (
+    ANSWER_SIMILARITY_THRESHOLD,
+    ANSWERS_CACHE_FILE,
+    CACHE,
+    FORM_SNAPSHOT_PARSING,
+    KEYWORDS_WHITELIST_WHOLE_WORDS,
+    SCREENING_FETCH_WORKERS,
+)
 from custom_exception import JobNotSuitableException, JobSkipException
 from jobContext import JobContext
 from job_application import JobApplication
 from job_application_saver import ApplicationSaver
 import job_application_saver
-from job_portals.application_form_elements import SelectQuestion, TextBoxQuestionType
+from job_portals.application_form_elements import (
+    FormField,
+    FormFieldKind,
+    SelectQuestion,
+    TextBoxQuestion,
+    TextBoxQuestionType,
+)
 from job_portals.base_job_portal import BaseJobPage, BaseJobPortal
 
 
 from job import Job, JobState
-from llm.ai_answerer import AiAnswerer
-from utils import browser_utils, time_utils
-
-
-def question_already_exists_in_data(question: str, data: List[dict]) -> bool:
-    """
-    Check if a question already exists in the data list.
-
-    Args:
-        question: The question text to search for
-        data: List of question dictionaries to search through
-
-    Returns:
-        bool: True if question exists, False otherwise
-    """
-    return any(item["question"] == question for item in data)
+from llm.ai_answerer import AiAnswerer, JobScreening
+from utils import browser_utils, time_utils, wait_utils
+from utils.aho_corasick import AhoCorasick
 
 
 class AIHawkJobApplier:
@@ -59,6 +61,7 @@ class AIHawkJobApplier:
         gpt_answerer: AiAnswerer,
         work_preferences: dict,
         resume_generator_manager,
+        answers_cache: Optional[AnswerCache] = None,
     ):
         logger.debug("Initializing AIHawkEasyApplier")
         if resume_dir is None or not os.path.exists(resume_dir):
@@ -70,38 +73,17 @@ class AIHawkJobApplier:
         self.set_old_answers = set_old_answers
         self.gpt_answerer = gpt_answerer
         self.resume_generator_manager = resume_generator_manager
-        self.answers_cache = self._load_answers_from_json()
+        # Shared by the application workers, one instance per answers file
+        self.answers_cache = answers_cache or AnswerCache(ANSWERS_CACHE_FILE)
         self.current_job : Job | None = None
         self.work_preferences = work_preferences
+        # Links whose details could not be fetched over HTTP, scraped in the browser without retrying
+        self.unfetched_job_links = set()
         self.keywords_whitelist = work_preferences.get("keywords_whitelist", [])
+        # Built once, every description is then scanned for all the keywords in one pass
+        self.keywords_matcher = AhoCorasick(self.keywords_whitelist or [], KEYWORDS_WHITELIST_WHOLE_WORDS)
         logger.debug("AIHawkEasyApplier initialized successfully")
 
-    def _load_answers_from_json(self) -> List[dict]:
-        output_file = ANSWERS_CACHE_FILE
-        logger.debug(f"Loading questions from JSON file: {output_file}")
-        try:
-            with open(output_file, "r") as f:
-                try:
-                    data = json.load(f)
-                    if not isinstance(data, list):
-                        raise ValueError(
-                            "JSON file format is incorrect. Expected a list of questions."
-                        )
-                except json.JSONDecodeError:
-                    logger.error("JSON decoding failed")
-                    data = []
-            logger.debug("Questions loaded successfully from JSON")
-            return data
-        except FileNotFoundError:
-            logger.warning("JSON file not found, returning empty list")
-            return []
-        except Exception:
-            tb_str = traceback.format_exc()
-            logger.error(f"Error loading questions data from JSON file: {tb_str}")
-            raise Exception(
-                f"Error loading questions data from JSON file: \nTraceback:\n{tb_str}"
-            )
-
     def apply_to_job(self, job: Job) -> None:
         """
         Starts the process of applying to a job.
@@ -116,8 +98,47 @@ class AIHawkJobApplier:
             logger.error(f"Failed to apply to job: {job.title}, error: {str(e)}")
             raise e
 
-    def job_apply(self, job: Job):
+    def screen_jobs(self, jobs: List[Job]) -> Tuple[List[Tuple[Job, Optional[JobScreening]]], List[Tuple[Job, str]]]:
+        """
+        Screens a whole search page before any of it is opened in the browser: job details are
+        fetched over HTTP in parallel and every fetched job is scored in one concurrent LLM pass.
+
+        Returns:
+            Tuple of the jobs to apply to, with their screening (None when the details could not
+            be fetched, job_apply then scrapes them in the browser), and the rejected jobs with the reason.
+        """
+        with ThreadPoolExecutor(max_workers=SCREENING_FETCH_WORKERS) as executor:
+            fetched = list(executor.map(self.job_page.fetch_job_details, jobs))
+
+        to_apply = [(job, None) for job, ok in zip(jobs, fetched) if not ok]
+        self.unfetched_job_links.update(job.link for job, _ in to_apply)
+        rejected = []
+        to_screen = []
+        for job in (job for job, ok in zip(jobs, fetched) if ok):
+            keywords_whitelist_check, reason = self._check_keywords_whitelist(job)
+            if keywords_whitelist_check:
+                to_screen.append(job)
+            else:
+                rejected.append((job, f"Keywords whitelist didn't pass: {reason}"))
+
+        if to_screen:
+            screenings = self.gpt_answerer.screen_jobs(to_screen, self.work_preferences)
+            for job, screening in zip(to_screen, screenings):
+                if not screening.work_preferences_match:
+                    rejected.append((job, f"Work preferences didn't match, job: {job.title} at {job.company}"))
+                elif not screening.is_suitable:
+                    rejected.append((job, f"Job is not suitable, got score {screening.score}, reasoning: {screening.reasoning}"))
+                else:
+                    to_apply.append((job, screening))
+
+        logger.info(f"Screened {len(jobs)} jobs: {len(to_apply)} to apply, {len(rejected)} rejected")
+        return to_apply, rejected
 
+    def job_apply(self, job: Job, screening: Optional[JobScreening] = None):
+        """
+        Applies to the job in the browser. A job already screened by screen_jobs
+        keeps its fetched details and skips the suitability checks.
+        """
         self.job_page.goto_job_page(job)
 
         if job.job_state in {JobState.APPLIED.value, JobState.CONTINUE.value}:
@@ -131,37 +152,14 @@ class AIHawkJobApplier:
 
         try:
 
-            job_description = self.job_page.get_job_description(job)
-            logger.debug(f"Job description set: {job_description[:100]}")
-            job.set_job_description(job_description)
-
-            recruiter_link = self.job_page.get_recruiter_link()
-            job.set_recruiter_link(recruiter_link)
-
-            job.location = self.job_page.get_location()
-            job.categories = self.job_page.get_job_categories()
-
-            self.current_job = job
-
-            logger.debug("Passing job information to GPT Answerer")
-            self.gpt_answerer.set_job(job)
-
-            keywords_whitelist_check, _  = self._check_keywords_whitelist(job)
-
-            if not self.gpt_answerer.is_work_preferences_match(job, self.work_preferences):
-                logger.debug(f"Work preferences didn't match for {job.title} at {job.company}")
-                raise JobNotSuitableException(f"Work preferences didn't match, job: {job.title} at {job.company }")
-            
-            if not keywords_whitelist_check:
-                logger.debug(f"Job description keywords not found for {job.title} at {job.company}")
-                raise JobNotSuitableException(f"Keywords whitelist didn't pass, keywords:{self.keywords_whitelist} Job Description {job.description} ")
-
-            is_suitable, score, reasoning = self.gpt_answerer.is_job_suitable(self.work_preferences)
-
-            if not is_suitable:
-                raise JobNotSuitableException(f"Job is not suitable, got score {score}, reasoning: {reasoning}")
+            if screening is None:
+                self._screen_job(job)
+            else:
+                self.current_job = job
+                self.gpt_answerer.set_job(job, summarize=False)
 
             self.job_page.click_apply_button(job_context)
+            wait_utils.wait_for_page_settled(self.job_application_page.driver)
             time_utils.short_sleep()
 
             logger.debug("Filling out application form")
@@ -184,28 +182,62 @@ class AIHawkJobApplier:
 
             raise e
     
+    def _scrape_job_details(self, job: Job) -> None:
+        job_description = self.job_page.get_job_description(job)
+        logger.debug(f"Job description set: {job_description[:100]}")
+        job.set_job_description(job_description)
+
+        recruiter_link = self.job_page.get_recruiter_link()
+        job.set_recruiter_link(recruiter_link)
+
+        job.location = self.job_page.get_location()
+        job.categories = self.job_page.get_job_categories()
+
+    def _screen_job(self, job: Job) -> None:
+        """
+        Screens a job that screen_jobs didn't, with its details fetched over HTTP
+        when possible and scraped from the opened job page otherwise.
+        """
+        if job.link in self.unfetched_job_links or not self.job_page.fetch_job_details(job):
+            logger.debug(f"Scraping job details in the browser: {job.link}")
+            self._scrape_job_details(job)
+
+        self.current_job = job
+
+        keywords_whitelist_check, _  = self._check_keywords_whitelist(job)
+
+        if not keywords_whitelist_check:
+            logger.debug(f"Job description keywords not found for {job.title} at {job.company}")
+            raise JobNotSuitableException(f"Keywords whitelist didn't pass, keywords:{self.keywords_whitelist} Job Description {job.description} ")
+
+        logger.debug("Passing job information to GPT Answerer")
+        screening = self.gpt_answerer.screen_job(job, self.work_preferences)
+
+        if not screening.work_preferences_match:
+            logger.debug(f"Work preferences didn't match for {job.title} at {job.company}")
+            raise JobNotSuitableException(f"Work preferences didn't match, job: {job.title} at {job.company }")
+
+        if not screening.is_suitable:
+            raise JobNotSuitableException(f"Job is not suitable, got score {screening.score}, reasoning: {screening.reasoning}")
+
     def _check_keywords_whitelist(self, job : Job) -> Tuple[bool, Optional[str]]:
         """
         Check if job description contains any of the specified keywords.
+        The keywords found are recorded in job.matched_keywords.
         
         Returns:
             bool: True if any keyword is found in description, False otherwise
         """
         logger.debug(f"Checking job description for keywords: {self.keywords_whitelist}")
         try:
-            
-            # Get the full description text
-            description_text = job.description.lower()
-
-            if self.keywords_whitelist == []:
+            if not self.keywords_matcher:
                 logger.debug("No keywords specified for job description check")
                 return True, None
             
-            # Check if any keyword exists in the description
-            for keyword in self.keywords_whitelist:
-                if keyword.lower() in description_text:
-                    logger.debug(f"Found keyword '{keyword}' in job description")
-                    return True, None
+            job.matched_keywords = self.keywords_matcher.find_all(job.description)
+            if job.matched_keywords:
+                logger.debug(f"Found keywords {job.matched_keywords} in job description")
+                return True, None
                     
             logger.debug("No matching keywords found in job description")
             return False, "No matching keywords found in job description"
@@ -226,6 +258,7 @@ class AIHawkJobApplier:
             if self.job_application_page.has_next_button():
                 self.job_application_page.click_next_button()
                 self.job_application_page.handle_errors()
+                wait_utils.wait_for_page_settled(self.job_application_page.driver)
                 time_utils.short_sleep()
 
             elif self.job_application_page.has_submit_button():
@@ -264,11 +297,15 @@ class AIHawkJobApplier:
             raise e
 
     def _handle_upload_fields(
-        self, element: WebElement, job_context: JobContext
+        self, element: WebElement, job_context: JobContext, heading: Optional[str] = None
     ) -> None:
         logger.debug("Handling upload field")
 
-        file_upload_element_heading = self.job_application_page.get_upload_element_heading(element)
+        file_upload_element_heading = (
+            heading
+            if heading is not None
+            else self.job_application_page.get_upload_element_heading(element)
+        )
 
         logger.debug(f"File upload element heading: {file_upload_element_heading}")
 
@@ -397,7 +434,7 @@ class AIHawkJobApplier:
                 "question": "Resume",
                 "answer": os.path.abspath(file_path_pdf)
             })
-            time.sleep(2)
+            wait_utils.wait_for_upload(self.job_application_page.driver, element)
             logger.debug(f"Resume created and uploaded successfully: {file_path_pdf}")
         except Exception as e:
             tb_str = traceback.format_exc()
@@ -523,7 +560,7 @@ class AIHawkJobApplier:
                 "question": "Cover Letter",
                 "answer": os.path.abspath(file_path_pdf)
             })
-            time.sleep(2)
+            wait_utils.wait_for_upload(self.job_application_page.driver, element)
             logger.debug(
                 f"Cover letter created and uploaded successfully: {file_path_pdf}"
             )
@@ -534,6 +571,19 @@ class AIHawkJobApplier:
 
     def _process_form_section(self, job_context: JobContext, form_section: WebElement) -> None:
         logger.debug("Filling additional questions")
+        form_fields = None
+        if FORM_SNAPSHOT_PARSING:
+            # The whole section is read at once, so the page is checked once rather than per field
+            browser_utils.handle_security_checks()
+            self.job_application_page.wait_until_ready()
+            form_fields = self.job_application_page.snapshot_form_fields(form_section)
+        if form_fields is not None:
+            for form_field in form_fields:
+                logger.debug(f"Processing {form_field.kind.value} form field with text: {form_field.text}")
+                job_context.job_application.add_question_to_form(form_field.text)
+                self._process_form_field(job_context, form_field)
+            return
+
         form_elements = self.job_application_page.get_input_elements(form_section=form_section)
         for form_element in form_elements:
             logger.debug(f"Processing form element with text: {form_element.text}")
@@ -587,6 +637,35 @@ class AIHawkJobApplier:
         
         logger.warning("No matching form element found")            
 
+    def _process_form_field(self, job_context: JobContext, form_field: FormField) -> None:
+        """
+        Same as _process_form_element for a field already classified and parsed from a form snapshot,
+        the browser is only touched to fill it in
+        """
+
+        logger.debug("Processing form section")
+
+        time_utils.tiny_sleep()
+
+        element = form_field.element
+
+        if form_field.kind is FormFieldKind.UPLOAD:
+            self._handle_upload_fields(element, job_context, heading=form_field.label)
+        elif form_field.kind is FormFieldKind.TERMS_OF_SERVICE:
+            self.job_application_page.accept_terms_of_service(element)
+            logger.debug("Handled terms of service")
+        elif form_field.kind is FormFieldKind.RADIO:
+            self._handle_radio_question(job_context, form_field.question, element)
+            logger.debug("Handled radio button")
+        elif form_field.kind is FormFieldKind.TEXTBOX:
+            self._handle_textbox_question(job_context, element, form_field.question)
+            logger.debug("Handled textbox question")
+        elif form_field.kind is FormFieldKind.DROPDOWN:
+            self._handle_dropdown_question(job_context, element, form_field.question)
+            logger.debug("Handled dropdown question")
+        else:
+            logger.warning("No matching form element found")
+
     #TODO: Enhance this method to handle multi-select questions
     def _handle_radio_question(
         self,
@@ -599,7 +678,7 @@ class AIHawkJobApplier:
         question_text = radio_question.question
         options = radio_question.options
 
-        existing_answer = self._find_existing_answer(question_text, "radio")
+        existing_answer = self._find_existing_answer(question_text, "radio", options)
 
         if existing_answer:
             self.job_application_page.select_radio_option(
@@ -613,7 +692,6 @@ class AIHawkJobApplier:
         self._save_answer_to_json(
             {"type": "radio", "question": question_text, "answer": answer}
         )
-        self.answers_cache = self._load_answers_from_json()
         job_application.save_application_data(
             {"type": "radio", "question": question_text, "answer": answer}
         )
@@ -622,12 +700,16 @@ class AIHawkJobApplier:
         return
 
     def _handle_textbox_question(
-        self, job_context: JobContext, element: WebElement
+        self,
+        job_context: JobContext,
+        element: WebElement,
+        textbox_question: Optional[TextBoxQuestion] = None,
     ) -> None:
 
-        textbox_question = self.job_application_page.web_element_to_textbox_question(
-            element
-        )
+        if textbox_question is None:
+            textbox_question = self.job_application_page.web_element_to_textbox_question(
+                element
+            )
 
         question_text = textbox_question.question
         question_type = textbox_question.type.value
@@ -655,7 +737,6 @@ class AIHawkJobApplier:
             self._save_answer_to_json(
                 {"type": question_type, "question": question_text, "answer": answer}
             )
-            self.answers_cache = self._load_answers_from_json()
             logger.debug("Saved non-cover letter answer to JSON.")
 
         self.job_application_page.fill_textbox_question(element, answer)
@@ -668,16 +749,20 @@ class AIHawkJobApplier:
         return
 
     def _handle_dropdown_question(
-        self, job_context: JobContext, section: WebElement
+        self,
+        job_context: JobContext,
+        section: WebElement,
+        dropdown: Optional[SelectQuestion] = None,
     ) -> None:
         job_application = job_context.job_application
 
-        dropdown = self.job_application_page.web_element_to_dropdown_question(section)
+        if dropdown is None:
+            dropdown = self.job_application_page.web_element_to_dropdown_question(section)
 
         question_text = dropdown.question
         options = dropdown.options
 
-        existing_answer = self._find_existing_answer(question_text, "dropdown")
+        existing_answer = self._find_existing_answer(question_text, "dropdown", options)
 
         if existing_answer:
             answer = existing_answer["answer"]
@@ -698,7 +783,6 @@ class AIHawkJobApplier:
                     "answer": answer,
                 }
             )
-            self.answers_cache = self._load_answers_from_json()
 
         job_application.save_application_data(
             {
@@ -715,40 +799,12 @@ class AIHawkJobApplier:
         self._save_answer_to_json(answer_data)
 
     def _save_answer_to_json(self, question_data: dict) -> None:
-        output_file = ANSWERS_CACHE_FILE
-        question_data["question"] = self._sanitize_text(question_data["question"])
-
         logger.debug(f"Checking if question data already exists: {question_data}")
+        if self.answer_contians_company_name(question_data["answer"]):
+            logger.debug("Answer contains the company name, skipping save")
+            return
         try:
-            with open(output_file, "r+") as f:
-                try:
-                    data = json.load(f)
-                    if not isinstance(data, list):
-                        raise ValueError(
-                            "JSON file format is incorrect. Expected a list of questions."
-                        )
-                except json.JSONDecodeError:
-                    logger.error("JSON decoding failed")
-                    data = []
-
-                should_be_saved: bool = not question_already_exists_in_data(
-                    question_data["question"], data
-                ) and not self.answer_contians_company_name(question_data["answer"])
-
-                if should_be_saved:
-                    logger.debug("New question found, appending to JSON")
-                    data.append(question_data)
-                    f.seek(0)
-                    json.dump(data, f, indent=4)
-                    f.truncate()
-                    logger.debug("Question data saved successfully to JSON")
-                else:
-                    logger.debug("Question already exists, skipping save")
-        except FileNotFoundError:
-            logger.warning("JSON file not found, creating new file")
-            with open(output_file, "w") as f:
-                json.dump([question_data], f, indent=4)
-            logger.debug("Question data saved successfully to new JSON file")
+            self.answers_cache.add(question_data)
         except Exception:
             tb_str = traceback.format_exc()
             logger.error(f"Error saving questions data to JSON file: {tb_str}")
@@ -756,30 +812,24 @@ class AIHawkJobApplier:
                 f"Error saving questions data to JSON file: \nTraceback:\n{tb_str}"
             )
 
-    def _sanitize_text(self, text: str) -> str:
-        sanitized_text = text.lower().strip().replace('"', "").replace("\\", "")
-        sanitized_text = (
-            re.sub(r"[\x00-\x1F\x7F]", "", sanitized_text)
-            .replace("\n", " ")
-            .replace("\r", "")
-            .rstrip(",")
-        )
-        logger.debug(f"Sanitized text: {sanitized_text}")
-        return sanitized_text
-
-    def _find_existing_answer(self, question_text: str, question_type: str) -> Optional[dict]:
+    def _find_existing_answer(
+        self, question_text: str, question_type: str, options: Optional[List[str]] = None
+    ) -> Optional[dict]:
         if not CACHE:
             logger.trace("Cache is disabled, not checking for existing answers")
             return None
 
-        current_question_sanitized = self._sanitize_text(question_text)
-        for item in self.answers_cache:
-            if (
-                current_question_sanitized == self._sanitize_text(item["question"])
-                and item["type"] == question_type
-            ):
-                return item
-        return None
+        existing_answer = self.answers_cache.get(question_text, question_type)
+        if existing_answer and (
+            options is None or existing_answer["answer"] in options
+        ):
+            return existing_answer
+
+        if ANSWER_SIMILARITY_THRESHOLD is None:
+            return None
+        return self.answers_cache.find_similar(
+            question_text, question_type, ANSWER_SIMILARITY_THRESHOLD, options
+        )
 
     def answer_contians_company_name(self, answer: Any) -> bool:
         return (
@@ -0,0 +1,75 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import config
+from job import Job
+from job_portals.base_job_portal import BaseJobsPage
+from logger import logger
+from utils.url_utils import canonical_job_link
+
+
+class JobDiscovery:
+    """
+    Runs the searches for every (position, location) pair concurrently on a bounded
+    thread pool and merges their pages into one deduplicated list of jobs.
+    Pages of one search are fetched in order, each one only once the previous page
+    returned results and the jobs page deems the next one worth requesting;
+    the engines' rate limiters pace the requests.
+    """
+
+    def __init__(
+        self,
+        jobs_page: BaseJobsPage,
+        max_workers: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ):
+        self.jobs_page = jobs_page
+        self.max_workers = max_workers or config.DISCOVERY_MAX_WORKERS
+        self.max_pages = max_pages or config.DISCOVERY_MAX_PAGES_PER_SEARCH
+
+    def discover(self, searches: Iterable[Tuple[str, str]]) -> List[Job]:
+        searches = list(searches)
+        pages: Dict[Tuple[int, int], list] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {
+                executor.submit(self.jobs_page.search_page, position, location, 0): (index, 0)
+                for index, (position, location) in enumerate(searches)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, page_number = pending.pop(future)
+                    position, location = searches[index]
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        logger.error(f"Search failed for {position} in {location}, page {page_number}: {e}")
+                        continue
+                    pages[(index, page_number)] = results
+                    if (
+                        results
+                        and page_number + 1 < self.max_pages
+                        and self.jobs_page.has_next_page(position, location)
+                    ):
+                        next_future = executor.submit(
+                            self.jobs_page.search_page, position, location, page_number + 1
+                        )
+                        pending[next_future] = (index, page_number + 1)
+
+        jobs = self._merge(pages)
+        logger.info(f"Discovered {len(jobs)} unique jobs from {len(searches)} searches and {len(pages)} pages")
+        return jobs
+
+    def _merge(self, pages: Dict[Tuple[int, int], list]) -> List[Job]:
+        # Sorting by (search, page) keeps the result independent of completion order
+        jobs: Dict[str, Job] = {}
+        for key in sorted(pages):
+            for job_tile in pages[key]:
+                try:
+                    job = self.jobs_page.job_tile_to_job(job_tile)
+                except Exception as e:
+                    logger.warning(f"Failed to convert search result to job: {job_tile}, error: {e}")
+                    continue
+                jobs.setdefault(canonical_job_link(job.link), job)
+        return list(jobs.values())
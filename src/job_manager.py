@@ -1,12 +1,13 @@
-import json
 import os
 import random
-import re
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from itertools import product
 from pathlib import Path
+from queue import Empty, Queue
+from typing import Callable, Dict, Optional
 
 from inputimeout import inputimeout, TimeoutOccurred
 from selenium.common.exceptions import TimeoutException
@@ -15,14 +16,16 @@ from selenium.webdriver.support import expected_conditions as EC
 import config
 from constants import WORK_PREFERENCES
 from custom_exception import JobNotSuitableException
+from driver_pool import DriverPool
 from job import Job
 from job_applier import AIHawkJobApplier
+from job_discovery import JobDiscovery
 from job_application_profile import WorkPreferences
 from job_portals.base_job_portal import BaseJobPortal
 from logger import logger
-from regex_utils import look_ahead_patterns
+from outcome_store import OutcomeIndex, OutcomeStore, create_outcome_store, migrate_legacy_json_logs
+from regex_utils import BlacklistMatcher
 import utils.browser_utils as browser_utils
-import utils.time_utils
 
 
 class EnvironmentKeys:
@@ -55,6 +58,15 @@ class AIHawkJobManager:
         self.job_portal = job_portal
         self.set_old_answers = set()
         self.easy_applier_component = None
+        self.outcome_store: OutcomeStore | None = None
+        self.outcome_index = OutcomeIndex()
+        self.blacklist_matcher = BlacklistMatcher()
+        self.driver_pool: Optional[DriverPool] = None
+        self.job_portal_factory: Optional[Callable[..., BaseJobPortal]] = None
+        self._worker_appliers: Dict[int, AIHawkJobApplier] = {}
+        self._apply_lock = threading.Lock()
+        # Companies being applied to by a worker, for APPLY_ONCE_PER_COMPANY
+        self._companies_in_progress = set()
         logger.info("AIHawkJobManager initialized successfully")
 
     def set_parameters(self, parameters):
@@ -67,7 +79,6 @@ class AIHawkJobManager:
         )
         self.positions = self.workPreferences.get("positions", [])
         self.locations = self.workPreferences.get("locations", [])
-        self.seen_jobs = []
         self.keywords_whitelist = (
             self.workPreferences.get("keywords_whitelist", []) or []
         )
@@ -75,16 +86,20 @@ class AIHawkJobManager:
         self.min_applicants = config.JOB_MIN_APPLICATIONS
         self.max_applicants = config.JOB_MAX_APPLICATIONS
 
-        # Generate regex patterns from blacklist lists
-        self.title_blacklist_patterns = look_ahead_patterns(self.title_blacklist)
-        self.company_blacklist_patterns = look_ahead_patterns(self.company_blacklist)
-        self.location_blacklist_patterns = look_ahead_patterns(self.location_blacklist)
+        # Compile the blacklists once, every search result is checked against them
+        self.blacklist_matcher = BlacklistMatcher(
+            self.title_blacklist, self.company_blacklist, self.location_blacklist
+        )
 
         resume_path = parameters.get("uploads", {}).get("resume", None)
         self.resume_path = (
             Path(resume_path) if resume_path and Path(resume_path).exists() else None
         )
         self.output_file_directory = Path(parameters["outputFileDirectory"])
+        self.outcome_store = create_outcome_store(self.output_file_directory)
+        migrate_legacy_json_logs(self.outcome_store, self.output_file_directory)
+        self.outcome_index = self.outcome_store.index
+        self.job_portal.jobs_page.set_job_filter(self.is_new_job)
         self.env_config = EnvironmentKeys()
         logger.info("Parameters set successfully")
 
@@ -96,32 +111,37 @@ class AIHawkJobManager:
         logger.info("Setting resume generator manager")
         self.resume_generator_manager = resume_generator_manager
 
+    def set_driver_pool(self, driver_pool: DriverPool, job_portal_factory: Callable[..., BaseJobPortal]):
+        """Applies with every browser of the pool, job_portal_factory builds a worker's portal from its driver."""
+        logger.info(f"Setting driver pool of {len(driver_pool)} browsers")
+        self.driver_pool = driver_pool
+        self.job_portal_factory = job_portal_factory
+
     def start_collecting_data(self):
-        searches = list(product(self.positions, self.locations))
+        searches = self.job_portal.jobs_page.plan_searches(self.positions, self.locations)
         random.shuffle(searches)
+
+        if config.DISCOVER_JOBS_UP_FRONT:
+            self.read_jobs(JobDiscovery(self.job_portal.jobs_page).discover(searches))
+            return
+
         page_sleep = 0
         minimum_time = 60 * 5
         minimum_page_time = time.time() + minimum_time
 
         for position, location in searches:
             location_url = "&location=" + location
-            job_page_number = -1
             logger.info(
                 f"Collecting data for {position} in {location}.", color="yellow"
             )
             try:
-                while True:
+                pages = self.job_portal.jobs_page.iter_job_pages(position, location_url)
+                for job_page_number, jobs in enumerate(pages):
                     page_sleep += 1
-                    job_page_number += 1
-                    logger.info(f"Going to job page {job_page_number}", color="yellow")
-                    self.job_portal.jobs_page.next_job_page(
-                        position, location_url, job_page_number
-                    )
-                    utils.time_utils.medium_sleep()
                     logger.info(
-                        "Starting the collecting process for this page", color="yellow"
+                        f"Starting the collecting process for job page {job_page_number}", color="yellow"
                     )
-                    self.read_jobs()
+                    self.read_jobs(jobs)
                     logger.info(
                         "Collecting data on this page has been completed!",
                         color="yellow",
@@ -164,40 +184,29 @@ class AIHawkJobManager:
             self.workPreferences,
             self.resume_generator_manager,
         )
-        searches = list(product(self.positions, self.locations))
+        searches = self.job_portal.jobs_page.plan_searches(self.positions, self.locations)
         random.shuffle(searches)
+
+        if config.DISCOVER_JOBS_UP_FRONT:
+            self.apply_discovered_jobs(searches)
+            return
+
         page_sleep = 0
         minimum_time = config.MINIMUM_WAIT_TIME_IN_SECONDS
         minimum_page_time = time.time() + minimum_time
 
         for position, location in searches:
-            job_page_number = -1
             logger.info(f"Starting the search for {position} in {location}.")
 
             try:
-                while True:
+                # The next page is searched for while this one is being applied to
+                pages = self.job_portal.jobs_page.iter_job_pages(position, location)
+                for job_page_number, jobs in enumerate(pages):
                     page_sleep += 1
-                    job_page_number += 1
-                    logger.info(f"Going to job page {job_page_number}")
-                    self.job_portal.jobs_page.next_job_page(
-                        position, location, job_page_number
-                    )
-                    utils.time_utils.medium_sleep()
-                    logger.info("Starting the application process for this page...")
-
-                    try:
-                        jobs = self.job_portal.jobs_page.get_jobs_from_page(scroll=True)
-                        if not jobs:
-                            logger.info(
-                                "No more jobs found on this page. Exiting loop."
-                            )
-                            break
-                    except Exception as e:
-                        logger.error(f"Failed to retrieve jobs: {e}")
-                        break
+                    logger.info(f"Starting the application process for job page {job_page_number}...")
 
                     try:
-                        self.apply_jobs()
+                        self.apply_jobs(jobs)
                     except Exception as e:
                         logger.error(
                             f"Error during job application: {e} {traceback.format_exc()}"
@@ -298,13 +307,38 @@ class AIHawkJobManager:
                     time.sleep(sleep_time)
                 page_sleep += 1
 
-    def read_jobs(self):
+    def apply_discovered_jobs(self, searches):
+        """
+        Discovers the jobs of all the searches concurrently, then applies to them
+        in batches of DISCOVERY_APPLY_BATCH_SIZE, each taking at least MINIMUM_WAIT_TIME_IN_SECONDS.
+        """
+        jobs = JobDiscovery(self.job_portal.jobs_page).discover(searches)
+        batch_size = config.DISCOVERY_APPLY_BATCH_SIZE
+
+        for start in range(0, len(jobs), batch_size):
+            minimum_batch_time = time.time() + config.MINIMUM_WAIT_TIME_IN_SECONDS
+            logger.info(f"Applying to discovered jobs {start + 1}-{min(start + batch_size, len(jobs))} of {len(jobs)}")
+            try:
+                self.apply_jobs(jobs[start : start + batch_size])
+            except Exception as e:
+                logger.error(f"Error during job application: {e} {traceback.format_exc()}")
 
+            time_left = minimum_batch_time - time.time()
+            if time_left > 0:
+                logger.info(f"Sleeping for {time_left} seconds.")
+                time.sleep(time_left)
+
+    def _jobs_from_page(self):
         job_element_list = self.job_portal.jobs_page.get_jobs_from_page()
-        job_list = [
+        return [
             self.job_portal.jobs_page.job_tile_to_job(job_element)
             for job_element in job_element_list
         ]
+
+    def read_jobs(self, job_list=None):
+        """Records the given jobs, or the current search page's, as collected data."""
+        if job_list is None:
+            job_list = self._jobs_from_page()
         for job in job_list:
             if self.is_blacklisted(job.title, job.company, job.link, job.location):
                 logger.info(
@@ -318,13 +352,11 @@ class AIHawkJobManager:
                 self.write_to_file(job, "failed")
                 continue
 
-    def apply_jobs(self):
-        job_element_list = self.job_portal.jobs_page.get_jobs_from_page()
-
-        job_list = [
-            self.job_portal.jobs_page.job_tile_to_job(job_element)
-            for job_element in job_element_list
-        ]
+    def apply_jobs(self, job_list=None):
+        """Applies to the given jobs, or to the current search page's."""
+        if job_list is None:
+            job_list = self._jobs_from_page()
+        candidates = []
 
         for job in job_list:
 
@@ -394,96 +426,168 @@ class AIHawkJobManager:
                 self.write_to_file(job, "skipped", "Job blacklisted")
                 continue
             if self.is_already_applied_to_job(job.title, job.company, job.link):
-                self.write_to_file(job, "skipped", "Already applied to this job")
+                # Recorded when it was first handled, don't record it again
                 continue
             if self.is_already_applied_to_company(job.company):
                 self.write_to_file(job, "skipped", "Already applied to this company")
                 continue
 
-            try:
-                self.easy_applier_component.job_apply(job)
-                self.write_to_file(job, "success")
-                logger.info(f"Applied to job: {job.title} at {job.company}")
+            candidates.append(job)
+
+        self.apply_screened_jobs(self.screen_jobs(candidates))
+
+    def apply_screened_jobs(self, screened_jobs):
+        """
+        Applies to the (job, screening) pairs, with one worker per browser of the
+        driver pool pulling from a shared queue, or in order without a pool.
+        """
+        worker_count = min(len(self.driver_pool) if self.driver_pool else 1, len(screened_jobs))
+        if worker_count <= 1:
+            for job, screening in screened_jobs:
+                self._apply_job(self.easy_applier_component, job, screening)
+            return
+
+        queue = Queue()
+        for job, screening in screened_jobs:
+            queue.put((job, screening))
+
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            # Re-raises a worker's setup error, e.g. a browser that failed to start
+            list(executor.map(lambda index: self._run_application_worker(index, queue), range(worker_count)))
+
+    def _run_application_worker(self, worker_index: int, queue: Queue) -> None:
+        applier = self._worker_applier(worker_index)
+        with browser_utils.use_driver(self.driver_pool.get(worker_index)):
+            while True:
+                try:
+                    job, screening = queue.get_nowait()
+                except Empty:
+                    return
+                self._apply_job(applier, job, screening)
+
+    def _worker_applier(self, worker_index: int) -> AIHawkJobApplier:
+        if worker_index == 0:
+            return self.easy_applier_component
+        with self._apply_lock:
+            applier = self._worker_appliers.get(worker_index)
+        if applier is not None:
+            return applier
+
+        job_portal = self.job_portal_factory(self.driver_pool.get(worker_index))
+        job_portal.authenticator.start()
+        applier = AIHawkJobApplier(
+            job_portal,
+            self.resume_path,
+            self.set_old_answers,
+            self.gpt_answerer.worker_copy(),
+            self.workPreferences,
+            self.resume_generator_manager,
+            answers_cache=self.easy_applier_component.answers_cache,
+        )
+        # The links screen_jobs could not fetch are only known to the first applier
+        applier.unfetched_job_links = self.easy_applier_component.unfetched_job_links
+        with self._apply_lock:
+            self._worker_appliers[worker_index] = applier
+        return applier
+
+    def _claim_company(self, company) -> bool:
+        with self._apply_lock:
+            # An earlier job may have been applied to at the same company
+            if self.is_already_applied_to_company(company):
+                return False
+            if config.APPLY_ONCE_PER_COMPANY:
+                if company in self._companies_in_progress:
+                    return False
+                self._companies_in_progress.add(company)
+            return True
+
+    def _apply_job(self, applier: AIHawkJobApplier, job: Job, screening) -> None:
+        if not self._claim_company(job.company):
+            self.write_to_file(job, "skipped", "Already applied to this company")
+            return
+
+        try:
+            applier.job_apply(job, screening)
+            self.write_to_file(job, "success")
+            logger.info(f"Applied to job: {job.title} at {job.company}")
+
+        except JobNotSuitableException as e:
+            logger.info(
+                f"Job not suitable for application: {job.title} at {job.company}"
+            )
+            self.write_to_file(job, "skipped", f"{str(e)} {traceback.format_exc()}")
 
-            except JobNotSuitableException as e:
-                logger.info(
-                    f"Job not suitable for application: {job.title} at {job.company}"
-                )
-                self.write_to_file(job, "skipped", f"{str(e)} {traceback.format_exc()}")
-                continue
-            
-            except Exception as e:
-                logger.error(
-                    f"Failed to apply for {job.title} at {job.company}: {str(e)}\n{traceback.format_exc()}"
-                )
-                self.write_to_file(
-                    job,
-                    "failed",
-                    f"Application error: {str(e)} {traceback.format_exc()}",
-                )
-                continue
+        except Exception as e:
+            logger.error(
+                f"Failed to apply for {job.title} at {job.company}: {str(e)}\n{traceback.format_exc()}"
+            )
+            self.write_to_file(
+                job,
+                "failed",
+                f"Application error: {str(e)} {traceback.format_exc()}",
+            )
+
+        finally:
+            with self._apply_lock:
+                self._companies_in_progress.discard(job.company)
+
+    def screen_jobs(self, jobs):
+        """
+        Returns the (job, screening) pairs to open in the browser, recording the jobs
+        rejected by the batch screening as skipped. Screening is None for jobs left to
+        be screened in the browser, e.g. when SCREEN_JOBS_BEFORE_APPLYING is off.
+        """
+        if not config.SCREEN_JOBS_BEFORE_APPLYING or not jobs:
+            return [(job, None) for job in jobs]
+
+        try:
+            to_apply, rejected = self.easy_applier_component.screen_jobs(jobs)
+        except Exception as e:
+            logger.error(f"Batch screening failed, screening jobs one by one: {e} {traceback.format_exc()}")
+            return [(job, None) for job in jobs]
+
+        for job, reason in rejected:
+            logger.info(f"Job not suitable for application: {job.title} at {job.company}")
+            self.write_to_file(job, "skipped", reason)
+        return to_apply
 
     def write_to_file(self, job: Job, file_name, reason=None):
-        logger.info(f"Writing job application result to file: {file_name}")
+        logger.info(f"Writing job application result to outcome store: {file_name}")
         pdf_path = Path(job.resume_path).resolve()
         pdf_path = pdf_path.as_uri()
-        data = job.__dict__
+        data = dict(job.__dict__)
         data["pdf_path"] = pdf_path
         data["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         if reason:
             data["reason"] = reason
 
-        file_path = self.output_file_directory / f"{file_name}.json"
-        if not file_path.exists():
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump([data], f, indent=4)
-                logger.info(f"Job data written to new file: {file_name}")
-        else:
-            with open(file_path, "r+", encoding="utf-8") as f:
-                try:
-                    existing_data = json.load(f)
-                except json.JSONDecodeError:
-                    logger.error(f"JSON decode error in file: {file_path}")
-                    existing_data = []
-                existing_data.append(data)
-                f.seek(0)
-                json.dump(existing_data, f, indent=4)
-                f.truncate()
-                logger.info(f"Job data appended to existing file: {file_name}")
+        self.outcome_store.append(file_name, data)
+        logger.info(f"Job data appended to outcome store: {file_name}")
 
     def is_blacklisted(self, job_title, company, link, job_location):
-
         if not job_title or not company or not link or not job_location:
-            logger.warning(
+            logger.debug(
                 f"One or more input parameters are None or empty: job_title={job_title}, company={company}, link={link}, job_location={job_location}"
             )
 
-        logger.info(
-            f"Checking if job is blacklisted: {job_title} at {company} in {job_location}"
-        )
-        title_blacklisted = any(
-            re.search(pattern, job_title, re.IGNORECASE)
-            for pattern in self.title_blacklist_patterns
-        )
-        company_blacklisted = any(
-            re.search(pattern, company, re.IGNORECASE)
-            for pattern in self.company_blacklist_patterns
-        )
-        location_blacklisted = any(
-            re.search(pattern, job_location, re.IGNORECASE)
-            for pattern in self.location_blacklist_patterns
-        )
-
-        is_blacklisted = (
-            title_blacklisted or company_blacklisted or location_blacklisted
-        )
-        logger.info(f"Job blacklisted status: {is_blacklisted}")
-
-        return is_blacklisted
+        match = self.blacklist_matcher.search(job_title, company, job_location)
+        if match is not None:
+            logger.debug(f"Job {job_title} at {company} in {job_location} blacklisted by {match[0]} entry '{match[1]}'")
+        return match is not None
+
+    def is_new_job(self, job) -> bool:
+        """
+        Whether a search result is still worth visiting: not blacklisted and not already
+        applied to, skipped or failed. Used to judge if more search pages are worth fetching.
+        """
+        if any(self.outcome_index.has_link(job.link, status) for status in ("success", "skipped", "failed")):
+            return False
+        return not self.is_blacklisted(job.title, job.company, job.link, job.location)
 
     def is_already_applied_to_job(self, job_title, company, link):
-        link_seen = link in self.seen_jobs
+        # Only successes count: a job skipped for a transient reason is considered again
+        link_seen = self.outcome_index.has_link(link, "success")
         if link_seen:
             logger.info(
                 f"Already applied to job: {job_title} at {company}, skipping..."
@@ -494,44 +598,12 @@ class AIHawkJobManager:
         if not config.APPLY_ONCE_PER_COMPANY:
             return False
 
-        output_files = ["success.json"]
-        for file_name in output_files:
-            file_path = self.output_file_directory / file_name
-            if file_path.exists():
-                with open(file_path, "r", encoding="utf-8") as f:
-                    try:
-                        existing_data = json.load(f)
-                        for applied_job in existing_data:
-                            if (
-                                applied_job["company"].strip().lower()
-                                == company.strip().lower()
-                            ):
-                                logger.info(
-                                    f"Already applied at {company} (once per company policy), skipping..."
-                                )
-                                return True
-                    except json.JSONDecodeError:
-                        continue
+        if self.outcome_index.has_company(company, "success"):
+            logger.info(
+                f"Already applied at {company} (once per company policy), skipping..."
+            )
+            return True
         return False
 
     def is_previously_failed_to_apply(self, link):
-        file_name = "failed"
-        file_path = self.output_file_directory / f"{file_name}.json"
-
-        if not file_path.exists():
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump([], f)
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                existing_data = json.load(f)
-            except json.JSONDecodeError:
-                logger.error(f"JSON decode error in file: {file_path}")
-                return False
-
-        for data in existing_data:
-            data_link = data["link"]
-            if data_link == link:
-                return True
-
-        return False
+        return self.outcome_index.has_link(link, "failed")
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Any, Optional, Union
 
 from attr import dataclass
 
@@ -25,3 +26,22 @@ class TextBoxQuestion:
     question: str
     type: TextBoxQuestionType
     required: bool
+
+
+class FormFieldKind(Enum):
+    UPLOAD = "upload"
+    TERMS_OF_SERVICE = "terms_of_service"
+    RADIO = "radio"
+    TEXTBOX = "textbox"
+    DROPDOWN = "dropdown"
+    UNKNOWN = "unknown"
+
+
+@dataclass
+class FormField:
+    """A form question classified and parsed ahead of filling, question is None for uploads, terms and unknown fields"""
+    kind: FormFieldKind
+    text: str
+    label: Optional[str] = None
+    question: Optional[Union[SelectQuestion, TextBoxQuestion]] = None
+    element: Any = None
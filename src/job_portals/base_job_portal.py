@@ -1,14 +1,17 @@
 from abc import ABC, abstractmethod
-from re import A
 
 from constants import LEVER, LINKEDIN
-from job_portals.application_form_elements import SelectQuestion, TextBoxQuestion
+from job_portals.application_form_elements import FormField, SelectQuestion, TextBoxQuestion
 from authenticator import AIHawkAuthenticator
 from job import Job
 from jobContext import JobContext
 
 from selenium.webdriver.remote.webelement import WebElement
-from typing import List, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Iterator, List, Optional, Tuple, TypeVar
+
+from logger import logger
 
 # Generic type
 T = TypeVar('T')
@@ -32,6 +35,64 @@ class BaseJobsPage(WebPage):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def search_page(self, position, location, page_number) -> List[T]: # type: ignore as it used to enforce between methods 
+        """
+            Stateless counterpart of next_job_page + get_jobs_from_page, must be thread safe
+        """
+        raise NotImplementedError
+
+    def plan_searches(self, positions, locations) -> List[Tuple[str, str]]:
+        """
+            Returns the (position, location) searches to run, one per pair unless the portal batches positions
+        """
+        return list(product(positions, locations))
+
+    def has_next_page(self, position, location) -> bool:
+        """
+            Called after a page of the search was read, False once further pages are not worth requesting
+        """
+        return True
+
+    def iter_job_pages(self, position, location, max_pages: Optional[int] = None) -> Iterator[List[Job]]:
+        """
+            Yields the jobs of a search one page at a time, until an empty page, max_pages or
+            has_next_page says stop. The next page is fetched in the background while the
+            consumer works on the current one.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page_number = 0
+            next_page = executor.submit(self.search_page, position, location, page_number)
+            while next_page is not None:
+                job_tiles = next_page.result()
+                if not job_tiles:
+                    return
+                next_page = None
+                if (max_pages is None or page_number + 1 < max_pages) and self.has_next_page(position, location):
+                    next_page = executor.submit(self.search_page, position, location, page_number + 1)
+                yield self._job_tiles_to_jobs(job_tiles)
+                page_number += 1
+        finally:
+            # A consumer stopping early must not wait for the prefetched page
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_jobs(self, position, location, max_pages: Optional[int] = None) -> Iterator[Job]:
+        """
+            Yields the jobs of a search lazily, see iter_job_pages
+        """
+        for jobs in self.iter_job_pages(position, location, max_pages):
+            yield from jobs
+
+    def _job_tiles_to_jobs(self, job_tiles: List[T]) -> List[Job]:
+        jobs = []
+        for job_tile in job_tiles:
+            try:
+                jobs.append(self.job_tile_to_job(job_tile))
+            except Exception as e:
+                logger.warning(f"Failed to convert search result to job: {job_tile}, error: {e}")
+        return jobs
+
     @abstractmethod
     def job_tile_to_job(self, job_tile: T) -> Job: # type: ignore as it used to enforce between methods 
         raise NotImplementedError
@@ -77,6 +138,13 @@ class BaseJobPage(WebPage):
     def get_job_categories(self) -> dict:
         raise NotImplementedError
 
+    def fetch_job_details(self, job: Job) -> bool:
+        """
+            Fills description, location and categories of the job without the browser.
+            Returns False when the portal can't, the details are then scraped after goto_job_page
+        """
+        return False
+
 
 class BaseApplicationPage(WebPage):
 
@@ -126,6 +194,14 @@ class BaseApplicationPage(WebPage):
         """this method will update to Enum / other easy way (in future) instead of webList"""
         raise NotImplementedError
 
+    def snapshot_form_fields(self, form_section: WebElement) -> Optional[List[FormField]]:
+        """
+            Classifies and parses every question of the form section in a single browser round trip.
+            Returns None when the portal doesn't support snapshots, the applier then goes through
+            get_input_elements and the is_* / web_element_to_* methods element by element
+        """
+        return None
+
     @abstractmethod
     def is_upload_field(self, element: WebElement) -> bool:
         raise NotImplementedError
@@ -1,12 +1,16 @@
 import time
 import traceback
-from typing import List, Text
+from typing import List, Optional, Text
+from lxml import html
 from regex import E
 from selenium.webdriver.remote.webelement import WebElement
 from sqlalchemy import false
+import config
 from custom_exception import JobSkipException
 from logger import logger
 from job_portals.application_form_elements import (
+    FormField,
+    FormFieldKind,
     SelectQuestion,
     SelectQuestionType,
     TextBoxQuestion,
@@ -23,7 +27,217 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 
-from utils import browser_utils, time_utils
+from utils import browser_utils, time_utils, wait_utils
+
+FORM_SECTION_XPATH = "//div[contains(@class, 'section') and contains(@class, 'application-form') and contains(@class, 'page-centered')]"
+QUESTION_XPATH = "//ul/li[contains(@class, 'application-question')]"
+
+TEXTBOX_INPUT_TYPES = {
+    "text": TextBoxQuestionType.TEXT,
+    "number": TextBoxQuestionType.NUMERIC,
+    "email": TextBoxQuestionType.EMAIL,
+}
+
+# Describes every application question of the form section passed as arguments[0] with the same
+# selectors as the is_* / web_element_to_* methods, the li itself comes back as a WebElement
+FORM_SNAPSHOT_SCRIPT = """
+var questionSelector = 'ul > li[class*="application-question"]';
+var text = function (el) { return el ? (el.innerText || '').trim() : null; };
+var isDisplayed = function (el) {
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+};
+return Array.prototype.map.call(arguments[0].querySelectorAll(questionSelector), function (li) {
+    return {
+        element: li,
+        text: text(li),
+        label: text(li.querySelector('div[class*="application-label"]')),
+        required: Array.prototype.some.call(li.querySelectorAll('span'), function (span) {
+            return span.getAttribute('class') === 'required';
+        }),
+        descriptions: Array.prototype.map.call(li.querySelectorAll('p[class*="description"]'), text),
+        inputs: Array.prototype.map.call(li.querySelectorAll('input, textarea, select'), function (el) {
+            var tag = el.tagName.toLowerCase();
+            return {
+                tag: tag,
+                type: el.getAttribute('type'),
+                name: el.getAttribute('name'),
+                value: el.getAttribute('value'),
+                displayed: isDisplayed(el),
+                enabled: !el.disabled,
+                multiple: tag === 'select' && el.multiple,
+                options: tag === 'select'
+                    ? Array.prototype.map.call(el.options, function (option) { return option.text.trim(); })
+                    : []
+            };
+        })
+    };
+});
+"""
+
+
+def _question_label(snapshot: dict) -> str:
+    label = snapshot.get("label")
+    if label is None:
+        raise ValueError(f"Question label not found in: {snapshot.get('text')}")
+    return label
+
+
+def classify_question_snapshot(snapshot: dict) -> FormField:
+    """
+    Pure python counterpart of the is_* checks and web_element_to_* conversions of LeverApplicationPage,
+    applied in the same order on a question described by FORM_SNAPSHOT_SCRIPT
+    """
+    inputs = snapshot.get("inputs", [])
+    choice_inputs = [
+        i for i in inputs if i["tag"] == "input" and i.get("type") in ("checkbox", "radio")
+    ]
+    textbox_inputs = [
+        i for i in inputs
+        if i["tag"] == "textarea" or (i["tag"] == "input" and i.get("type") in TEXTBOX_INPUT_TYPES)
+    ]
+    selects = [i for i in inputs if i["tag"] == "select"]
+
+    def form_field(kind: FormFieldKind, question=None) -> FormField:
+        return FormField(
+            kind=kind,
+            text=snapshot.get("text") or "",
+            label=snapshot.get("label"),
+            question=question,
+            element=snapshot.get("element"),
+        )
+
+    if any(i["tag"] == "input" and i.get("type") == "file" for i in inputs):
+        return form_field(FormFieldKind.UPLOAD)
+
+    if any(
+        i.get("type") == "checkbox" and (i.get("name") or "").startswith("consent")
+        for i in choice_inputs
+    ):
+        return form_field(FormFieldKind.TERMS_OF_SERVICE)
+
+    if choice_inputs:
+        options = []
+        for i in choice_inputs:
+            if i.get("value") and i["value"] not in options:
+                options.append(i["value"])
+        question_type = (
+            SelectQuestionType.MULTI_SELECT
+            if any(i.get("type") == "checkbox" for i in choice_inputs)
+            else SelectQuestionType.SINGLE_SELECT
+        )
+        required = not any("(Optional)" in (d or "") for d in snapshot.get("descriptions", []))
+        return form_field(
+            FormFieldKind.RADIO,
+            SelectQuestion(
+                question=_question_label(snapshot).strip(),
+                options=options,
+                type=question_type,
+                required=required,
+            ),
+        )
+
+    text_inputs = [i for i in textbox_inputs if i["tag"] == "input"]
+    if any(i["tag"] == "textarea" for i in textbox_inputs) or (
+        text_inputs and text_inputs[0].get("displayed") and text_inputs[0].get("enabled")
+    ):
+        first_input = textbox_inputs[0]
+        question_type = (
+            TextBoxQuestionType.TEXT
+            if first_input["tag"] == "textarea"
+            else TEXTBOX_INPUT_TYPES[first_input["type"]]
+        )
+        return form_field(
+            FormFieldKind.TEXTBOX,
+            TextBoxQuestion(
+                question=_question_label(snapshot),
+                type=question_type,
+                required=bool(snapshot.get("required")),
+            ),
+        )
+
+    if selects:
+        select = selects[0]
+        return form_field(
+            FormFieldKind.DROPDOWN,
+            SelectQuestion(
+                question=_question_label(snapshot),
+                options=list(select.get("options", [])),
+                required=bool(snapshot.get("required")),
+                type=(
+                    SelectQuestionType.MULTI_SELECT
+                    if select.get("multiple")
+                    else SelectQuestionType.SINGLE_SELECT
+                ),
+            ),
+        )
+
+    return form_field(FormFieldKind.UNKNOWN)
+
+
+def _inline_text(element) -> str:
+    # Text of inline markup such as "Full name<span class='required'>✱</span>", whitespace collapsed
+    texts = element.xpath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+    return " ".join("".join(texts).split())
+
+
+def _is_displayed(element, question) -> bool:
+    # Best effort without a layout engine: hidden inputs, hidden attributes and inline display:none
+    if element.get("type") == "hidden":
+        return False
+    for node in (element, *element.iterancestors()):
+        style = (node.get("style") or "").replace(" ", "").lower()
+        if node.get("hidden") is not None or "display:none" in style or "visibility:hidden" in style:
+            return False
+        if node is question:
+            break
+    return True
+
+
+def _question_snapshot(question) -> dict:
+    labels = question.xpath(".//div[contains(@class, 'application-label')]")
+    inputs = []
+    for element in question.xpath(".//input | .//textarea | .//select"):
+        inputs.append({
+            "tag": element.tag,
+            "type": element.get("type"),
+            "name": element.get("name"),
+            "value": element.get("value"),
+            "displayed": _is_displayed(element, question),
+            "enabled": element.get("disabled") is None,
+            "multiple": element.tag == "select" and element.get("multiple") is not None,
+            "options": (
+                [option.text_content().strip() for option in element.xpath(".//option")]
+                if element.tag == "select"
+                else []
+            ),
+        })
+    return {
+        "element": None,
+        "text": _inline_text(question),
+        "label": _inline_text(labels[0]) if labels else None,
+        "required": bool(question.xpath(".//span[@class='required']")),
+        "descriptions": [
+            _inline_text(description)
+            for description in question.xpath(".//p[contains(@class, 'description')]")
+        ],
+        "inputs": inputs,
+    }
+
+
+def parse_form_sections(page_source: str) -> List[List[FormField]]:
+    """
+    Browser-free counterpart of FORM_SNAPSHOT_SCRIPT over the HTML of a Lever application page,
+    one list of classified questions per form section, without the question WebElements.
+    """
+    tree = html.fromstring(page_source)
+    return [
+        [
+            classify_question_snapshot(_question_snapshot(question))
+            for question in section.xpath("." + QUESTION_XPATH)
+        ]
+        for section in tree.xpath(FORM_SECTION_XPATH)
+    ]
 
 
 class LeverApplicationPage(BaseApplicationPage):
@@ -124,6 +338,7 @@ class LeverApplicationPage(BaseApplicationPage):
         try:
             file_input = element.find_element(By.XPATH, ".//input[@type='file']")
             file_input.send_keys(file_path)
+            wait_utils.wait_for_upload(self.driver, file_input)
         except Exception as e:
             logger.error(
                 f"Error occurred while uploading file: {e} {traceback.format_exc()}"
@@ -134,10 +349,7 @@ class LeverApplicationPage(BaseApplicationPage):
 
     def get_form_sections(self) -> List[WebElement]:
         try:
-            form_sections = self.driver.find_elements(
-                By.XPATH,
-                "//div[contains(@class, 'section') and contains(@class, 'application-form') and contains(@class, 'page-centered')]",
-            )
+            form_sections = self.driver.find_elements(By.XPATH, FORM_SECTION_XPATH)
             return form_sections
         except Exception as e:
             logger.error(
@@ -256,8 +468,15 @@ class LeverApplicationPage(BaseApplicationPage):
             radio_input = radio_question_web_element.find_element(
                 By.XPATH, f".//input[@value=\"{answer}\"]"
             )
+            target = radio_input
+            if not radio_input.is_displayed():
+                # Lever often hides the native input behind its label, a hidden input never becomes clickable
+                labels = radio_input.find_elements(By.XPATH, "./ancestor::label[1]")
+                target = labels[0] if labels else None
+            if target is not None:
+                wait_utils.wait_for_clickable(self.driver, target)
             time_utils.short_sleep()
-            radio_input.click()
+            (target or radio_input).click()
 
         except Exception as e:
             logger.error(
@@ -367,9 +586,12 @@ class LeverApplicationPage(BaseApplicationPage):
         input_element.send_keys(Keys.DELETE)
 
         # Type answer to trigger suggestions
-        for char in answer:
-            input_element.send_keys(char)
-            time.sleep(0.1)
+        if time_utils.human_jitter_enabled():
+            for char in answer:
+                input_element.send_keys(char)
+                time.sleep(0.1)
+        else:
+            input_element.send_keys(answer)
 
         # Handle dropdown interaction
         try:
@@ -432,6 +654,44 @@ class LeverApplicationPage(BaseApplicationPage):
                 f"Error occurred while getting input elements {e} {traceback.format_exc()}"
             )
 
+    def snapshot_form_fields(self, form_section: WebElement) -> Optional[List[FormField]]:
+        if config.FORM_SNAPSHOT_FROM_PAGE_SOURCE:
+            return self._snapshot_form_fields_from_page_source(form_section)
+
+        try:
+            snapshots = self.driver.execute_script(FORM_SNAPSHOT_SCRIPT, form_section)
+        except Exception as e:
+            logger.warning(f"Form snapshot failed, falling back to element lookups: {e}")
+            return None
+
+        if not snapshots:
+            # Sections without application questions keep the raw textarea / input fallback
+            return None
+
+        return [classify_question_snapshot(snapshot) for snapshot in snapshots]
+
+    def _snapshot_form_fields_from_page_source(
+        self, form_section: WebElement
+    ) -> Optional[List[FormField]]:
+        try:
+            section_index = self.get_form_sections().index(form_section)
+            form_fields = parse_form_sections(self.driver.page_source)[section_index]
+            if not form_fields:
+                return None
+            # Same XPath in the same document order, so the elements line up with the parsed questions
+            elements = form_section.find_elements(By.XPATH, "." + QUESTION_XPATH)
+        except Exception as e:
+            logger.warning(f"Form parsing from page source failed, falling back to element lookups: {e}")
+            return None
+
+        if len(elements) != len(form_fields):
+            logger.warning("Page source and live form questions differ, falling back to element lookups")
+            return None
+
+        for form_field, element in zip(form_fields, elements):
+            form_field.element = element
+        return form_fields
+
     def is_upload_field(self, element: WebElement) -> bool:
         try:
             element.find_element(By.XPATH, ".//input[@type='file']")
@@ -1,26 +1,111 @@
 import traceback
+from typing import Optional
+
+import requests
 from loguru import logger
+from lxml import html
 from custom_exception import JobNotSuitableException, JobSkipException
 from job_portals.base_job_portal import BaseJobPage
 from selenium.webdriver.common.by import By
 
-from utils import time_utils
+from utils import time_utils, wait_utils
+from utils.http_utils import create_session
+
+JOB_DESCRIPTION_XPATH = "//div[@class='section-wrapper page-full-width']"
+LOCATION_XPATH = "//div[contains(@class, 'location') and contains(@class, 'posting-category')]"
+POSTING_CATEGORIES_XPATH = "//div[contains(@class, 'posting-categories')]"
+POSTING_CATEGORY_XPATH = ".//div[contains(@class, 'posting-category')]"
+FETCH_TIMEOUT_SECONDS = 15
+
+
+BLOCK_TAGS = {
+    "p", "div", "li", "ul", "ol", "br", "h1", "h2", "h3", "h4", "h5", "h6",
+    "section", "header", "footer", "blockquote", "pre", "table", "tr",
+}
+HIDDEN_TAGS = {"script", "style", "template", "noscript"}
+
+
+def _element_text(element) -> str:
+    # Visible text only, as WebElement.text would return it: inline markup (b, a, span...)
+    # flows into its line, block elements start a new one, blank lines are dropped
+    chunks = []
+
+    def walk(node):
+        if not isinstance(node.tag, str) or node.tag in HIDDEN_TAGS:
+            return
+        is_block = node.tag in BLOCK_TAGS
+        if is_block:
+            chunks.append("\n")
+        chunks.append(node.text or "")
+        for child in node:
+            walk(child)
+            chunks.append(child.tail or "")
+        if is_block:
+            chunks.append("\n")
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(chunks).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def parse_job_details(page_source: str) -> dict:
+    """
+    Extracts description, location and categories from the static HTML of a
+    jobs.lever.co posting, with the same XPaths as the Selenium getters.
+    """
+    tree = html.fromstring(page_source)
+    descriptions = tree.xpath(JOB_DESCRIPTION_XPATH)
+    locations = tree.xpath(LOCATION_XPATH)
+
+    categories = {}
+    for posting_categories in tree.xpath(POSTING_CATEGORIES_XPATH)[:1]:
+        for element in posting_categories.xpath(POSTING_CATEGORY_XPATH):
+            # The last class name is assumed to be the category key (e.g., location, department)
+            category_key = element.get("class").split()[-1]
+            categories[category_key] = _element_text(element).rstrip('/').strip()
+
+    return {
+        "description": _element_text(descriptions[0]) if descriptions else "",
+        "location": _element_text(locations[0]) if locations else "",
+        "categories": categories,
+    }
 
 
 class LeverJobPage(BaseJobPage):
 
-    def __init__(self, driver):
+    def __init__(self, driver, session: Optional[requests.Session] = None):
         super().__init__(driver)
+        # Keep-alive connections to jobs.lever.co shared by the screening fetch workers
+        self.session = session or create_session()
 
     def goto_job_page(self, job):
         try:
             self.driver.get(job.link)
+            wait_utils.wait_for_page_settled(self.driver)
             time_utils.medium_sleep()
             logger.debug(f"Navigated to job link: {job.link}")
         except Exception as e:
             logger.error(f"Failed to navigate to job link: {job.link}, error: {str(e)}")
             raise e
 
+    def fetch_job_details(self, job) -> bool:
+        try:
+            response = self.session.get(job.link, timeout=FETCH_TIMEOUT_SECONDS)
+            response.raise_for_status()
+            details = parse_job_details(response.text)
+        except Exception as e:
+            logger.warning(f"Failed to fetch job details over HTTP: {job.link}, error: {str(e)}")
+            return False
+
+        if not details["description"]:
+            logger.warning(f"No job description found over HTTP: {job.link}")
+            return False
+
+        job.set_job_description(details["description"])
+        job.location = details["location"]
+        job.categories = details["categories"]
+        return True
+
     def get_apply_button(self, job_context):
         raise NotImplementedError
 
@@ -1,8 +1,12 @@
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 from constants import COMPANY
 from job import Job, JobState
 from job_portals.base_job_portal import BaseJobsPage
 from logger import logger
+import config
+from services.pagination_planner import PaginationPlanner
+from services.query_planner import match_position, or_group, pack_terms
+from utils.url_utils import normalize_job_url
 import stringcase
 from  services.web_search_engine import SearchQueryBuilder, SearchResult, SearchTimeRange, WebSearchEngine, WebSearchEngineFactory
 
@@ -27,6 +31,8 @@ class SearchLeverJobs(BaseJobsPage):
         self.search_limit = self.search_engine.DEFAULT_SEARCH_LIMIT 
         self.jobs = []
         self.current_query = None
+        self.pagination = PaginationPlanner(max_results=self.search_engine.MAX_RESULTS)
+        self.job_filter: Optional[Callable[[Job], bool]] = None
 
      
     def next_job_page(self, position: str, location: str, page_number: int) -> None:
@@ -41,13 +47,69 @@ class SearchLeverJobs(BaseJobsPage):
         # Update pagination offset
         self.search_offset = page_number * self.search_limit
 
+        final_query, params = self.build_search_query(position, location)
+
+        # Store the final query for logging/debugging purposes
+        self.current_query = final_query
+
+        # Store the results
+        self.jobs = self._search(final_query, params, self.search_offset)
+
+    def search_page(self, position: str, location: str, page_number: int) -> List[SearchResult]:
+        """
+        Returns one page of search results without touching the paging state
+        (search_offset, current_query, jobs), so it is safe to call from several threads.
+        """
+        final_query, params = self.build_search_query(position, location)
+        return self._search(final_query, params, page_number * self.search_limit)
+
+    def plan_searches(self, positions: List[str], locations: List[str]) -> List[Tuple[str, str]]:
+        """
+        Packs the positions of each location into OR groups, as many as fit the search
+        engine's query length next to the rest of the query (site, blacklists, whitelists),
+        so one search covers several positions. Jobs are attributed back to a position
+        by title in job_tile_to_job.
+        """
+        if not config.SEARCH_BATCH_POSITIONS:
+            return super().plan_searches(positions, locations)
+
+        searches = []
+        for location in locations:
+            tail_query, _ = self.build_search_query("", location)
+            budget = self.search_engine.MAX_QUERY_LENGTH - len(tail_query) - 1
+            for group in pack_terms(positions, budget, config.SEARCH_MAX_POSITIONS_PER_QUERY):
+                searches.append((or_group(group), location))
+        logger.debug(f"Planned {len(searches)} searches for {len(positions)} positions in {len(locations)} locations")
+        return searches
+
+    def has_next_page(self, position: str, location: str) -> bool:
+        """
+        Whether the next page of this search is worth requesting, according to the
+        pagination planner (engine cap, total_results and yield of the last pages).
+        """
+        final_query, _ = self.build_search_query(position, location)
+        return self.pagination.has_next_page(final_query)
+
+    def set_job_filter(self, job_filter: Optional[Callable[[Job], bool]]) -> None:
+        """
+        Jobs rejected by job_filter (e.g. blacklisted or already applied) don't count
+        as new results when the planner judges whether a search is still productive.
+        """
+        self.job_filter = job_filter
+
+    def build_search_query(self, position: str, location: str) -> Tuple[str, dict]:
+        """
+        Builds the search-engine-specific query for a position and location,
+        applying the blacklists, date range and whitelists of the work preferences.
+        """
         # Build a unified query using SearchQueryBuilder
         query_builder = SearchQueryBuilder.create()
         
         # Add position and location to keywords
         query_builder.add_to_keywords("site:jobs.lever.co")
         query_builder.add_to_keywords("inurl:/apply")
-        query_builder.add_to_keywords(position)
+        if position:
+            query_builder.add_to_keywords(position)
         query_builder.set_geolocation(location)
 
         # Apply blacklists (location, company, title)
@@ -84,24 +146,34 @@ class SearchLeverJobs(BaseJobsPage):
         
         # Translate the unified query into a search-engine-specific query
         final_query, params = query_builder.build_query_for_engine(self.search_engine)
-        
-        # Store the final query for logging/debugging purposes
-        self.current_query = final_query
-        
-        logger.info(f"Querying '{self.current_query}' with offset={self.search_offset}, limit={self.search_limit}, and params={params}")
+        return final_query, params
+
+    def _search(self, final_query: str, params: dict, offset: int) -> List[SearchResult]:
+        logger.info(f"Querying '{final_query}' with offset={offset}, limit={self.search_limit}, and params={params}")
 
         # Execute the search request using the chosen engine
         response = self.search_engine.search(
             query=final_query,
             params=params,
-            offset=self.search_offset,
+            offset=offset,
             limit=self.search_limit
         )
 
-        logger.info(f"Found {len(response.results)} results for query '{self.current_query}'")
+        new_jobs = self.pagination.record_page(final_query, response, self._candidate_links(response.results))
+        logger.info(f"Found {len(response.results)} results ({new_jobs} new) for query '{final_query}'")
+        return response.results
 
-        # Store the results
-        self.jobs = response.results
+    def _candidate_links(self, job_tiles: List[SearchResult]) -> List[str]:
+        links = []
+        for job_tile in job_tiles:
+            try:
+                job = self.job_tile_to_job(job_tile)
+            except Exception as e:
+                logger.warning(f"Failed to convert search result to job: {job_tile}, error: {e}")
+                continue
+            if self.job_filter is None or self.job_filter(job):
+                links.append(job.link)
+        return links
 
 
     def job_tile_to_job(self, job_tile: SearchResult) -> Job:
@@ -112,11 +184,8 @@ class SearchLeverJobs(BaseJobsPage):
         :param job_tile: A SearchResult object with (title, link, snippet).
         :return: A fully populated Job object.
         """
-        link = job_tile.link.lower()
-
-        # Check if the link ends with 'apply' and strip it
-        if link.endswith('/apply'):
-            link = link[:-6]
+        # Lower case, without '/apply', trailing slash or tracking parameters
+        link = normalize_job_url(job_tile.link)
 
         # Extract job ID from the link (assuming it's the last part of the URL)
         job_id = ""
@@ -137,6 +206,7 @@ class SearchLeverJobs(BaseJobsPage):
             company=company,
             link=link,
             job_state=JobState.APPLY.value,
+            position=match_position(job_tile.title, self.work_preferences.get("positions", [])) or "",
         )
 
         logger.debug(f"Created Job object: {job}")
@@ -1,34 +1,143 @@
 from pydantic import BaseModel, Field
 import llm.prompts as prompts
-from config import JOB_SUITABILITY_SCORE
-from constants import AVAILABILITY, CERTIFICATIONS, COMPANY, COVER_LETTER, EDUCATION_DETAILS, EXPERIENCE_DETAILS, INTERESTS, JOB, JOB_APPLICATION_PROFILE, JOB_DESCRIPTION, LANGUAGES, LEGAL_AUTHORIZATION, OPTIONS, PERSONAL_INFORMATION, PHRASE, PROJECTS, QUESTION, RESUME, RESUME_EDUCATIONS, RESUME_JOBS, RESUME_PROJECTS, RESUME_SECTION, SALARY_EXPECTATIONS, SELF_IDENTIFICATION, TEXT, WORK_PREFERENCES
+from answer_cache import sanitize_question
+from config import JOB_SUITABILITY_SCORE, LLM_COMBINED_SECTION_ANSWER, LLM_MAX_CONCURRENT_REQUESTS
+from constants import AVAILABILITY, CERTIFICATIONS, COMPANY, COVER_LETTER, DETERMINE_SECTION_CHAIN, EDUCATION_DETAILS, EXPERIENCE_DETAILS, INTERESTS, JOB, JOB_APPLICATION_PROFILE, JOB_DESCRIPTION, JOB_SUITABILITY_CHAIN, LANGUAGES, LEGAL_AUTHORIZATION, NUMERIC_QUESTION_CHAIN, OPTIONS, OPTIONS_QUESTION_CHAIN, PERSONAL_INFORMATION, PHRASE, PROJECTS, QUESTION, RESUME, RESUME_EDUCATIONS, RESUME_JOBS, RESUME_OR_COVER_CHAIN, RESUME_PROJECTS, RESUME_SECTION, SALARY_EXPECTATIONS, SECTION_AND_ANSWER_CHAIN, SELF_IDENTIFICATION, SUMMARIZE_CHAIN, TEXT, WORK_PREFERENCES, WORK_PREFERENCES_MATCH_CHAIN
 from job import Job
 from job_application_profile import JobApplicationProfile
-from llm.llm_manager import AIAdapter, TensorZeroChatModelWrapper
+from llm.llm_manager import AIAdapter, CachedTensorZeroChatModelWrapper, TensorZeroChatModelWrapper
+from utils.sqlite_cache import SqliteLRUCache
 
 
 from Levenshtein import distance
+from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
 from loguru import logger
 
 
+import asyncio
+import hashlib
 import re
 import textwrap
 import traceback
-from copy import deepcopy
-from typing import Optional, Tuple
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
 
 class WorkPreferenceMatch(BaseModel):
         match: bool = Field(description="Whether work preferences match the job")
         reason: str = Field(description="Reason for mismatch if applicable")
 
+class SectionAnswer(BaseModel):
+        section: str = Field(description="Name of the resume section the question is about")
+        answer: str = Field(description="Answer to the question")
+
+
+@dataclass
+class JobScreening:
+    summary: str
+    work_preferences_match: bool
+    is_suitable: bool
+    score: Optional[int]
+    reasoning: Optional[str]
+
+# Resume section -> prompt template used to answer questions about it
+SECTION_TEMPLATES = {
+    PERSONAL_INFORMATION: prompts.personal_information_template,
+    SELF_IDENTIFICATION: prompts.self_identification_template,
+    LEGAL_AUTHORIZATION: prompts.legal_authorization_template,
+    WORK_PREFERENCES: prompts.work_preferences_template,
+    EDUCATION_DETAILS: prompts.education_details_template,
+    EXPERIENCE_DETAILS: prompts.experience_details_template,
+    PROJECTS: prompts.projects_template,
+    AVAILABILITY: prompts.availability_template,
+    SALARY_EXPECTATIONS: prompts.salary_expectations_template,
+    CERTIFICATIONS: prompts.certifications_template,
+    LANGUAGES: prompts.languages_template,
+    INTERESTS: prompts.interests_template,
+    COVER_LETTER: prompts.coverletter_template,
+}
+
+SECTION_PATTERN = re.compile(
+    r"(Personal information|Self Identification|Legal Authorization|Work Preferences|Education "
+    r"Details|Experience Details|Projects|Availability|Salary "
+    r"Expectations|Certifications|Languages|Interests|Cover letter)",
+    re.IGNORECASE,
+)
+
+
 class AiAnswerer:
 
-    def __init__(self, config, llm_api_key): # config might be unused now
-        self.ai_adapter = AIAdapter(config, llm_api_key)
+    def __init__(
+        self,
+        config,  # config might be unused now
+        llm_api_key,
+        summary_cache: Optional[SqliteLRUCache] = None,
+        response_cache: Optional[SqliteLRUCache] = None,
+    ):
+        self.summary_cache = summary_cache
+        self.response_cache = response_cache
+        self._config = config
+        self._llm_api_key = llm_api_key
+        self.work_preference_match_parser = JsonOutputParser(pydantic_object=WorkPreferenceMatch)
+        self.section_answer_parser = JsonOutputParser(pydantic_object=SectionAnswer)
+        self._bind_llm(AIAdapter(config, llm_api_key))
+        # Sanitized question -> resume section, so repeated questions skip routing
+        self.question_sections = {}
+        # The async OpenAI client is bound to the loop it first ran on, so one loop is reused
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_llm(self, ai_adapter: AIAdapter):
+        """Wraps the adapter's model and compiles every chain against it."""
+        self.ai_adapter = ai_adapter
         self.llm_cheap = TensorZeroChatModelWrapper(self.ai_adapter.model)
+        # Classification prompts give the same reply for the same input, so they may be served locally
+        self.llm_deterministic = (
+            CachedTensorZeroChatModelWrapper(self.ai_adapter.model, self.response_cache)
+            if self.response_cache is not None
+            else self.llm_cheap
+        )
+        self.section_chains = {
+            section: self._create_chain(template)
+            for section, template in SECTION_TEMPLATES.items()
+        }
+        self.chains = self._create_chains()
+
+    def _create_chains(self) -> dict:
+        """Prompts, parsers and format instructions never change, so every chain is compiled once."""
+        work_preferences_match_prompt = ChatPromptTemplate.from_template(
+            prompts.is_work_preferences_match_template + "\n{format_instructions}"
+        ).partial(format_instructions=self.work_preference_match_parser.get_format_instructions())
+        section_and_answer_prompt = ChatPromptTemplate.from_template(
+            prompts.determine_section_and_answer_template + "\n{format_instructions}"
+        ).partial(format_instructions=self.section_answer_parser.get_format_instructions())
+        return {
+            SUMMARIZE_CHAIN: self._create_chain(
+                self._preprocess_template_string(prompts.summarize_prompt_template)
+            ),
+            DETERMINE_SECTION_CHAIN: self._create_chain(
+                prompts.determine_section_template, self.llm_deterministic
+            ),
+            SECTION_AND_ANSWER_CHAIN: section_and_answer_prompt
+            | self._as_runnable(self.llm_cheap)
+            | self.section_answer_parser,
+            NUMERIC_QUESTION_CHAIN: self._create_chain(
+                self._preprocess_template_string(prompts.numeric_question_template)
+            ),
+            OPTIONS_QUESTION_CHAIN: self._create_chain(
+                self._preprocess_template_string(prompts.options_template)
+            ),
+            RESUME_OR_COVER_CHAIN: self._create_chain(
+                prompts.resume_or_cover_letter_template, self.llm_deterministic
+            ),
+            WORK_PREFERENCES_MATCH_CHAIN: work_preferences_match_prompt
+            | self._as_runnable(self.llm_deterministic)
+            | self.work_preference_match_parser,
+            JOB_SUITABILITY_CHAIN: self._create_chain(prompts.is_relavant_position_template),
+        }
 
     @property
     def job_description(self):
@@ -59,12 +168,14 @@ class AiAnswerer:
         logger.debug(f"Setting resume: {resume}")
         self.resume = resume
 
-    def set_job(self, job: Job):
+    def set_job(self, job: Job, summarize: bool = True):
+        """Pass summarize=False for jobs already screened, which carry their summary."""
         logger.debug(f"Setting job: {job}")
         self.job = job
-        self.job.set_summarize_job_description(
-            self.summarize_job_description(self.job.description)
-        )
+        if summarize:
+            self.job.set_summarize_job_description(
+                self.summarize_job_description(self.job.description)
+            )
 
     def set_job_application_profile(self, job_application_profile : JobApplicationProfile):
         logger.debug(f"Setting job application profile: {job_application_profile}")
@@ -73,76 +184,122 @@ class AiAnswerer:
     def _clean_llm_output(self, output: str) -> str:
         return output.replace("*", "").replace("#", "").strip()
 
-    def summarize_job_description(self, text: str) -> str:
-        logger.debug(f"Summarizing job description: {text}")
-        prompts.summarize_prompt_template = self._preprocess_template_string(
-            prompts.summarize_prompt_template
-        )
-        prompt = ChatPromptTemplate.from_template(prompts.summarize_prompt_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output = chain.invoke({TEXT: text})
+    @staticmethod
+    def summary_cache_key(text: str) -> str:
+        """The prompt is part of the key, so editing it invalidates previous summaries."""
+        digest = hashlib.sha256(prompts.summarize_prompt_template.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _lookup_summary(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        if self.summary_cache is None:
+            return None, None
+        cache_key = self.summary_cache_key(text)
+        output = self.summary_cache.get(cache_key)
+        if output is not None:
+            logger.debug("Job description summary found in cache")
+        return cache_key, output
+
+    def _store_summary(self, cache_key: Optional[str], raw_output: str) -> str:
         output = self._clean_llm_output(raw_output)
         logger.debug(f"Summary generated: {output}")
+        if cache_key is not None:
+            self.summary_cache.set(cache_key, output)
         return output
 
-    def _create_chain(self, template: str):
+    def summarize_job_description(self, text: str) -> str:
+        logger.debug(f"Summarizing job description: {text}")
+        cache_key, output = self._lookup_summary(text)
+        if output is None:
+            raw_output = self.chains[SUMMARIZE_CHAIN].invoke({TEXT: text})
+            output = self._store_summary(cache_key, raw_output)
+        return output
+
+    async def asummarize_job_description(self, text: str) -> str:
+        logger.debug(f"Summarizing job description asynchronously: {text}")
+        cache_key, output = self._lookup_summary(text)
+        if output is None:
+            raw_output = await self.chains[SUMMARIZE_CHAIN].ainvoke({TEXT: text})
+            output = self._store_summary(cache_key, raw_output)
+        return output
+
+    def _create_chain(self, template: str, llm=None):
         logger.debug(f"Creating chain with template: {template}")
         prompt = ChatPromptTemplate.from_template(template)
-        return prompt | self.llm_cheap | StrOutputParser()
+        return prompt | self._as_runnable(llm or self.llm_cheap) | StrOutputParser()
+
+    @staticmethod
+    def _as_runnable(llm) -> RunnableLambda:
+        """Lets ainvoke/abatch use the wrapper's native async call instead of a worker thread."""
+        return RunnableLambda(llm, afunc=getattr(llm, "acall", None))
+
+    def _run(self, coroutine):
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    def worker_copy(self) -> "AiAnswerer":
+        """
+        Answerer for another application worker thread. It shares the caches but gets its own
+        LLM client and event loop, so workers screen and answer in parallel, and sets its own
+        current job.
+        """
+        worker = copy(self)
+        worker._bind_llm(AIAdapter(self._config, self._llm_api_key))
+        worker._loop = None
+        return worker
 
     def answer_question_textual_wide_range(self, question: str) -> str:
         logger.debug(f"Answering textual question: {question}")
-        chains = {
-            PERSONAL_INFORMATION: self._create_chain(
-                prompts.personal_information_template
-            ),
-            SELF_IDENTIFICATION: self._create_chain(
-                prompts.self_identification_template
-            ),
-            LEGAL_AUTHORIZATION: self._create_chain(
-                prompts.legal_authorization_template
-            ),
-            WORK_PREFERENCES: self._create_chain(
-                prompts.work_preferences_template
-            ),
-            EDUCATION_DETAILS: self._create_chain(
-                prompts.education_details_template
-            ),
-            EXPERIENCE_DETAILS: self._create_chain(
-                prompts.experience_details_template
-            ),
-            PROJECTS: self._create_chain(prompts.projects_template),
-            AVAILABILITY: self._create_chain(prompts.availability_template),
-            SALARY_EXPECTATIONS: self._create_chain(
-                prompts.salary_expectations_template
-            ),
-            CERTIFICATIONS: self._create_chain(
-                prompts.certifications_template
-            ),
-            LANGUAGES: self._create_chain(prompts.languages_template),
-            INTERESTS: self._create_chain(prompts.interests_template),
-            COVER_LETTER: self._create_chain(prompts.coverletter_template),
-        }
+        question_key = sanitize_question(question)
+        section_name = self.question_sections.get(question_key)
+
+        if section_name is None and LLM_COMBINED_SECTION_ANSWER:
+            try:
+                section_name, output = self._determine_section_and_answer(question)
+            except (OutputParserException, TypeError, ValueError) as e:
+                logger.warning(f"Combined section and answer failed, routing separately: {e}")
+            else:
+                self.question_sections[question_key] = section_name
+                if section_name != "cover_letter":
+                    logger.debug(f"Question answered: {output}")
+                    return output
+
+        if section_name is None:
+            section_name = self._determine_section(question)
+            self.question_sections[question_key] = section_name
+        return self._answer_from_section(section_name, question)
 
-        prompt = ChatPromptTemplate.from_template(prompts.determine_section_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output = chain.invoke({QUESTION: question})
-        output = self._clean_llm_output(raw_output)
-
-        match = re.search(
-            r"(Personal information|Self Identification|Legal Authorization|Work Preferences|Education "
-            r"Details|Experience Details|Projects|Availability|Salary "
-            r"Expectations|Certifications|Languages|Interests|Cover letter)",
-            output,
-            re.IGNORECASE,
-        )
+    @staticmethod
+    def _parse_section_name(output: str) -> str:
+        match = SECTION_PATTERN.search(output)
         if not match:
             raise ValueError("Could not extract section name from the response.")
+        return match.group(1).lower().replace(" ", "_")
+
+    def _determine_section(self, question: str) -> str:
+        raw_output = self.chains[DETERMINE_SECTION_CHAIN].invoke({QUESTION: question})
+        section_name = self._parse_section_name(self._clean_llm_output(raw_output))
+        logger.debug(f"Section determined: {section_name}")
+        return section_name
 
-        section_name = match.group(1).lower().replace(" ", "_")
+    def _determine_section_and_answer(self, question: str) -> Tuple[str, str]:
+        output = self.chains[SECTION_AND_ANSWER_CHAIN].invoke(
+            {
+                RESUME: self.resume,
+                JOB_APPLICATION_PROFILE: self.job_application_profile,
+                QUESTION: question,
+            }
+        )
+        section_answer = SectionAnswer(**output)
+        section_name = self._parse_section_name(section_answer.section)
+        logger.debug(f"Section determined: {section_name}")
+        return section_name, self._clean_llm_output(section_answer.answer)
 
+    def _answer_from_section(self, section_name: str, question: str) -> str:
         if section_name == "cover_letter":
-            chain = chains.get(section_name)
+            chain = self.section_chains.get(section_name)
             raw_output = chain.invoke(
                 {
                     RESUME: self.resume,
@@ -163,7 +320,7 @@ class AiAnswerer:
             raise ValueError(
                 f"Section '{section_name}' not found in either resume or job_application_profile."
             )
-        chain = chains.get(section_name)
+        chain = self.section_chains.get(section_name)
         if chain is None:
             logger.error(f"Chain not defined for section '{section_name}'")
             raise ValueError(f"Chain not defined for section '{section_name}'")
@@ -178,12 +335,7 @@ class AiAnswerer:
         self, question: str, default_experience: str = "3"
     ) -> str:
         logger.debug(f"Answering numeric question: {question}")
-        func_template = self._preprocess_template_string(
-            prompts.numeric_question_template
-        )
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output_str = chain.invoke(
+        raw_output_str = self.chains[NUMERIC_QUESTION_CHAIN].invoke(
             {
                 RESUME_EDUCATIONS: self.resume.education_details,
                 RESUME_JOBS: self.resume.experience_details,
@@ -215,10 +367,7 @@ class AiAnswerer:
 
     def answer_question_from_options(self, question: str, options: list[str]) -> str:
         logger.debug(f"Answering question from options: {question}")
-        func_template = self._preprocess_template_string(prompts.options_template)
-        prompt = ChatPromptTemplate.from_template(func_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_output_str = chain.invoke(
+        raw_output_str = self.chains[OPTIONS_QUESTION_CHAIN].invoke(
             {
                 RESUME: self.resume,
                 JOB_APPLICATION_PROFILE: self.job_application_profile,
@@ -236,11 +385,7 @@ class AiAnswerer:
         logger.debug(
             f"Determining if phrase refers to resume or cover letter: {phrase}"
         )
-        prompt = ChatPromptTemplate.from_template(
-            prompts.resume_or_cover_letter_template
-        )
-        chain = prompt | self.llm_cheap | StrOutputParser()
-        raw_response = chain.invoke({PHRASE: phrase})
+        raw_response = self.chains[RESUME_OR_COVER_CHAIN].invoke({PHRASE: phrase})
         response = self._clean_llm_output(raw_response)
         logger.debug(f"Response for resume_or_cover: {response}")
         if "resume" in response:
@@ -250,6 +395,21 @@ class AiAnswerer:
         else:
             return "resume"
 
+    def _work_preferences_match_inputs(self, job: Job, work_preferences: dict) -> dict:
+        # Create a copy of work_preferences to avoid modifying the input
+        combined_preferences = work_preferences.copy()
+        combined_preferences.update(self.job_application_profile.work_preferences.__dict__)
+
+        # Copy job object to avoid modifying the input , saving input tokens
+        job_copy = deepcopy(job)
+        job_copy.description = ""
+        job_copy.summarize_job_description = ""
+
+        return {
+            WORK_PREFERENCES : combined_preferences,
+            JOB : job_copy,
+        }
+
     def is_work_preferences_match(self, job: Job, work_preferences: dict) -> bool:
         """
         Determine if candidate's work preferences match the job requirements.
@@ -262,45 +422,26 @@ class AiAnswerer:
             bool: True if work preferences match the job, False otherwise
         """
         logger.debug("Checking if work preferences match template")
-
-        # Create proper JSON parser with the expected schema
-        parser = JsonOutputParser(pydantic_object=WorkPreferenceMatch)
-
-        # Get format instructions for the parser
-        format_instructions = parser.get_format_instructions()
-
-        # Update the prompt to include parser instructions
-        prompt = ChatPromptTemplate.from_template(
-            prompts.is_work_preferences_match_template + "\n{format_instructions}"
-        )
-
-        # Build the chain with the parser
-        chain = prompt | self.llm_cheap | parser
-
-        # Create a copy of work_preferences to avoid modifying the input
-        combined_preferences = work_preferences.copy()
-        combined_preferences.update(self.job_application_profile.work_preferences.__dict__)
-
-        # Copy job object to avoid modifying the input , saving input tokens
-        job_copy = deepcopy(job)
-        job_copy.description = ""
-        job_copy.summarize_job_description = ""
-
         try:
-            # Execute the chain with the format instructions
-            output = chain.invoke(
-                {
-                    WORK_PREFERENCES : combined_preferences,
-                    JOB : job_copy,
-                    "format_instructions": format_instructions
-                }
+            # Format instructions are already bound to the precompiled chain
+            output = self.chains[WORK_PREFERENCES_MATCH_CHAIN].invoke(
+                self._work_preferences_match_inputs(job, work_preferences)
             )
-
             logger.debug(f"Work preferences match output: {output}")
+            return WorkPreferenceMatch(**output).match
+        except Exception as e:
+            logger.error(f"Error in work preferences matching: {e} {traceback.format_exc()} ")
+            return True
 
-            work_preferences_match = WorkPreferenceMatch(**output)
-
-            return work_preferences_match.match
+    async def ais_work_preferences_match(self, job: Job, work_preferences: dict) -> bool:
+        """Async counterpart of is_work_preferences_match."""
+        logger.debug("Checking asynchronously if work preferences match template")
+        try:
+            output = await self.chains[WORK_PREFERENCES_MATCH_CHAIN].ainvoke(
+                self._work_preferences_match_inputs(job, work_preferences)
+            )
+            logger.debug(f"Work preferences match output: {output}")
+            return WorkPreferenceMatch(**output).match
         except Exception as e:
             logger.error(f"Error in work preferences matching: {e} {traceback.format_exc()} ")
             return True
@@ -317,19 +458,28 @@ class AiAnswerer:
         """
         logger.info("Checking if job is suitable")
 
-        # Create the prompt and process it through the chain
-        prompt = ChatPromptTemplate.from_template(prompts.is_relavant_position_template)
-        chain = prompt | self.llm_cheap | StrOutputParser()
+        # Invoke the precompiled chain with resume and job description
+        raw_output = self.chains[JOB_SUITABILITY_CHAIN].invoke(
+            self._job_suitability_inputs(self.job, work_preferences)
+        )
+        return self._parse_job_suitability(raw_output)
 
-        # Invoke the chain with resume and job description
-        raw_output = chain.invoke(
-            {
-                RESUME: self.resume,
-                JOB_DESCRIPTION: self.job_description,
-                WORK_PREFERENCES: work_preferences
-            }
+    async def ais_job_suitable(self, job: Job, work_preferences : dict) -> Tuple[bool, Optional[int], Optional[str]]:
+        """Async counterpart of is_job_suitable, for the given job instead of the current one."""
+        logger.info("Checking asynchronously if job is suitable")
+        raw_output = await self.chains[JOB_SUITABILITY_CHAIN].ainvoke(
+            self._job_suitability_inputs(job, work_preferences)
         )
+        return self._parse_job_suitability(raw_output)
+
+    def _job_suitability_inputs(self, job: Job, work_preferences: dict) -> dict:
+        return {
+            RESUME: self.resume,
+            JOB_DESCRIPTION: job.description,
+            WORK_PREFERENCES: work_preferences
+        }
 
+    def _parse_job_suitability(self, raw_output: str) -> Tuple[bool, Optional[int], Optional[str]]:
         # Clean and process LLM output
         output = self._clean_llm_output(raw_output)
         logger.debug(f"Job suitability output: {output}")
@@ -357,3 +507,51 @@ class AiAnswerer:
             logger.debug(f"Job is not suitable: {reasoning}")
 
         return is_suitable, score, reasoning
+
+    async def ascreen_job(self, job: Job, work_preferences: dict) -> JobScreening:
+        """
+        Summarizes the job and checks work preferences and suitability concurrently:
+        none of the three prompts depends on another's output, so the gate in front
+        of an application costs one LLM round trip instead of three. A job that fails
+        the work preferences is rejected anyway, so its suitability check is cancelled.
+        """
+        summary = asyncio.ensure_future(self.asummarize_job_description(job.description))
+        suitability = asyncio.ensure_future(self.ais_job_suitable(job, work_preferences))
+        try:
+            work_preferences_match = await self.ais_work_preferences_match(job, work_preferences)
+        except BaseException:
+            summary.cancel()
+            suitability.cancel()
+            raise
+        if not work_preferences_match:
+            suitability.cancel()
+            # Let the chain unwind its callbacks before the loop stops running
+            await asyncio.wait([suitability])
+            return JobScreening(await summary, work_preferences_match, False, None, None)
+        (is_suitable, score, reasoning), summary = await asyncio.gather(suitability, summary)
+        return JobScreening(summary, work_preferences_match, is_suitable, score, reasoning)
+
+    async def ascreen_jobs(self, jobs: List[Job], work_preferences: dict) -> List[JobScreening]:
+        """Screens all the jobs in one pass, with at most LLM_MAX_CONCURRENT_REQUESTS jobs in flight."""
+        semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENT_REQUESTS)
+
+        async def screen(job: Job) -> JobScreening:
+            async with semaphore:
+                return await self.ascreen_job(job, work_preferences)
+
+        return await asyncio.gather(*(screen(job) for job in jobs))
+
+    def screen_jobs(self, jobs: List[Job], work_preferences: dict) -> List[JobScreening]:
+        logger.debug(f"Screening {len(jobs)} jobs")
+        screenings = self._run(self.ascreen_jobs(jobs, work_preferences))
+        for job, screening in zip(jobs, screenings):
+            job.set_summarize_job_description(screening.summary)
+        return screenings
+
+    def screen_job(self, job: Job, work_preferences: dict) -> JobScreening:
+        """Sets the job to answer questions about, like set_job, and screens it with ascreen_job."""
+        logger.debug(f"Screening job: {job}")
+        self.job = job
+        screening = self._run(self.ascreen_job(job, work_preferences))
+        job.set_summarize_job_description(screening.summary)
+        return screening
@@ -1,10 +1,14 @@
+import hashlib
+import json
 from pyexpat import model
-from typing import List, Union
+from typing import List, Optional, Union
 from dotenv import load_dotenv
 from langchain_core.messages import BaseMessage, AIMessage
 from langchain_openai import ChatOpenAI
 from loguru import logger
 
+from utils.sqlite_cache import SqliteLRUCache
+
 
 load_dotenv()
 
@@ -42,6 +46,17 @@ class AIAdapter:
             # Depending on desired behavior, re-raise or return an error indicator
             raise # Re-raise the exception for now
 
+    async def ainvoke(self, prompt: Union[str, List[BaseMessage]]) -> BaseMessage:
+        """Invokes the TensorZero gateway via ChatOpenAI without blocking the event loop."""
+        logger.debug(f"Invoking TensorZero gateway asynchronously with prompt type: {type(prompt)}")
+        try:
+            response = await self.model.ainvoke(prompt)
+            logger.debug(f"Received response from TensorZero gateway.")
+            return response
+        except Exception as e:
+            logger.error(f"Error invoking TensorZero gateway: {e}")
+            raise
+
 
 class TensorZeroChatModelWrapper:
     """
@@ -57,21 +72,93 @@ class TensorZeroChatModelWrapper:
         logger.debug(f"Wrapper invoking LLM with {messages} messages.")
         try:
             # Directly invoke the model, Langchain/TensorZero handles retries etc.
-            reply = self.llm.invoke(messages)
-
-            # Basic check for expected return type
-            if not isinstance(reply, AIMessage):
-                 logger.warning(f"Unexpected reply type from LLM: {type(reply)}. Expected AIMessage.")
-                 # Attempt basic conversion if possible, otherwise raise error
-                 if isinstance(reply, str):
-                     return AIMessage(content=reply)
-                 else:
-                     # Cannot reliably proceed
-                     raise TypeError(f"Cannot handle LLM reply type: {type(reply)}")
-
-            return reply
-
+            return self._check_reply(self.llm.invoke(messages))
         except Exception as e:
             logger.error(f"Error during LLM invocation within wrapper: {str(e)}")
             # Re-raise the exception to be handled by the caller
             raise
+
+    async def acall(self, messages: List[BaseMessage]) -> BaseMessage:
+        """Async counterpart of __call__, used by the chains' ainvoke/abatch."""
+        logger.debug(f"Wrapper invoking LLM asynchronously with {messages} messages.")
+        try:
+            return self._check_reply(await self.llm.ainvoke(messages))
+        except Exception as e:
+            logger.error(f"Error during async LLM invocation within wrapper: {str(e)}")
+            raise
+
+    @staticmethod
+    def _check_reply(reply) -> BaseMessage:
+        # Basic check for expected return type
+        if not isinstance(reply, AIMessage):
+             logger.warning(f"Unexpected reply type from LLM: {type(reply)}. Expected AIMessage.")
+             # Attempt basic conversion if possible, otherwise raise error
+             if isinstance(reply, str):
+                 return AIMessage(content=reply)
+             else:
+                 # Cannot reliably proceed
+                 raise TypeError(f"Cannot handle LLM reply type: {type(reply)}")
+
+        return reply
+
+
+class CachedTensorZeroChatModelWrapper(TensorZeroChatModelWrapper):
+    """
+    TensorZeroChatModelWrapper that serves repeated requests from a local response cache.
+    Replies are keyed by model, TensorZero function name, temperature and a hash of the
+    canonicalized messages, so any change to the prompt or the sampling settings is a miss.
+    """
+    def __init__(self, llm: ChatOpenAI, cache: SqliteLRUCache):
+        super().__init__(llm)
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, messages) -> str:
+        model_name = str(getattr(self.llm, "model_name", ""))
+        canonical = json.dumps(
+            {
+                "model": model_name,
+                "function_name": model_name.split("::function_name::")[-1],
+                "temperature": getattr(self.llm, "temperature", None),
+                "messages": [
+                    [message.type, message.content] for message in self._to_messages(messages)
+                ],
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _to_messages(messages) -> List[BaseMessage]:
+        # Chains pass a PromptValue, direct callers a list of messages
+        return messages.to_messages() if hasattr(messages, "to_messages") else list(messages)
+
+    def _cached_reply(self, key: str) -> Optional[BaseMessage]:
+        content = self.cache.get(key)
+        if content is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.debug(f"LLM response cache hit ({self.hits} hits, {self.misses} misses)")
+        return AIMessage(content=content)
+
+    def __call__(self, messages: List[BaseMessage]) -> BaseMessage:
+        key = self.cache_key(messages)
+        reply = self._cached_reply(key)
+        if reply is None:
+            reply = super().__call__(messages)
+            self.cache.set(key, reply.content)
+        return reply
+
+    async def acall(self, messages: List[BaseMessage]) -> BaseMessage:
+        key = self.cache_key(messages)
+        reply = self._cached_reply(key)
+        if reply is None:
+            reply = await super().acall(messages)
+            self.cache.set(key, reply.content)
+        return reply
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.cache)}
@@ -561,4 +561,35 @@ Here are detailed guidelines to help you choose the correct section:
    - **Examples**: Cover letter content, personalized statements.
 
 Provide only the exact name of the section from the list above with no additional text.
-"""
\ No newline at end of file
+"""
+determine_section_and_answer_template = """You are assisting a bot designed to automatically apply for jobs on AIHawk. The bot receives a free-text question from a job application form and must, in a single step, pick the most relevant section of the candidate's data and answer the question from it.
+
+## Sections
+- Personal information: contact details and online profiles (email, phone, GitHub, website).
+- Self Identification: gender, pronouns, veteran status, disability status, ethnicity.
+- Legal Authorization: work authorization in specific countries, visa and sponsorship needs.
+- Work Preferences: remote or in-person work, relocation, assessments, background checks.
+- Education Details: degrees, universities, GPA, field of study, exams.
+- Experience Details: job roles, companies, responsibilities, skills acquired.
+- Projects: project names, descriptions, repository links.
+- Availability: notice period, start date.
+- Salary Expectations: desired salary range.
+- Certifications: certification names, issuing bodies, validity.
+- Languages: languages spoken and proficiency levels.
+- Interests: hobbies, personal and professional interests.
+- Cover letter: cover letter or personalized written statements for the application.
+
+## Rules
+- "section" must be exactly one of the section names listed above.
+- "answer" answers the question directly, using only the information of the chosen section.
+- If the section is Cover letter, leave "answer" empty.
+
+## My resume:
+```
+{resume}
+{job_application_profile}
+```
+
+## Question:
+{question}
+"""
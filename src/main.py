@@ -16,6 +16,17 @@ from lib_resume_builder_AIHawk import (
 )
 from typing import Optional
 from bot_facade import AIHawkBotFacade
+from config import (
+    APPLICATION_WORKERS,
+    LLM_RESPONSE_CACHE_FILE,
+    LLM_RESPONSE_CACHE_MAX_ENTRIES,
+    LLM_RESPONSE_CACHE_TTL_SECONDS,
+    SEARCH_CACHE_FILE,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_ONLY,
+    SUMMARY_CACHE_FILE,
+    SUMMARY_CACHE_MAX_ENTRIES,
+)
 from constants import (
     COLLECT_MODE,
     LEVER,
@@ -27,10 +38,13 @@ from constants import (
     WORK_PREFERENCES_YAML,
     WORK_PREFERENCES,
 )
+from driver_pool import DriverPool
 from job_manager import AIHawkJobManager
 from job_portals.base_job_portal import get_job_portal
 from llm.ai_answerer import AiAnswerer
+from services.web_search_engine import WebSearchEngineFactory
 from utils.chrome_utils import chrome_browser_options
+from utils.sqlite_cache import SqliteLRUCache
 
 from job_application_profile import JobApplicationProfile
 from logger import logger
@@ -234,15 +248,16 @@ class FileManager:
         return result
 
 
-def init_browser() -> webdriver.Chrome:
+def init_browser(worker_index: int = 0) -> webdriver.Chrome:
     try:
-        options = chrome_browser_options()
+        options = chrome_browser_options(worker_index)
         return uc.Chrome(options=options)
     except Exception as e:
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
 
 
 def create_and_run_bot(parameters, llm_api_key):
+    driver_pool = None
     try:
         style_manager = StyleManager()
         resume_generator = ResumeGenerator()
@@ -267,12 +282,30 @@ def create_and_run_bot(parameters, llm_api_key):
 
         browser = init_browser()
         browser_utils.set_default_driver(browser)
+        if SEARCH_CACHE_FILE:
+            WebSearchEngineFactory.set_search_cache(
+                SqliteLRUCache(SEARCH_CACHE_FILE, SEARCH_CACHE_MAX_ENTRIES), SEARCH_CACHE_ONLY
+            )
         job_portal = get_job_portal(
             driver=browser, portal_name=LEVER, work_preferences=parameters[WORK_PREFERENCES]
         )
         login_component = job_portal.authenticator
         apply_component = AIHawkJobManager(job_portal)
-        gpt_answerer_component = AiAnswerer(parameters, llm_api_key)
+        if APPLICATION_WORKERS > 1:
+            driver_pool = DriverPool(APPLICATION_WORKERS, init_browser, browser)
+            apply_component.set_driver_pool(
+                driver_pool,
+                lambda driver: get_job_portal(
+                    driver=driver, portal_name=LEVER, work_preferences=parameters[WORK_PREFERENCES]
+                ),
+            )
+        summary_cache = SqliteLRUCache(SUMMARY_CACHE_FILE, SUMMARY_CACHE_MAX_ENTRIES) if SUMMARY_CACHE_FILE else None
+        response_cache = (
+            SqliteLRUCache(LLM_RESPONSE_CACHE_FILE, LLM_RESPONSE_CACHE_MAX_ENTRIES, LLM_RESPONSE_CACHE_TTL_SECONDS)
+            if LLM_RESPONSE_CACHE_FILE
+            else None
+        )
+        gpt_answerer_component = AiAnswerer(parameters, llm_api_key, summary_cache, response_cache)
         bot = AIHawkBotFacade(login_component, apply_component)
         bot.set_job_application_profile_and_resume(
             job_application_profile_object, resume_object
@@ -292,6 +325,9 @@ def create_and_run_bot(parameters, llm_api_key):
         logger.error(f"WebDriver error occurred: {e}")
     except Exception as e:
         raise RuntimeError(f"Error running the bot: {str(e)}")
+    finally:
+        if driver_pool is not None:
+            driver_pool.quit()
 
 
 @click.command()
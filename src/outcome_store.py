@@ -0,0 +1,321 @@
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import config
+from constants import OUTCOME_STORE_JSONL, OUTCOME_STORE_SQLITE
+from logger import logger
+from utils.url_utils import canonical_job_link
+
+# Outcome files written by AIHawkJobManager.write_to_file before the store existed
+LEGACY_OUTCOME_STATUSES = [
+    "success",
+    "failed",
+    "skipped",
+    "data",
+    "skipped_due_to_applicants",
+]
+
+
+def normalize_company(company: Optional[str]) -> str:
+    return (company or "").strip().lower()
+
+
+class OutcomeStore(ABC):
+    """
+    Append-only storage for job application outcomes (success, failed, skipped, ...).
+    Every backend must append in O(1) and answer lookups by link, company and
+    status without scanning all the records. Each one keeps its OutcomeIndex in
+    `index`, filled when the store is opened and on every append.
+    """
+
+    index: "OutcomeIndex"
+
+    @abstractmethod
+    def append(self, status: str, record: dict) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_link(self, link: str, status: Optional[str] = None) -> List[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_company(self, company: str, status: Optional[str] = None) -> List[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_status(self, status: str) -> List[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_records(self) -> Iterator[Tuple[str, dict]]:
+        """Yields (status, record) for every stored outcome, in insertion order per status."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesOutcomeStore(OutcomeStore):
+    """
+    Stores each status in its own `<status>.jsonl` file, one record per line.
+    Byte offsets of the records are indexed in memory when the store is opened,
+    so lookups only read the matching lines.
+    """
+
+    FILE_SUFFIX = ".jsonl"
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Positions are the byte offsets of the records in their status file
+        self.index = OutcomeIndex()
+        self._load_index()
+
+    def _file_path(self, status: str) -> Path:
+        return self.directory / f"{status}{self.FILE_SUFFIX}"
+
+    def _load_index(self) -> None:
+        for file_path in sorted(self.directory.glob(f"*{self.FILE_SUFFIX}")):
+            status = file_path.stem
+            offset = 0
+            with open(file_path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        try:
+                            self.index.add(status, json.loads(line), offset)
+                        except json.JSONDecodeError:
+                            logger.error(f"JSON decode error in file: {file_path} at offset {offset}")
+                    offset += len(line)
+        logger.debug(f"Outcome index loaded from {self.directory}: {len(self.index)} records")
+
+    def _read_at(self, status: str, offset: int) -> dict:
+        with open(self._file_path(status), "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def append(self, status: str, record: dict) -> None:
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            with open(self._file_path(status), "ab") as f:
+                offset = f.seek(0, 2)
+                f.write(line)
+            self.index.add(status, record, offset)
+        logger.debug(f"Outcome appended to {status}{self.FILE_SUFFIX}")
+
+    def find_by_link(self, link: str, status: Optional[str] = None) -> List[dict]:
+        # The index groups the variants of a canonical link, keep the exact matches only
+        records = (
+            self._read_at(record_status, offset)
+            for record_status, offset in self.index.link_positions(link, status)
+        )
+        return [record for record in records if record.get("link") == link]
+
+    def find_by_company(self, company: str, status: Optional[str] = None) -> List[dict]:
+        return [
+            self._read_at(record_status, offset)
+            for record_status, offset in self.index.company_positions(company, status)
+        ]
+
+    def find_by_status(self, status: str) -> List[dict]:
+        return [record for _, record in self._iter_status(status)]
+
+    def _iter_status(self, status: str) -> Iterator[Tuple[str, dict]]:
+        file_path = self._file_path(status)
+        if not file_path.exists():
+            return
+        with open(file_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield status, json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+    def iter_records(self) -> Iterator[Tuple[str, dict]]:
+        for status in self.index.statuses():
+            yield from self._iter_status(status)
+
+
+class SqliteOutcomeStore(OutcomeStore):
+    """
+    Stores outcomes in a single SQLite table with indexes on link, company and status.
+    The full record is kept as JSON so no field written by the manager is lost.
+    """
+
+    FILE_NAME = "outcomes.db"
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outcomes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                status TEXT NOT NULL,
+                link TEXT,
+                company TEXT,
+                timestamp TEXT,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_link ON outcomes (link)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_company ON outcomes (company)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_outcomes_status ON outcomes (status)")
+        self._connection.commit()
+        self.index = OutcomeIndex()
+        for status, record in self.iter_records():
+            self.index.add(status, record)
+        logger.debug(f"SQLite outcome store opened at {self.db_path} with {len(self.index)} records")
+
+    def append(self, status: str, record: dict) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO outcomes (status, link, company, timestamp, data) VALUES (?, ?, ?, ?, ?)",
+                (
+                    status,
+                    record.get("link"),
+                    normalize_company(record.get("company")),
+                    record.get("timestamp"),
+                    json.dumps(record, ensure_ascii=False),
+                ),
+            )
+            self._connection.commit()
+            self.index.add(status, record)
+        logger.debug(f"Outcome appended to {self.db_path} with status {status}")
+
+    def _select(self, where: str, args: tuple) -> List[dict]:
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT data FROM outcomes WHERE {where} ORDER BY id", args
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def find_by_link(self, link: str, status: Optional[str] = None) -> List[dict]:
+        if status is None:
+            return self._select("link = ?", (link,))
+        return self._select("link = ? AND status = ?", (link, status))
+
+    def find_by_company(self, company: str, status: Optional[str] = None) -> List[dict]:
+        if status is None:
+            return self._select("company = ?", (normalize_company(company),))
+        return self._select("company = ? AND status = ?", (normalize_company(company), status))
+
+    def find_by_status(self, status: str) -> List[dict]:
+        return self._select("status = ?", (status,))
+
+    def iter_records(self) -> Iterator[Tuple[str, dict]]:
+        with self._lock:
+            rows = self._connection.execute("SELECT status, data FROM outcomes ORDER BY id").fetchall()
+        for status, data in rows:
+            yield status, json.loads(data)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class OutcomeIndex:
+    """
+    In-memory positions of the stored outcomes per status, by canonical link and
+    by normalized company name. A position is whatever the store needs to read a
+    record back (a byte offset for JSON lines, nothing for SQLite), so the per-job
+    checks in AIHawkJobManager never touch the disk.
+    """
+
+    def __init__(self):
+        self._by_status: Dict[str, List[Any]] = {}
+        self._links: Dict[str, Dict[str, List[Any]]] = {}
+        self._companies: Dict[str, Dict[str, List[Any]]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(positions) for positions in self._by_status.values())
+
+    def add(self, status: str, record: dict, position: Any = None) -> None:
+        self._by_status.setdefault(status, []).append(position)
+        link = canonical_job_link(record.get("link"))
+        if link:
+            self._links.setdefault(status, {}).setdefault(link, []).append(position)
+        company = normalize_company(record.get("company"))
+        if company:
+            self._companies.setdefault(status, {}).setdefault(company, []).append(position)
+
+    def statuses(self) -> List[str]:
+        return list(self._by_status)
+
+    @staticmethod
+    def _positions(by_status: Dict[str, Dict[str, List[Any]]], key: str, status: Optional[str]) -> List[Tuple[str, Any]]:
+        statuses = list(by_status) if status is None else [status]
+        return [
+            (record_status, position)
+            for record_status in statuses
+            for position in by_status.get(record_status, {}).get(key, ())
+        ]
+
+    def link_positions(self, link: str, status: Optional[str] = None) -> List[Tuple[str, Any]]:
+        return self._positions(self._links, canonical_job_link(link), status)
+
+    def company_positions(self, company: str, status: Optional[str] = None) -> List[Tuple[str, Any]]:
+        return self._positions(self._companies, normalize_company(company), status)
+
+    def has_link(self, link: str, status: str) -> bool:
+        return canonical_job_link(link) in self._links.get(status, ())
+
+    def has_company(self, company: str, status: str) -> bool:
+        return normalize_company(company) in self._companies.get(status, ())
+
+
+def create_outcome_store(directory: Path, backend: Optional[str] = None) -> OutcomeStore:
+    backend = (backend or config.OUTCOME_STORE_BACKEND).lower()
+    if backend == OUTCOME_STORE_JSONL:
+        return JsonLinesOutcomeStore(directory)
+    if backend == OUTCOME_STORE_SQLITE:
+        return SqliteOutcomeStore(Path(directory) / SqliteOutcomeStore.FILE_NAME)
+    raise ValueError(f"Unknown outcome store backend: {backend}")
+
+
+def import_json_array(store: OutcomeStore, json_path: Path, status: str) -> int:
+    """
+    Appends every record of a legacy JSON array file (e.g. success.json) to the store.
+
+    Returns:
+        int: Number of records imported
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        try:
+            records = json.load(f)
+        except json.JSONDecodeError:
+            logger.error(f"JSON decode error in file: {json_path}, nothing imported")
+            return 0
+
+    if not isinstance(records, list):
+        logger.error(f"Expected a list of records in {json_path}, nothing imported")
+        return 0
+
+    for record in records:
+        store.append(status, record)
+    logger.info(f"Imported {len(records)} records from {json_path} as '{status}'")
+    return len(records)
+
+
+def migrate_legacy_json_logs(store: OutcomeStore, directory: Path) -> int:
+    """
+    One-time import of the legacy `<status>.json` arrays found in the output directory.
+    Imported files are renamed to `<status>.json.imported` so they are never imported twice.
+    """
+    imported = 0
+    for status in LEGACY_OUTCOME_STATUSES:
+        json_path = Path(directory) / f"{status}.json"
+        if not json_path.exists():
+            continue
+        imported += import_json_array(store, json_path, status)
+        json_path.rename(json_path.with_name(f"{json_path.name}.imported"))
+    return imported
@@ -21,4 +21,79 @@ def look_ahead_patterns(keyword_list):
             # Combine lookaheads with a pattern that allows flexible separators between the words
             pattern = "".join(lookaheads)  # Ensures all words are present            
             patterns.append(pattern)
-        return patterns
\ No newline at end of file
+        return patterns
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return set(_TOKEN.findall((text or "").casefold()))
+
+
+class KeywordMatcher:
+    """
+    Tells whether a text contains all the words of any of the terms, in any order,
+    as whole words and ignoring case, like the look_ahead_patterns regexes do.
+
+    Terms made of plain words are checked with set operations: the text is tokenized
+    once, and only the terms indexed under one of its tokens are compared, so the cost
+    per text does not grow with the number of terms. Terms with other characters
+    (e.g. "C++") fall back to a compiled lookahead regex.
+    """
+
+    def __init__(self, keyword_list):
+        self._by_token = {}
+        self._regexes = []
+        for term in keyword_list:
+            words = term.split()
+            if not words:
+                continue
+            if all(_TOKEN.fullmatch(word) for word in words):
+                required = frozenset(word.casefold() for word in words)
+                # Any of the required words will do as index key
+                self._by_token.setdefault(next(iter(required)), []).append((required, term))
+            else:
+                # Like look_ahead_patterns, with boundaries that also hold next to symbols
+                pattern = "".join(fr"(?=.*(?<!\w){re.escape(word)}(?!\w))" for word in words)
+                self._regexes.append((re.compile(pattern, re.IGNORECASE), term))
+
+    def __bool__(self):
+        return bool(self._by_token or self._regexes)
+
+    def search(self, text):
+        """Returns the first term whose words all appear in text, or None."""
+        if not text:
+            return None
+        tokens = tokenize(text)
+        for token in tokens:
+            for required, term in self._by_token.get(token, ()):
+                if required <= tokens:
+                    return term
+        for regex, term in self._regexes:
+            if regex.search(text):
+                return term
+        return None
+
+
+class BlacklistMatcher:
+    """Title, company and location blacklists compiled once, see KeywordMatcher."""
+
+    def __init__(self, title_blacklist=(), company_blacklist=(), location_blacklist=()):
+        self.title = KeywordMatcher(title_blacklist)
+        self.company = KeywordMatcher(company_blacklist)
+        self.location = KeywordMatcher(location_blacklist)
+
+    def search(self, title, company, location):
+        """Returns (field, term) of the first blacklist entry matching the job, or None."""
+        for field, matcher, text in (
+            ("title", self.title, title),
+            ("company", self.company, company),
+            ("location", self.location, location),
+        ):
+            term = matcher.search(text)
+            if term is not None:
+                return field, term
+        return None
+
+    def is_blacklisted(self, title, company, location):
+        return self.search(title, company, location) is not None
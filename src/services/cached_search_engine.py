@@ -0,0 +1,94 @@
+import hashlib
+import json
+from dataclasses import asdict
+from typing import Optional, Tuple
+
+import config
+from logger import logger
+from services.web_search_engine import (
+    PaginatedSearchResponse,
+    SearchResult,
+    UnifiedQuery,
+    WebSearchEngine,
+)
+from utils.sqlite_cache import SqliteLRUCache
+
+# Carries the date range of the query from build_query to search, never sent to the engine
+TIME_RANGE_PARAM = "_time_range"
+
+
+class CachedSearchEngine(WebSearchEngine):
+    """
+    Serves search result pages from a persistent cache before asking the wrapped engine.
+
+    Pages are keyed on the engine name, query, params and offset/limit, and expire after
+    the TTL configured for the date range of the query: results restricted to the last
+    24 hours go stale much sooner than results of the last month.
+    With `cache_only`, missing pages come back empty instead of being requested.
+    """
+
+    def __init__(self, engine: WebSearchEngine, cache: SqliteLRUCache, cache_only: bool = False):
+        # No session of its own, the wrapped engine does the requests
+        self.engine = engine
+        self.NAME = engine.NAME
+        self.cache = cache
+        self.cache_only = cache_only
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def DEFAULT_SEARCH_LIMIT(self) -> int:
+        return self.engine.DEFAULT_SEARCH_LIMIT
+
+    @property
+    def MAX_RESULTS(self) -> Optional[int]:
+        return self.engine.MAX_RESULTS
+
+    @property
+    def MAX_QUERY_LENGTH(self) -> int:
+        return self.engine.MAX_QUERY_LENGTH
+
+    def build_query(self, query: UnifiedQuery) -> Tuple[str, dict]:
+        final_query, params = self.engine.build_query(query)
+        params[TIME_RANGE_PARAM] = query.date_range.value if query.date_range else None
+        return final_query, params
+
+    def cache_key(self, query: str, params: dict, offset: int, limit: Optional[int]) -> str:
+        payload = json.dumps(
+            {"engine": self.NAME, "query": query, "params": params, "offset": offset, "limit": limit},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def search(self, query: str, params: dict = {}, offset: int = 0, limit: Optional[int] = None) -> PaginatedSearchResponse:
+        if limit is None:
+            limit = self.DEFAULT_SEARCH_LIMIT
+        params = dict(params)
+        time_range = params.pop(TIME_RANGE_PARAM, None)
+        key = self.cache_key(query, params, offset, limit)
+
+        cached = self.cache.get(key, max_age=config.SEARCH_CACHE_TTL_SECONDS.get(time_range))
+        if cached is not None:
+            self.hits += 1
+            logger.debug(f"Search cache hit for '{query}' at offset {offset}")
+            return self._from_json(cached)
+
+        self.misses += 1
+        if self.cache_only:
+            logger.warning(f"Search cache only: no cached results for '{query}' at offset {offset}")
+            return PaginatedSearchResponse(engine_name=self.NAME, offset=offset, limit=limit)
+
+        # Engines add their credentials to the params they are given, keep them out of the key
+        response = self.engine.search(query, dict(params), offset=offset, limit=limit)
+        self.cache.set(key, asdict(response))
+        return response
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.cache)}
+
+    @staticmethod
+    def _from_json(data: dict) -> PaginatedSearchResponse:
+        data = dict(data)
+        data["results"] = [SearchResult(**result) for result in data.get("results", [])]
+        return PaginatedSearchResponse(**data)
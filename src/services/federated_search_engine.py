@@ -0,0 +1,258 @@
+import json
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import config
+from constants import FEDERATED
+from logger import logger
+from services.web_search_engine import (
+    PaginatedSearchResponse,
+    SearchQueryBuilder,
+    SearchResult,
+    UnifiedQuery,
+    WebSearchEngine,
+)
+from utils.url_utils import canonical_job_link
+
+# Key of the per-engine (query, params) pairs in the params built by FederatedSearchEngine.build_query
+ENGINE_QUERIES = "engine_queries"
+LATENCY_SMOOTHING = 0.3
+
+
+class SearchQuota:
+    """
+    Requests made to each engine today, checked against its daily quota. The counts are
+    kept in a small JSON file so the budget holds across runs, and reset when the day changes.
+    """
+
+    def __init__(
+        self,
+        daily_limits: Dict[str, int],
+        file_path: Optional[Path] = None,
+        today: Callable[[], date] = date.today,
+    ):
+        self.daily_limits = daily_limits
+        self.file_path = Path(file_path) if file_path else None
+        self._today = today
+        self._lock = threading.Lock()
+        self._day = today().isoformat()
+        self._used: Dict[str, int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if self.file_path is None or not self.file_path.exists():
+            return
+        try:
+            data = json.loads(self.file_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable search quota file {self.file_path}: {e}")
+            return
+        if data.get("day") == self._day:
+            self._used = dict(data.get("used", {}))
+
+    def _save(self) -> None:
+        if self.file_path is None:
+            return
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file_path.write_text(json.dumps({"day": self._day, "used": self._used}), encoding="utf-8")
+
+    def _roll_over(self) -> None:
+        today = self._today().isoformat()
+        if today != self._day:
+            self._day = today
+            self._used = {}
+
+    def remaining(self, engine_name: str) -> Optional[int]:
+        """None when the engine has no quota configured."""
+        limit = self.daily_limits.get(engine_name)
+        if limit is None:
+            return None
+        with self._lock:
+            self._roll_over()
+            return max(0, limit - self._used.get(engine_name, 0))
+
+    def consume(self, engine_name: str) -> bool:
+        """Counts one request, returns False (counting nothing) when the quota is exhausted."""
+        with self._lock:
+            self._roll_over()
+            limit = self.daily_limits.get(engine_name)
+            used = self._used.get(engine_name, 0)
+            if limit is not None and used >= limit:
+                return False
+            self._used[engine_name] = used + 1
+            self._save()
+            return True
+
+
+@dataclass
+class EngineStats:
+    latency: Optional[float] = None  # exponentially weighted moving average, seconds
+    failure_rate: float = 0.0  # exponentially weighted moving average of failed requests
+    requests: int = 0
+    failures: int = 0
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        self.requests += 1
+        if self.requests == 1:
+            self.failure_rate = float(failed)
+        else:
+            self.failure_rate += LATENCY_SMOOTHING * (float(failed) - self.failure_rate)
+        if failed:
+            self.failures += 1
+            return
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += LATENCY_SMOOTHING * (seconds - self.latency)
+
+    def expected_latency(self) -> float:
+        """Seconds to a successful answer, counting retries: 0 for untried engines, inf for failing ones."""
+        if self.requests == 0:
+            return 0.0
+        if self.latency is None or self.failure_rate >= 1.0:
+            return math.inf
+        return self.latency / (1.0 - self.failure_rate)
+
+
+class FederatedSearchEngine(WebSearchEngine):
+    """
+    Searches several engines at once and merges their results by canonical job link.
+
+    Each page goes to the `fan_out` engines with the lowest observed latency, weighted by their
+    failure rate, that are still under their daily quota (engines not tried yet go first). An engine
+    that fails, or is slower than `hedge_after` seconds, is backed up by the next one in line;
+    the page is returned as soon as `fan_out` engines answered.
+    """
+    NAME = FEDERATED
+
+    def __init__(
+        self,
+        engines: List[WebSearchEngine],
+        quota: Optional[SearchQuota] = None,
+        fan_out: Optional[int] = None,
+        hedge_after: Optional[float] = None,
+    ):
+        # No session of its own, the member engines do the requests
+        if not engines:
+            raise ValueError("FederatedSearchEngine needs at least one engine")
+        self.engines = engines
+        self.quota = quota or SearchQuota({})
+        self.fan_out = fan_out or config.SEARCH_FEDERATION_FAN_OUT
+        self.hedge_after = config.SEARCH_HEDGE_AFTER_SECONDS if hedge_after is None else hedge_after
+        self.stats: Dict[str, EngineStats] = {engine.NAME: EngineStats() for engine in engines}
+        self._lock = threading.Lock()
+
+    @property
+    def DEFAULT_SEARCH_LIMIT(self) -> int:
+        # Every engine must be able to serve a full page
+        return min(engine.DEFAULT_SEARCH_LIMIT for engine in self.engines)
+
+    @property
+    def MAX_RESULTS(self) -> Optional[int]:
+        # Deeper pages are served by the engines without a lower cap
+        caps = [engine.MAX_RESULTS for engine in self.engines]
+        return None if None in caps else max(caps)
+
+    @property
+    def MAX_QUERY_LENGTH(self) -> int:
+        return min(engine.MAX_QUERY_LENGTH for engine in self.engines)
+
+    def build_query(self, query: UnifiedQuery) -> Tuple[str, dict]:
+        """Builds each engine's own query, search() picks the one of the engine it calls."""
+        return SearchQueryBuilder.build_final_query_string(query), {
+            ENGINE_QUERIES: {engine.NAME: engine.build_query(query) for engine in self.engines}
+        }
+
+    def ranked_engines(self) -> List[WebSearchEngine]:
+        available = [engine for engine in self.engines if self.quota.remaining(engine.NAME) != 0]
+        with self._lock:
+            latencies = {name: stats.expected_latency() for name, stats in self.stats.items()}
+        # sorted() is stable, so engines with equal latency keep the configured order
+        return sorted(available, key=lambda engine: latencies[engine.NAME])
+
+    def search(self, query: str, params: dict = {}, offset: int = 0, limit: Optional[int] = None) -> PaginatedSearchResponse:
+        if limit is None:
+            limit = self.DEFAULT_SEARCH_LIMIT
+        engine_queries = params.get(ENGINE_QUERIES, {})
+        candidates = [
+            engine for engine in self.ranked_engines()
+            if engine.MAX_RESULTS is None or offset + limit <= engine.MAX_RESULTS
+        ]
+        if not candidates:
+            logger.warning(f"No search engine left with quota and results past offset {offset}")
+            return PaginatedSearchResponse(engine_name=self.NAME, offset=offset, limit=limit)
+
+        responses: List[Tuple[WebSearchEngine, PaginatedSearchResponse]] = []
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        pending = {}
+
+        def launch() -> None:
+            while candidates:
+                engine = candidates.pop(0)
+                engine_query, engine_params = engine_queries.get(engine.NAME, (query, {}))
+                if self.quota.consume(engine.NAME):
+                    future = executor.submit(self._search_engine, engine, engine_query, dict(engine_params), offset, limit)
+                    pending[future] = engine
+                    return
+
+        try:
+            for _ in range(self.fan_out):
+                launch()
+            while pending and len(responses) < self.fan_out:
+                done, _ = wait(pending, timeout=self.hedge_after or None, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.debug(f"Hedging slow search engines {[engine.NAME for engine in pending.values()]}")
+                    launch()
+                    continue
+                for future in done:
+                    engine = pending.pop(future)
+                    try:
+                        responses.append((engine, future.result()))
+                    except Exception as e:
+                        logger.warning(f"Search engine {engine.NAME} failed, trying the next one: {e}")
+                        launch()
+        finally:
+            # Stragglers finish in the background, they still update the latency stats
+            executor.shutdown(wait=False)
+
+        if not responses:
+            raise RuntimeError(f"All search engines failed for query '{query}'")
+        return self._merge(responses, offset, limit)
+
+    def _search_engine(self, engine: WebSearchEngine, query: str, params: dict, offset: int, limit: int) -> PaginatedSearchResponse:
+        started = time.monotonic()
+        try:
+            response = engine.search(query, params, offset=offset, limit=limit)
+        except Exception:
+            self._record(engine, time.monotonic() - started, failed=True)
+            raise
+        self._record(engine, time.monotonic() - started)
+        return response
+
+    def _record(self, engine: WebSearchEngine, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self.stats[engine.NAME].record(seconds, failed)
+
+    def _merge(
+        self, responses: List[Tuple[WebSearchEngine, PaginatedSearchResponse]], offset: int, limit: int
+    ) -> PaginatedSearchResponse:
+        # Merge in the configured engine order, not in order of arrival, so pages are reproducible
+        responses = [response for _, response in sorted(responses, key=lambda pair: self.engines.index(pair[0]))]
+        results: Dict[str, SearchResult] = {}
+        for response in responses:
+            for result in response.results:
+                results.setdefault(canonical_job_link(result.link), result)
+        totals = [response.total_results for response in responses if response.total_results is not None]
+        return PaginatedSearchResponse(
+            results=list(results.values()),
+            engine_name="+".join(response.engine_name for response in responses),
+            offset=offset,
+            limit=limit,
+            total_results=max(totals) if totals else None,
+        )
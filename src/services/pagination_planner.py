@@ -0,0 +1,81 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Set
+
+import config
+from logger import logger
+from services.web_search_engine import PaginatedSearchResponse
+from utils.url_utils import canonical_job_link
+
+
+@dataclass
+class QueryProgress:
+    next_offset: int = 0
+    # Last offset worth requesting, from the engine's cap and the reported total_results
+    end_offset: Optional[int] = None
+    unproductive_pages: int = 0
+    exhausted: bool = False
+    seen_links: Set[str] = field(default_factory=set)
+
+
+class PaginationPlanner:
+    """
+    Decides, per query, whether requesting the next page of search results is worth it.
+
+    A query is done once the next offset passes the engine's result cap or the
+    `total_results` it reported, once a page comes back short, or once
+    `max_unproductive_pages` consecutive pages brought no new candidate link
+    (all of them already seen on an earlier page of the query or rejected by the caller).
+    Requesting the first page again restarts the query from scratch.
+    Pages of different queries can be recorded from several threads.
+    """
+
+    def __init__(self, max_results: Optional[int] = None, max_unproductive_pages: Optional[int] = None):
+        self.max_results = max_results
+        self.max_unproductive_pages = max_unproductive_pages or config.SEARCH_MAX_UNPRODUCTIVE_PAGES
+        self._queries: Dict[str, QueryProgress] = {}
+        self._lock = threading.Lock()
+
+    def record_page(self, query: str, response: PaginatedSearchResponse, candidate_links: Iterable[str]) -> int:
+        """
+        Records a fetched page. `candidate_links` are the links of the page the caller
+        would still act on; those not seen before on this query make the page productive.
+
+        Returns:
+            int: Number of new candidate links on the page
+        """
+        with self._lock:
+            if response.offset == 0:
+                # A new run of the search, whatever the previous run concluded
+                self._queries[query] = QueryProgress()
+            progress = self._queries.setdefault(query, QueryProgress())
+            progress.next_offset = max(progress.next_offset, response.offset + response.limit)
+
+            end_offsets = [end for end in (self.max_results, response.total_results) if end is not None]
+            if end_offsets:
+                progress.end_offset = min(end_offsets)
+
+            new_links = {canonical_job_link(link) for link in candidate_links} - progress.seen_links
+            progress.seen_links.update(new_links)
+            if new_links:
+                progress.unproductive_pages = 0
+            else:
+                progress.unproductive_pages += 1
+
+            if len(response.results) < response.limit:
+                self._stop(query, progress, "short page")
+            elif progress.end_offset is not None and progress.next_offset >= progress.end_offset:
+                self._stop(query, progress, f"no results past offset {progress.end_offset}")
+            elif progress.unproductive_pages >= self.max_unproductive_pages:
+                self._stop(query, progress, f"{progress.unproductive_pages} pages without new jobs")
+            return len(new_links)
+
+    def has_next_page(self, query: str) -> bool:
+        with self._lock:
+            progress = self._queries.get(query)
+            return progress is None or not progress.exhausted
+
+    @staticmethod
+    def _stop(query: str, progress: QueryProgress, reason: str) -> None:
+        progress.exhausted = True
+        logger.debug(f"Stopping pagination of '{query}': {reason}")
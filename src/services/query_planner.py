@@ -0,0 +1,58 @@
+import re
+from typing import List, Optional, Sequence
+
+from utils.string_utils import is_multi_word
+
+_WORDS = re.compile(r"[a-z0-9+#]+")
+
+
+def or_group(terms: Sequence[str]) -> str:
+    """
+    Joins search terms into one OR group, e.g. ((data engineer) OR (analytics engineer)).
+    Multi-word terms are parenthesized, not quoted, so each alternative matches what the
+    term's own unbatched search matches. A single term is returned as is.
+    """
+    if len(terms) == 1:
+        return terms[0]
+    return "(" + " OR ".join(f"({term})" if is_multi_word(term) else term for term in terms) + ")"
+
+
+def pack_terms(terms: Sequence[str], budget: int, max_terms: Optional[int] = None) -> List[List[str]]:
+    """
+    Packs terms, in order, into as few OR groups as possible where each group is at most
+    `budget` characters long and holds at most `max_terms` terms. A term that does not
+    fit any budget on its own still gets a group of its own.
+    """
+    groups: List[List[str]] = []
+    for term in terms:
+        if groups:
+            candidate = groups[-1] + [term]
+            if (max_terms is None or len(candidate) <= max_terms) and len(or_group(candidate)) <= budget:
+                groups[-1] = candidate
+                continue
+        groups.append([term])
+    return groups
+
+
+def _words(text: str) -> List[str]:
+    return _WORDS.findall((text or "").lower())
+
+
+def match_position(title: str, positions: Sequence[str]) -> Optional[str]:
+    """
+    Attributes a job title to the position it most likely answers: preferably the
+    longest position whose words all appear in the title, otherwise the position
+    sharing the largest fraction of its words with the title. None if nothing matches.
+    """
+    title_words = set(_words(title))
+    best, best_score = None, 0.0
+    for position in positions:
+        position_words = _words(position)
+        if not position_words:
+            continue
+        shared = sum(1 for word in position_words if word in title_words) / len(position_words)
+        # Full matches always beat partial ones, longer full matches beat shorter ones
+        score = len(position_words) + 1 if shared == 1 else shared
+        if score > best_score:
+            best, best_score = position, score
+    return best
@@ -7,7 +7,11 @@ from abc import ABC, abstractmethod
 
 import config as config
 from config import ALLOWED_SEARCH_ENGINES, GOOGLE, BING, BRAVE
+from constants import FEDERATED
 from logger import logger
+from utils.http_utils import create_session
+from utils.rate_limiter import RateLimiter
+from utils.sqlite_cache import SqliteLRUCache
 from utils.string_utils import is_multi_word
 
 @dataclass
@@ -62,6 +66,24 @@ class UnifiedQuery:
 
 
 class WebSearchEngine(ABC):
+    NAME: str = ""
+    # Deepest result the engine serves for a query, whatever its total_results says (None for no cap)
+    MAX_RESULTS: Optional[int] = None
+    # Longest query string the engine accepts
+    MAX_QUERY_LENGTH: int = 2048
+
+    def __init__(self, session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None):
+        # One pooled session per engine, so consecutive pages reuse the same connections
+        self.session = session or create_session()
+        # Shared by every thread searching with this engine
+        if rate_limiter is None and config.SEARCH_ENGINE_RATE_LIMITS.get(self.NAME):
+            rate_limiter = RateLimiter(config.SEARCH_ENGINE_RATE_LIMITS[self.NAME])
+        self.rate_limiter = rate_limiter
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self.session.get(url, timeout=config.HTTP_TIMEOUT_SECONDS, **kwargs)
 
     @property
     @abstractmethod
@@ -205,12 +227,16 @@ class SearchQueryBuilder:
 
 
 class GoogleSearchEngine(WebSearchEngine):
+    NAME = GOOGLE
+    # The Custom Search JSON API rejects start + num > 100
+    MAX_RESULTS = 100
     GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
     @property
     def DEFAULT_SEARCH_LIMIT(self) -> int:
         return 10
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None):
+        super().__init__(session, rate_limiter)
         self.api_key = config.GOOGLE_API_KEY
         self.search_engine_id = config.GOOGLE_SEARCH_ENGINE_ID
 
@@ -231,7 +257,7 @@ class GoogleSearchEngine(WebSearchEngine):
             "num": limit
         })
 
-        response = requests.get(self.GOOGLE_SEARCH_URL, params=params)
+        response = self._get(self.GOOGLE_SEARCH_URL, params=params)
         response.raise_for_status()
         return self._parse_response(response.json(), offset, limit)
 
@@ -294,12 +320,15 @@ class GoogleSearchEngine(WebSearchEngine):
 
 
 class BingSearchEngine(WebSearchEngine):
+    NAME = BING
+    MAX_QUERY_LENGTH = 1500
     BING_SEARCH_URL = "https://api.bing.microsoft.com/v7.0/search"
     @property
     def DEFAULT_SEARCH_LIMIT(self) -> int:
         return 50
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None):
+        super().__init__(session, rate_limiter)
         self.api_key = config.BING_API_KEY
 
     def search(self, query: str, params: dict = {}, offset: int = 0, limit: Optional[int] = None) -> PaginatedSearchResponse:
@@ -316,7 +345,7 @@ class BingSearchEngine(WebSearchEngine):
             "count": limit
         })
 
-        response = requests.get(self.BING_SEARCH_URL, headers=headers, params=params)
+        response = self._get(self.BING_SEARCH_URL, headers=headers, params=params)
         response.raise_for_status()
         return self._parse_response(response.json(), offset, limit)
 
@@ -375,12 +404,17 @@ class BingSearchEngine(WebSearchEngine):
 
 
 class BraveSearchEngine(WebSearchEngine):
+    NAME = BRAVE
+    # Brave accepts offsets up to 9 pages
+    MAX_RESULTS = 200
+    MAX_QUERY_LENGTH = 400
     BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
     @property
     def DEFAULT_SEARCH_LIMIT(self) -> int:
         return 20
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, rate_limiter: Optional[RateLimiter] = None):
+        super().__init__(session, rate_limiter)
         self.api_key = config.BRAVE_API_KEY
 
     def search(self, query: str, params: dict = {}, offset: int = 0, limit: Optional[int] = None) -> PaginatedSearchResponse:
@@ -396,7 +430,7 @@ class BraveSearchEngine(WebSearchEngine):
             "limit": limit
         })
 
-        response = requests.get(self.BRAVE_SEARCH_URL, headers=headers, params=params)
+        response = self._get(self.BRAVE_SEARCH_URL, headers=headers, params=params)
         response.raise_for_status()
         return self._parse_response(response.json(), offset, limit)
 
@@ -454,16 +488,30 @@ class BraveSearchEngine(WebSearchEngine):
 
 
 class WebSearchEngineFactory:
+    # Engines handed out, wrapped in CachedSearchEngine when a search cache is set
     _instances: Dict[str, WebSearchEngine] = {}
+    # Engines doing the actual requests, shared by the cached and federated wrappers
+    _engines: Dict[str, WebSearchEngine] = {}
+    _search_cache: Optional[SqliteLRUCache] = None
+    _cache_only: bool = False
+
+    @staticmethod
+    def set_search_cache(cache: Optional[SqliteLRUCache], cache_only: bool = False) -> None:
+        """Engines returned from now on serve result pages from `cache` first (None to disable)."""
+        WebSearchEngineFactory._search_cache = cache
+        WebSearchEngineFactory._cache_only = cache_only
+        WebSearchEngineFactory._instances.clear()
 
     @staticmethod
     def get_search_engine(engine_name: Optional[str] = None) -> WebSearchEngine:
         if engine_name is None:
-            # For now, just pick the first allowed search engine
-            engine_name = ALLOWED_SEARCH_ENGINES[0]
+            if config.FEDERATED_SEARCH and len(ALLOWED_SEARCH_ENGINES) > 1:
+                engine_name = FEDERATED
+            else:
+                engine_name = ALLOWED_SEARCH_ENGINES[0]
 
         engine_name = engine_name.lower()
-        if engine_name not in ALLOWED_SEARCH_ENGINES:
+        if engine_name != FEDERATED and engine_name not in ALLOWED_SEARCH_ENGINES:
             raise ValueError(
                 f"Search engine '{engine_name}' is not allowed. "
                 f"Allowed engines: {ALLOWED_SEARCH_ENGINES}"
@@ -472,14 +520,39 @@ class WebSearchEngineFactory:
         if engine_name in WebSearchEngineFactory._instances:
             return WebSearchEngineFactory._instances[engine_name]
 
+        instance = WebSearchEngineFactory._create_search_engine(engine_name)
+        if WebSearchEngineFactory._search_cache is not None:
+            # Imported here, cached_search_engine builds on this module
+            from services.cached_search_engine import CachedSearchEngine
+
+            instance = CachedSearchEngine(
+                instance, WebSearchEngineFactory._search_cache, WebSearchEngineFactory._cache_only
+            )
+
+        WebSearchEngineFactory._instances[engine_name] = instance
+        return instance
+
+    @staticmethod
+    def _create_search_engine(engine_name: str) -> WebSearchEngine:
+        if engine_name in WebSearchEngineFactory._engines:
+            return WebSearchEngineFactory._engines[engine_name]
+
         if engine_name == GOOGLE:
             instance = GoogleSearchEngine()
         elif engine_name == BING:
             instance = BingSearchEngine()
         elif engine_name == BRAVE:
             instance = BraveSearchEngine()
+        elif engine_name == FEDERATED:
+            # Imported here, federated_search_engine builds on this module
+            from services.federated_search_engine import FederatedSearchEngine, SearchQuota
+
+            instance = FederatedSearchEngine(
+                [WebSearchEngineFactory._create_search_engine(name) for name in ALLOWED_SEARCH_ENGINES],
+                SearchQuota(config.SEARCH_ENGINE_DAILY_QUOTAS, config.SEARCH_QUOTA_FILE),
+            )
         else:
             raise ValueError(f"Unknown search engine: {engine_name}")
 
-        WebSearchEngineFactory._instances[engine_name] = instance
+        WebSearchEngineFactory._engines[engine_name] = instance
         return instance
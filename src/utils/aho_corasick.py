@@ -0,0 +1,81 @@
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+class AhoCorasick:
+    """
+    Multi-keyword matcher: the automaton is built once from the keywords, then every
+    occurrence of every keyword in a text is found in a single pass over it,
+    whatever the number of keywords. Matching ignores case.
+
+    With `whole_words`, a match only counts when it is not glued to a letter or digit
+    on either side, e.g. "java" does not match in "javascript".
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False):
+        self.whole_words = whole_words
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # (keyword, length) of the keywords ending at each state, including those via fail links
+        self._output: List[List[Tuple[str, int]]] = [[]]
+        self.keywords: List[str] = []
+        for keyword in keywords:
+            if keyword and keyword.strip():
+                self._add(keyword)
+        self._build_fail_links()
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def _add(self, keyword: str) -> None:
+        self.keywords.append(keyword)
+        state = 0
+        for char in keyword.casefold():
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((keyword, len(keyword.casefold())))
+
+    def _build_fail_links(self) -> None:
+        # Children of the root fail to the root, deeper states are linked breadth first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, str]]:
+        """Yields (start, keyword) for every occurrence, in order of where they end."""
+        text = (text or "").casefold()
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for keyword, length in self._output[state]:
+                start = end - length
+                if self.whole_words and not self._at_word_boundaries(text, start, end):
+                    continue
+                yield start, keyword
+
+    def find_all(self, text: str) -> List[str]:
+        """Distinct keywords found in text, in order of first occurrence."""
+        found: Dict[str, int] = {}
+        for start, keyword in self.iter_matches(text):
+            if keyword not in found or start < found[keyword]:
+                found[keyword] = start
+        return sorted(found, key=found.get)
+
+    @staticmethod
+    def _at_word_boundaries(text: str, start: int, end: int) -> bool:
+        return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
@@ -1,7 +1,9 @@
+from contextlib import contextmanager
 from gc import callbacks
 import random
+import threading
 import time
-from typing import Optional
+from typing import Iterator, Optional
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 from selenium import webdriver
@@ -12,6 +14,8 @@ import constants
 
 # Module-level variable to store the default driver, make sure your imports are exactly same when you are using this
 __DEFAULT_DRIVER: Optional[webdriver.Chrome] = None
+# Driver of the application worker running on the current thread, takes precedence over the default one
+_worker_context = threading.local()
 
 
 def set_default_driver(driver: webdriver.Chrome):
@@ -24,13 +28,30 @@ def set_default_driver(driver: webdriver.Chrome):
     logger.debug("Default driver has been set for browser_utils.")
 
 
+@contextmanager
+def use_driver(driver: webdriver.Chrome) -> Iterator[webdriver.Chrome]:
+    """
+    Makes `driver` the one used by the functions of this module called from the
+    current thread without an explicit driver, until the block exits.
+    """
+    previous = getattr(_worker_context, "driver", None)
+    _worker_context.driver = driver
+    try:
+        yield driver
+    finally:
+        _worker_context.driver = previous
+
+
 def _get_driver(driver: Optional[webdriver.Chrome]) -> webdriver.Chrome:
     """
     Internal helper to either return the provided driver or fall back
-    to the stored default driver if none is provided.
+    to the current thread's driver, then to the stored default driver.
     """
     if driver is not None:
         return driver
+    worker_driver = getattr(_worker_context, "driver", None)
+    if worker_driver is not None:
+        return worker_driver
     if __DEFAULT_DRIVER is not None:
         return __DEFAULT_DRIVER
     raise RuntimeError(
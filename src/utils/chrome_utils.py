@@ -1,24 +1,36 @@
 import os
+from typing import Optional
 from loguru import logger
 from selenium import webdriver
 import undetected_chromedriver as uc
 
 chromeProfilePath = os.path.join(os.getcwd(), "chrome_profile", "linkedin_profile")
 
-def ensure_chrome_profile():
-    logger.debug(f"Ensuring Chrome profile exists at path: {chromeProfilePath}")
-    profile_dir = os.path.dirname(chromeProfilePath)
+def worker_profile_path(worker_index: int) -> str:
+    """
+    Chrome locks its user data directory, so every browser of the driver pool needs its own:
+    worker 0 keeps chromeProfilePath, worker N gets the same profile name under chrome_profile_worker_N
+    """
+    if worker_index == 0:
+        return chromeProfilePath
+    user_data_dir = f"{os.path.dirname(chromeProfilePath)}_worker_{worker_index}"
+    return os.path.join(user_data_dir, os.path.basename(chromeProfilePath))
+
+def ensure_chrome_profile(profile_path: Optional[str] = None):
+    profile_path = profile_path or chromeProfilePath
+    logger.debug(f"Ensuring Chrome profile exists at path: {profile_path}")
+    profile_dir = os.path.dirname(profile_path)
     if not os.path.exists(profile_dir):
         os.makedirs(profile_dir)
         logger.debug(f"Created directory for Chrome profile: {profile_dir}")
-    if not os.path.exists(chromeProfilePath):
-        os.makedirs(chromeProfilePath)
-        logger.debug(f"Created Chrome profile directory: {chromeProfilePath}")
-    return chromeProfilePath
+    if not os.path.exists(profile_path):
+        os.makedirs(profile_path)
+        logger.debug(f"Created Chrome profile directory: {profile_path}")
+    return profile_path
 
-def chrome_browser_options():
+def chrome_browser_options(worker_index: int = 0):
     logger.debug("Setting Chrome browser options")
-    ensure_chrome_profile()
+    profile_path = ensure_chrome_profile(worker_profile_path(worker_index))
     options = uc.ChromeOptions()
     
     # Essential arguments only
@@ -26,12 +38,10 @@ def chrome_browser_options():
     options.add_argument("--disable-dev-shm-usage")
     
     # Profile configuration
-    if chromeProfilePath:
-        options.add_argument(f'--user-data-dir={os.path.dirname(chromeProfilePath)}')
-        options.add_argument(f'--profile-directory={os.path.basename(chromeProfilePath)}')
+    if profile_path:
+        options.add_argument(f'--user-data-dir={os.path.dirname(profile_path)}')
+        options.add_argument(f'--profile-directory={os.path.basename(profile_path)}')
     else:
         options.add_argument("--incognito")
     
     return options
-
-
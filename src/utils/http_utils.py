@@ -0,0 +1,36 @@
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    pool_size: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+) -> requests.Session:
+    """
+    Returns a requests Session keeping up to `pool_size` keep-alive connections per host.
+    Idempotent requests failing with 429/5xx or a connection error are retried with
+    exponential backoff, waiting for the server's Retry-After header when it sends one.
+    """
+    pool_size = pool_size or config.HTTP_POOL_SIZE
+    retry = Retry(
+        total=config.HTTP_MAX_RETRIES if max_retries is None else max_retries,
+        backoff_factor=config.HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        # Return the last response so callers' raise_for_status reports the real status
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
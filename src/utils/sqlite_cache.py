@@ -0,0 +1,105 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from logger import logger
+
+
+class SqliteLRUCache:
+    """
+    Persistent key/value cache in a single SQLite file, bounded to `max_entries`.
+    Values are stored as JSON. Every read or write bumps the entry's access
+    sequence; once the cache is full the least recently used entries are evicted.
+    With `ttl_seconds`, entries older than that are treated as missing and dropped;
+    `get` can tighten the limit per lookup with `max_age`.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 1000, ttl_seconds: Optional[float] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                last_access INTEGER NOT NULL,
+                created_at REAL NOT NULL DEFAULT 0
+            )
+            """
+        )
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(cache)")]
+        if "created_at" not in columns:
+            self._connection.execute("ALTER TABLE cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache (last_access)")
+        self._connection.commit()
+        count, last_access = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(MAX(last_access), 0) FROM cache"
+        ).fetchone()
+        self._count = count
+        self._sequence = last_access
+        logger.debug(f"SQLite cache opened at {self.db_path} with {count} entries")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _next_sequence(self) -> int:
+        self._sequence += 1
+        return self._sequence
+
+    def get(self, key: str, default: Any = None, max_age: Optional[float] = None) -> Any:
+        ttl_seconds = self.ttl_seconds if max_age is None else max_age
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            if ttl_seconds is not None and time.time() - row[1] > ttl_seconds:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._connection.commit()
+                self._count -= 1
+                return default
+            self._connection.execute(
+                "UPDATE cache SET last_access = ? WHERE key = ?", (self._next_sequence(), key)
+            )
+            self._connection.commit()
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            exists = self._connection.execute("SELECT 1 FROM cache WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, last_access, created_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), self._next_sequence(), time.time()),
+            )
+            if not exists:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict(self._count - self.max_entries)
+            self._connection.commit()
+
+    def _evict(self, count: int) -> None:
+        self._connection.execute(
+            "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY last_access LIMIT ?)",
+            (count,),
+        )
+        self._count -= count
+        logger.debug(f"Evicted {count} least recently used entries from {self.db_path}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM cache")
+            self._connection.commit()
+            self._count = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
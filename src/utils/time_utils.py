@@ -1,12 +1,24 @@
 import random
 import time
 
+import config
+
+def human_jitter_enabled() -> bool:
+    """Whether to pause like a human around browser actions, see FAST_MODE and HUMAN_JITTER."""
+    if config.HUMAN_JITTER is None:
+        return not config.FAST_MODE
+    return config.HUMAN_JITTER
+
+def _jitter(low: float, high: float) -> None:
+    if human_jitter_enabled():
+        time.sleep(random.uniform(low, high))
+
 def tiny_sleep() -> None:
-    time.sleep(random.uniform(0.5, 1.2))
+    _jitter(0.5, 1.2)
 
 def short_sleep() -> None:
-    time.sleep(random.uniform(1.2, 3))
+    _jitter(1.2, 3)
 
 
 def medium_sleep() -> None:
-    time.sleep(random.uniform(3, 5))
\ No newline at end of file
+    _jitter(3, 5)
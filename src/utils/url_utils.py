@@ -0,0 +1,60 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Regional Lever hosts serve the same postings as jobs.lever.co
+LEVER_HOST = "jobs.lever.co"
+LEVER_HOST_ALIASES = {"jobs.eu.lever.co": LEVER_HOST}
+# Query parameters that only track where a visit came from
+TRACKING_PARAM_PREFIXES = ("utm_", "lever-")
+TRACKING_PARAMS = {"gh_src", "ref", "source", "src", "trk", "fbclid", "gclid"}
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def normalize_job_url(link: str) -> str:
+    """
+    Cleans up a job link while keeping it navigable: https scheme, lower case,
+    no fragment, no tracking parameters, no trailing slash or '/apply' suffix.
+    Lever postings take no query parameters at all, so theirs are dropped, e.g.
+    'HTTP://jobs.eu.lever.co/Acme/123/apply/?lever-source=LinkedIn' -> 'https://jobs.eu.lever.co/acme/123'
+    """
+    link = (link or "").strip()
+    if not link:
+        return ""
+    if "://" not in link:
+        link = "https://" + link
+
+    parts = urlsplit(link.lower())
+    host = parts.hostname or ""
+    if host.startswith("www."):
+        host = host[len("www."):]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path.rstrip("/")
+    if path.endswith("/apply"):
+        path = path[: -len("/apply")]
+
+    if host == LEVER_HOST or host in LEVER_HOST_ALIASES:
+        query = ""
+    else:
+        query = urlencode([(name, value) for name, value in parse_qsl(parts.query) if not _is_tracking_param(name)])
+
+    scheme = "https" if parts.scheme in ("http", "https") else parts.scheme
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def canonical_job_link(link: str) -> str:
+    """
+    Normalizes a job link so the same posting always maps to the same key, whatever
+    engine, region or tracking link it was found through,
+    e.g. 'https://jobs.eu.lever.co/Acme/123/apply/?lever-source=x' -> 'https://jobs.lever.co/acme/123'
+    """
+    canonical = normalize_job_url(link)
+    if not canonical:
+        return ""
+    parts = urlsplit(canonical)
+    host = LEVER_HOST_ALIASES.get(parts.hostname or "", parts.netloc)
+    return urlunsplit((parts.scheme, host, parts.path, parts.query, ""))
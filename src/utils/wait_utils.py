@@ -0,0 +1,106 @@
+import time
+from typing import Callable, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
+
+import config
+from logger import logger
+
+# Counts the XHR/fetch requests in flight and when the network was last active, from hooks installed in
+# the page on the first call. A PerformanceObserver sees every completed resource, unlike the Resource
+# Timing buffer, which stops recording once full (250 entries by default).
+PAGE_STATE_SCRIPT = """
+var network = window.__pageNetworkActivity;
+if (!network) {
+    network = window.__pageNetworkActivity = {inFlight: 0, lastActivity: performance.now()};
+    var touch = function () { network.lastActivity = performance.now(); };
+    var done = function () { network.inFlight = Math.max(0, network.inFlight - 1); touch(); };
+    new PerformanceObserver(touch).observe({type: 'resource'});
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        network.inFlight++;
+        touch();
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            network.inFlight++;
+            touch();
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+}
+return [document.readyState, network.inFlight, (performance.now() - network.lastActivity) / 1000];
+"""
+
+
+def wait_for_page_settled(
+    driver,
+    timeout: Optional[float] = None,
+    idle_seconds: Optional[float] = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    """
+    Waits until the document is loaded, no request is in flight and none completed for `idle_seconds`.
+    Returns False when the page is still busy after `timeout`, callers carry on as they did after a fixed sleep.
+    """
+    timeout = config.WAIT_TIMEOUT_SECONDS if timeout is None else timeout
+    idle_seconds = config.WAIT_NETWORK_IDLE_SECONDS if idle_seconds is None else idle_seconds
+    deadline = clock() + timeout
+    state = None
+
+    while True:
+        try:
+            ready_state, in_flight, quiet_seconds = driver.execute_script(PAGE_STATE_SCRIPT)
+            state = (ready_state, in_flight, quiet_seconds)
+            if ready_state == "complete" and in_flight == 0 and quiet_seconds >= idle_seconds:
+                return True
+        except Exception as e:
+            # Navigation in progress, the script ran against a document being replaced
+            logger.trace(f"Page state unavailable: {e}")
+
+        if clock() >= deadline:
+            logger.debug(f"Page not settled after {timeout} seconds, last state: {state}")
+            return False
+        sleep(config.WAIT_POLL_SECONDS)
+
+
+def wait_for_clickable(driver, element: WebElement, timeout: Optional[float] = None) -> bool:
+    """Waits until the element is displayed and enabled, returns False on timeout."""
+    timeout = config.WAIT_TIMEOUT_SECONDS if timeout is None else timeout
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=config.WAIT_POLL_SECONDS).until(
+            EC.element_to_be_clickable(element)
+        )
+        return True
+    except TimeoutException:
+        logger.debug(f"Element not clickable after {timeout} seconds")
+        return False
+
+
+def wait_for_upload(driver, element: WebElement, timeout: Optional[float] = None) -> bool:
+    """
+    Waits until the file input (or the one inside element) holds the file and the
+    page is done sending it, returns False on timeout.
+    """
+    timeout = config.WAIT_TIMEOUT_SECONDS if timeout is None else timeout
+    file_input = (
+        element
+        if element.tag_name == "input"
+        else element.find_element(By.XPATH, ".//input[@type='file']")
+    )
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=config.WAIT_POLL_SECONDS).until(
+            lambda _: file_input.get_attribute("value")
+        )
+    except TimeoutException:
+        logger.debug(f"File input still empty after {timeout} seconds")
+        return False
+    return wait_for_page_settled(driver, timeout)
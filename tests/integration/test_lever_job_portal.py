@@ -12,7 +12,7 @@ from job import Job
 
 from job_application_saver import ApplicationSaver
 from job_portals.lever.job_page import LeverJobPage
-from llm.ai_answerer import AiAnswerer
+from llm.ai_answerer import AiAnswerer, JobScreening
 from main import init_browser
 from utils import browser_utils
 
@@ -61,10 +61,12 @@ class TestLeverJobPortalIntegration(unittest.TestCase):
             lambda q: "Sample answer"
         )
         self.mock_gpt_answerer.answer_question_numeric.side_effect = lambda q: "12345"
-        self.mock_gpt_answerer.is_job_suitable.return_value = (
-            True,
-            0.9,
-            "Suitable job",
+        self.mock_gpt_answerer.screen_job.return_value = JobScreening(
+            summary="Summary",
+            work_preferences_match=True,
+            is_suitable=True,
+            score=9,
+            reasoning="Suitable job",
         )
 
     def tearDown(self):
@@ -112,7 +114,7 @@ class TestLeverJobPortalIntegration(unittest.TestCase):
 
         self.job_applier.apply_to_job(job)
         mock_save.assert_called_once()
-        self.mock_gpt_answerer.is_job_suitable.assert_called_once()
+        self.mock_gpt_answerer.screen_job.assert_called_once()
 
     def _local_url(self, path):
         from pathlib import Path
@@ -0,0 +1,98 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from services.web_search_engine import GoogleSearchEngine
+from utils.http_utils import create_session
+from utils.rate_limiter import RateLimiter
+
+PAGES = 100
+
+
+class StubSearchHandler(BaseHTTPRequestHandler):
+    """Google Custom Search look-alike, HTTP/1.1 so clients may keep connections alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            throttled = self.server.throttle > 0
+            self.server.throttle -= 1
+            self.server.requests += 1
+        if throttled:
+            self._send(429, {"error": "rate limited"}, {"Retry-After": "0"})
+        else:
+            self._send(200, {"items": [{"title": "job", "link": "https://jobs.lever.co/acme/1", "snippet": ""}]})
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSearchHandler)
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.requests = 0
+    server.throttle = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _engine(server, session):
+    engine = GoogleSearchEngine(session, RateLimiter(rate=10_000))
+    engine.GOOGLE_SEARCH_URL = f"http://127.0.0.1:{server.server_address[1]}/customsearch/v1"
+    return engine
+
+
+def _sweep(engine):
+    for page in range(PAGES):
+        assert len(engine.search("site:jobs.lever.co python", {}, offset=page * 10).results) == 1
+
+
+@pytest.mark.integration
+def test_pooled_session_reuses_connections_across_a_search_sweep(stub_server):
+    _sweep(_engine(stub_server, create_session()))
+    pooled_connections = stub_server.connections
+
+    stub_server.connections = 0
+    # One session per request behaves like the previous module-level requests.get
+    for page in range(PAGES):
+        with requests.Session() as session:
+            _engine(stub_server, session).search("site:jobs.lever.co python", {}, offset=page * 10)
+    unpooled_connections = stub_server.connections
+
+    print(f"{PAGES} pages: {pooled_connections} connections pooled, {unpooled_connections} unpooled")
+    assert pooled_connections == 1
+    assert unpooled_connections == PAGES
+
+
+@pytest.mark.integration
+def test_rate_limited_requests_are_retried_after_retry_after(stub_server):
+    stub_server.throttle = 2
+
+    response = _engine(stub_server, create_session(backoff_factor=0)).search("python", {})
+
+    assert len(response.results) == 1
+    assert stub_server.requests == 3
@@ -85,3 +85,184 @@
 #     lever_application_page.select_dropdown_option(element, "option_value")
 #     selected = element.find_element(By.XPATH, ".//option[@selected]")
 #     assert selected.text == "option_value"
+
+
+import glob
+import os
+from unittest.mock import MagicMock
+
+from job_portals.application_form_elements import (
+    FormFieldKind,
+    SelectQuestionType,
+    TextBoxQuestionType,
+)
+from job_portals.lever.application_page import (
+    FORM_SNAPSHOT_SCRIPT,
+    LeverApplicationPage,
+    classify_question_snapshot,
+    parse_form_sections,
+)
+
+APPLICATION_PAGES_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "resources", "lever_application_pages")
+
+
+def _input(tag="input", type=None, name=None, value=None, displayed=True, enabled=True, multiple=False, options=()):
+    return {
+        "tag": tag, "type": type, "name": name, "value": value, "displayed": displayed,
+        "enabled": enabled, "multiple": multiple, "options": list(options),
+    }
+
+
+def _snapshot(*inputs, label="Question ✱", required=False, descriptions=()):
+    return {
+        "element": None, "text": f"{label}\nanswer", "label": label,
+        "required": required, "descriptions": list(descriptions), "inputs": list(inputs),
+    }
+
+
+def test_classify_upload_and_terms_fields():
+    upload = classify_question_snapshot(_snapshot(_input(type="file", name="resume"), label="Resume/CV"))
+    terms = classify_question_snapshot(_snapshot(_input(type="checkbox", name="consent[store]", value="1")))
+
+    assert upload.kind is FormFieldKind.UPLOAD
+    assert upload.label == "Resume/CV"
+    assert upload.question is None
+    assert terms.kind is FormFieldKind.TERMS_OF_SERVICE
+
+
+def test_classify_radio_questions():
+    single = classify_question_snapshot(_snapshot(
+        _input(type="radio", name="cards[0]", value="Yes"),
+        _input(type="radio", name="cards[0]", value="No"),
+        _input(type="radio", name="cards[0]", value="Yes"),
+        label=" Are you authorised to work? ",
+    ))
+    multi = classify_question_snapshot(_snapshot(
+        _input(type="checkbox", name="cards[1]", value="Python"),
+        _input(type="checkbox", name="cards[1]", value="SQL"),
+        descriptions=["(Optional)"],
+    ))
+
+    assert single.kind is FormFieldKind.RADIO
+    assert single.question.question == "Are you authorised to work?"
+    assert single.question.options == ["Yes", "No"]
+    assert single.question.type is SelectQuestionType.SINGLE_SELECT
+    assert single.question.required
+    assert multi.question.type is SelectQuestionType.MULTI_SELECT
+    assert not multi.question.required
+
+
+def test_classify_textbox_questions():
+    email = classify_question_snapshot(_snapshot(_input(type="email", name="email"), required=True))
+    long_answer = classify_question_snapshot(_snapshot(_input(tag="textarea", name="comments")))
+    hidden = classify_question_snapshot(_snapshot(_input(type="text", name="hidden", displayed=False)))
+
+    assert email.kind is FormFieldKind.TEXTBOX
+    assert email.question.type is TextBoxQuestionType.EMAIL
+    assert email.question.required
+    assert long_answer.question.type is TextBoxQuestionType.TEXT
+    assert not long_answer.question.required
+    assert hidden.kind is FormFieldKind.UNKNOWN
+
+
+def test_classify_dropdown_question():
+    dropdown = classify_question_snapshot(_snapshot(
+        _input(tag="select", name="cards[2]", multiple=True, options=["Select...", "Remote", "Onsite"]),
+        required=True,
+    ))
+
+    assert dropdown.kind is FormFieldKind.DROPDOWN
+    assert dropdown.question.options == ["Select...", "Remote", "Onsite"]
+    assert dropdown.question.type is SelectQuestionType.MULTI_SELECT
+    assert dropdown.question.required
+
+
+def test_snapshot_form_fields_uses_a_single_script_call():
+    driver = MagicMock()
+    driver.execute_script.return_value = [
+        _snapshot(_input(type="file", name="resume")),
+        _snapshot(_input(type="text", name="name")),
+    ]
+    form_section = MagicMock()
+
+    form_fields = LeverApplicationPage(driver).snapshot_form_fields(form_section)
+
+    driver.execute_script.assert_called_once_with(FORM_SNAPSHOT_SCRIPT, form_section)
+    form_section.find_element.assert_not_called()
+    assert [field.kind for field in form_fields] == [FormFieldKind.UPLOAD, FormFieldKind.TEXTBOX]
+
+
+def test_snapshot_form_fields_falls_back_without_questions():
+    driver = MagicMock()
+    driver.execute_script.return_value = []
+
+    assert LeverApplicationPage(driver).snapshot_form_fields(MagicMock()) is None
+
+
+def _application_page_source(job_dir):
+    path, = glob.glob(os.path.join(APPLICATION_PAGES_DIR, job_dir, "*_application_page.html"))
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def test_parse_form_sections_of_saved_page_with_dropdowns():
+    sections = parse_form_sections(_application_page_source("job1"))
+    form_fields = {field.label: field for section in sections for field in section}
+
+    assert len(sections) == 6
+    assert form_fields["Resume/CV ✱"].kind is FormFieldKind.UPLOAD
+    assert form_fields["Email✱"].question.type is TextBoxQuestionType.EMAIL
+    assert form_fields["Email✱"].question.required
+    assert not form_fields["Current company"].question.required
+    criminal_convictions = next(field for field in form_fields.values() if "criminal convictions" in (field.label or ""))
+    assert criminal_convictions.kind is FormFieldKind.DROPDOWN
+    assert criminal_convictions.question.options == ["Select...", "No", "Yes"]
+    advertised = form_fields["Where did you see this role advertised?"]
+    assert advertised.kind is FormFieldKind.RADIO
+    assert advertised.question.options[:2] == ["Foodstuffs Careers Site", "Seek"]
+    assert form_fields["LinkedIn profile"].kind is FormFieldKind.UNKNOWN
+
+
+def test_parse_form_sections_of_saved_page_with_checkboxes():
+    form_fields = {field.label: field for section in parse_form_sections(_application_page_source("job2")) for field in section}
+
+    availability = form_fields["Availability?✱"]
+    assert availability.kind is FormFieldKind.RADIO
+    assert availability.question.type is SelectQuestionType.MULTI_SELECT
+    assert availability.question.options == ["Immediately", "Two weeks from offer", "Over a month from offer"]
+    assert form_fields["Gender"].question.type is SelectQuestionType.SINGLE_SELECT
+    assert all(field.element is None for field in form_fields.values())
+
+
+def test_snapshot_form_fields_from_page_source(monkeypatch):
+    monkeypatch.setattr("config.FORM_SNAPSHOT_FROM_PAGE_SOURCE", True)
+    page_source = _application_page_source("job2")
+    sections = [MagicMock(name=f"section {i}") for i in range(len(parse_form_sections(page_source)))]
+    driver = MagicMock(page_source=page_source)
+    driver.find_elements.return_value = sections
+    sections[1].find_elements.return_value = [f"question {i}" for i in range(5)]
+    sections[2].find_elements.return_value = ["question 0"]
+
+    application_page = LeverApplicationPage(driver)
+    form_fields = application_page.snapshot_form_fields(sections[1])
+
+    driver.execute_script.assert_not_called()
+    assert [field.label for field in form_fields][:2] == ["LinkedIn URL✱", "Twitter URL"]
+    assert [field.element for field in form_fields] == [f"question {i}" for i in range(5)]
+    assert application_page.snapshot_form_fields(sections[2]) is None
+
+
+def test_select_radio_option_clicks_the_label_of_a_hidden_input(monkeypatch):
+    wait_for_clickable = MagicMock()
+    monkeypatch.setattr("job_portals.lever.application_page.wait_utils.wait_for_clickable", wait_for_clickable)
+    monkeypatch.setattr("job_portals.lever.application_page.time_utils.short_sleep", MagicMock())
+    driver, question, radio_input, label = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    question.find_element.return_value = radio_input
+    radio_input.is_displayed.return_value = False
+    radio_input.find_elements.return_value = [label]
+
+    LeverApplicationPage(driver).select_radio_option(question, "Yes")
+
+    wait_for_clickable.assert_called_once_with(driver, label)
+    label.click.assert_called_once_with()
+    radio_input.click.assert_not_called()
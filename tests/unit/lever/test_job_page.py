@@ -0,0 +1,125 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from job import Job
+from lxml import html
+
+from job_portals.lever.job_page import LeverJobPage, _element_text, parse_job_details
+from utils.http_utils import create_session
+
+RESOURCES = Path("tests/resources/lever_application_pages")
+
+
+@pytest.mark.parametrize(
+    "job_page, location, categories",
+    [
+        (
+            "job1/Foodstuffs North Island - Commercial Analyst - Wholesale_job_page.html",
+            "Foodstuffs Landing Drive, Mangere, Auckland",
+            {"commitment": "Permanent Full Time", "workplaceTypes": "Hybrid"},
+        ),
+        (
+            "job2/Agiloft - Senior Software Engineer, Full Stack_job_page.html",
+            "United States",
+            {"commitment": "Full-time", "workplaceTypes": "Remote"},
+        ),
+    ],
+)
+def test_parse_job_details_from_saved_pages(job_page, location, categories):
+    details = parse_job_details((RESOURCES / job_page).read_text(encoding="utf-8"))
+
+    assert details["location"] == location
+    assert categories.items() <= details["categories"].items()
+    assert len(details["description"]) > 1000
+    # Inline styles and scripts are not part of the visible text
+    assert "font-family" not in details["description"]
+
+
+def test_element_text_breaks_lines_only_at_block_elements():
+    element = html.fromstring(
+        "<div><h3>About <b>Acme</b></h3>"
+        "<p>We build <a href='#'>rockets</a>, fast.<br>Really.</p>"
+        "<ul><li>Python</li><li><span>Go</span> &amp; Rust</li></ul>"
+        "<script>track()</script></div>"
+    )
+
+    # What WebElement.text returns for the same markup
+    assert _element_text(element) == "About Acme\nWe build rockets, fast.\nReally.\nPython\nGo & Rust"
+
+
+def test_parse_job_details_keeps_links_in_their_line():
+    job_page = RESOURCES / "job2/Agiloft - Senior Software Engineer, Full Stack_job_page.html"
+    description = parse_job_details(job_page.read_text(encoding="utf-8"))["description"]
+
+    assert "Expertise with React and Next.js" in description.splitlines()
+
+
+def test_parse_job_details_without_posting():
+    assert parse_job_details("<html><body><p>Not found</p></body></html>") == {
+        "description": "",
+        "location": "",
+        "categories": {},
+    }
+
+
+class _JobPagesHandler(BaseHTTPRequestHandler):
+    """Serves the saved job pages as /job1 and /job2, anything else is a 404"""
+
+    def do_GET(self):
+        pages = list((RESOURCES / self.path.strip("/")).glob("*_job_page.html")) if self.path.strip("/") else []
+        if not pages:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = pages[0].read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.requests.append(self.path)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def job_pages_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JobPagesHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _server_url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}/{path}"
+
+
+def test_fetch_job_details_from_stub_server(job_pages_server):
+    driver = MagicMock()
+    job_page = LeverJobPage(driver, session=create_session(max_retries=0))
+    jobs = [Job(link=_server_url(job_pages_server, name)) for name in ("job1", "job2")]
+
+    assert all(job_page.fetch_job_details(job) for job in jobs)
+
+    assert jobs[0].location == "Foodstuffs Landing Drive, Mangere, Auckland"
+    assert jobs[1].categories["workplaceTypes"] == "Remote"
+    assert len(jobs[1].description) > 1000
+    assert job_pages_server.requests == ["/job1", "/job2"]
+    # The browser is left alone
+    assert driver.method_calls == []
+
+
+def test_fetch_job_details_reports_unavailable_pages(job_pages_server):
+    job_page = LeverJobPage(MagicMock(), session=create_session(max_retries=0))
+    job = Job(link=_server_url(job_pages_server, "missing"))
+
+    assert not job_page.fetch_job_details(job)
+    assert job.description == ""
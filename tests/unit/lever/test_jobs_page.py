@@ -0,0 +1,69 @@
+from job_portals.lever.jobs_page import SearchLeverJobs
+from services.web_search_engine import SearchResult
+
+
+def _jobs_page(**work_preferences):
+    return SearchLeverJobs(driver=None, work_preferences=work_preferences)
+
+
+def test_plan_searches_packs_positions_per_location(monkeypatch):
+    monkeypatch.setattr("config.SEARCH_BATCH_POSITIONS", True)
+    jobs_page = _jobs_page(positions=["data engineer", "analytics engineer"])
+
+    searches = jobs_page.plan_searches(["data engineer", "analytics engineer"], ["berlin", "paris"])
+
+    assert searches == [
+        ("((data engineer) OR (analytics engineer))", "berlin"),
+        ("((data engineer) OR (analytics engineer))", "paris"),
+    ]
+    query, _ = jobs_page.build_search_query(*searches[0])
+    assert query == "site:jobs.lever.co inurl:/apply ((data engineer) OR (analytics engineer))"
+
+
+def test_plan_searches_stays_within_the_query_length(monkeypatch):
+    monkeypatch.setattr("config.SEARCH_BATCH_POSITIONS", True)
+    jobs_page = _jobs_page(company_blacklist=[f"company {i}" for i in range(50)])
+    tail_query, _ = jobs_page.build_search_query("", "berlin")
+    # Room for two of the positions next to the blacklist, not three
+    max_length = len(tail_query) + 1 + len("((position 0) OR (position 1))")
+    monkeypatch.setattr(jobs_page.search_engine, "MAX_QUERY_LENGTH", max_length)
+    positions = [f"position {i}" for i in range(5)]
+
+    searches = jobs_page.plan_searches(positions, ["berlin"])
+
+    assert [position for position, _ in searches] == [
+        "((position 0) OR (position 1))", "((position 2) OR (position 3))", "position 4",
+    ]
+    for position, location in searches:
+        assert len(jobs_page.build_search_query(position, location)[0]) <= max_length
+
+
+def test_plan_searches_without_batching(monkeypatch):
+    monkeypatch.setattr("config.SEARCH_BATCH_POSITIONS", False)
+
+    searches = _jobs_page().plan_searches(["data engineer", "analytics engineer"], ["berlin"])
+
+    assert searches == [("data engineer", "berlin"), ("analytics engineer", "berlin")]
+
+
+def test_jobs_are_attributed_to_a_position_by_title():
+    jobs_page = _jobs_page(positions=["data engineer", "analytics engineer"])
+
+    job = jobs_page.job_tile_to_job(
+        SearchResult(title="Acme - Analytics Engineer", link="https://jobs.lever.co/acme/123/apply", snippet="")
+    )
+
+    assert job.position == "analytics engineer"
+    assert job.link == "https://jobs.lever.co/acme/123"
+
+
+def test_batched_searches_match_the_unbatched_ones(monkeypatch):
+    positions = ["data engineer", "ml engineer", "sre"]
+    monkeypatch.setattr("config.SEARCH_BATCH_POSITIONS", True)
+    batched = _jobs_page().plan_searches(positions, ["berlin"])
+    monkeypatch.setattr("config.SEARCH_BATCH_POSITIONS", False)
+    unbatched = _jobs_page().plan_searches(positions, ["berlin"])
+
+    [(group, location)] = batched
+    alternatives = [term[1:-1] if term.startswith("(") else term for term in group[1:-1].split(" OR ")]
+    assert [(alternative, location) for alternative in alternatives] == unbatched
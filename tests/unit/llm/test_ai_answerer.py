@@ -0,0 +1,232 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from llm.ai_answerer import AiAnswerer
+from utils.sqlite_cache import SqliteLRUCache
+
+
+class FakeLLM:
+    """Replies with the queued responses in order and records every prompt it receives."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.prompts = []
+
+    def __call__(self, messages):
+        self.prompts.append(messages.to_string())
+        return AIMessage(content=self.responses.pop(0))
+
+
+class AsyncFakeLLM:
+    """Answers by prompt content and tracks how many calls are in flight at once."""
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, messages):
+        raise AssertionError("blocking call on the async path")
+
+    async def acall(self, messages):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        prompt = messages.to_string()
+        return AIMessage(content=next(reply for marker, reply in self.replies.items() if marker in prompt))
+
+
+def make_answerer(fake_llm):
+    with patch("llm.ai_answerer.AIAdapter"), \
+         patch("llm.ai_answerer.TensorZeroChatModelWrapper", return_value=fake_llm):
+        answerer = AiAnswerer({}, "api_key")
+    answerer.set_resume(MagicMock(legal_authorization="Authorized to work in the EU"))
+    answerer.set_job_application_profile(MagicMock())
+    return answerer
+
+
+@pytest.fixture
+def two_step_routing():
+    with patch("llm.ai_answerer.LLM_COMBINED_SECTION_ANSWER", False):
+        yield
+
+
+@pytest.fixture
+def combined_routing():
+    with patch("llm.ai_answerer.LLM_COMBINED_SECTION_ANSWER", True):
+        yield
+
+
+def test_chains_are_compiled_once(two_step_routing):
+    with patch("llm.ai_answerer.ChatPromptTemplate.from_template", wraps=__import__(
+        "langchain_core.prompts", fromlist=["ChatPromptTemplate"]
+    ).ChatPromptTemplate.from_template) as from_template:
+        answerer = make_answerer(FakeLLM("Legal Authorization", "Yes", "Legal Authorization", "No"))
+        compiled = from_template.call_count
+
+        answerer.answer_question_textual_wide_range("Are you allowed to work in the EU?")
+        answerer.answer_question_textual_wide_range("Do you need a visa?")
+
+        assert from_template.call_count == compiled
+
+
+def test_answer_question_textual_wide_range_uses_section_chain(two_step_routing):
+    fake_llm = FakeLLM("Legal Authorization", "**Yes**")
+    answerer = make_answerer(fake_llm)
+
+    assert answerer.answer_question_textual_wide_range("Are you allowed to work in the EU?") == "Yes"
+    assert "Authorized to work in the EU" in fake_llm.prompts[1]
+
+
+def test_answer_question_textual_wide_range_unknown_section(two_step_routing):
+    answerer = make_answerer(FakeLLM("Hobbies"))
+
+    with pytest.raises(ValueError):
+        answerer.answer_question_textual_wide_range("What do you do for fun?")
+
+
+def test_section_is_memoized_by_normalized_question(two_step_routing):
+    fake_llm = FakeLLM("Legal Authorization", "Yes", "Yes")
+    answerer = make_answerer(fake_llm)
+
+    answerer.answer_question_textual_wide_range("Are you allowed to work in the EU?")
+    answerer.answer_question_textual_wide_range("  are you allowed to work in the EU?\n")
+
+    assert len(fake_llm.prompts) == 3
+    assert answerer.question_sections == {"are you allowed to work in the eu?": "legal_authorization"}
+
+
+def test_combined_mode_routes_and_answers_in_one_call(combined_routing):
+    fake_llm = FakeLLM('{"section": "Legal Authorization", "answer": "**Yes**"}', "No")
+    answerer = make_answerer(fake_llm)
+
+    assert answerer.answer_question_textual_wide_range("Are you allowed to work in the EU?") == "Yes"
+    assert len(fake_llm.prompts) == 1
+    # The memoized section skips the combined call for the repeated question
+    assert answerer.answer_question_textual_wide_range("Are you allowed to work in the EU?") == "No"
+    assert "Authorized to work in the EU" in fake_llm.prompts[1]
+
+
+def test_combined_mode_falls_back_to_routing_on_invalid_output(combined_routing):
+    fake_llm = FakeLLM("Yes", "Legal Authorization", "Yes")
+    answerer = make_answerer(fake_llm)
+
+    assert answerer.answer_question_textual_wide_range("Are you allowed to work in the EU?") == "Yes"
+    assert len(fake_llm.prompts) == 3
+
+
+def test_combined_mode_generates_cover_letter_with_job_description(combined_routing):
+    fake_llm = FakeLLM('{"section": "Cover letter", "answer": ""}', "Dear Acme")
+    answerer = make_answerer(fake_llm)
+    answerer.job = MagicMock(description="Build rockets", company="Acme")
+
+    assert answerer.answer_question_textual_wide_range("Why do you want to join us?") == "Dear Acme"
+    assert "Build rockets" in fake_llm.prompts[1]
+
+
+def test_answer_question_from_options_and_numeric():
+    answerer = make_answerer(FakeLLM("3-5 years", "I have 4 years"))
+
+    assert answerer.answer_question_from_options("Python?", ["1-2", "3-5", "6-10"]) == "3-5"
+    assert answerer.answer_question_numeric("Years of Python?") == "4"
+
+
+def test_is_work_preferences_match_binds_format_instructions():
+    fake_llm = FakeLLM('{"match": false, "reason": "on-site only"}')
+    answerer = make_answerer(fake_llm)
+    answerer.job_application_profile.work_preferences.__dict__ = {}
+
+    assert answerer.is_work_preferences_match(MagicMock(), {"remote": True}) is False
+    assert "JSON" in fake_llm.prompts[0]
+
+
+def test_summaries_are_cached_by_description(tmp_path):
+    fake_llm = FakeLLM("## Python", "## Go")
+    answerer = make_answerer(fake_llm)
+    answerer.summary_cache = SqliteLRUCache(tmp_path / "summaries.db")
+
+    assert answerer.summarize_job_description("Python developer") == "Python"
+    assert answerer.summarize_job_description("Python developer") == "Python"
+    assert answerer.summarize_job_description("Go developer") == "Go"
+    assert len(fake_llm.prompts) == 2
+
+
+def test_screen_job_runs_the_three_checks_concurrently():
+    fake_llm = AsyncFakeLLM(
+        {
+            "seasoned HR expert": "## Python, SQL",
+            "work preferences align": '{"match": true, "reason": ""}',
+            "Score: [numerical score]": "Score: 8\nReasoning: Strong Python background",
+        }
+    )
+    answerer = make_answerer(fake_llm)
+    answerer.job_application_profile.work_preferences.__dict__ = {}
+    job = MagicMock(description="Senior Python developer")
+
+    screening = answerer.screen_job(job, {"remote": True})
+
+    assert fake_llm.max_in_flight == 3
+    assert screening.summary == "Python, SQL"
+    assert screening.work_preferences_match is True
+    assert (screening.is_suitable, screening.score) == (True, 8)
+    assert screening.reasoning == "Strong Python background"
+    assert answerer.job is job
+    job.set_summarize_job_description.assert_called_once_with("Python, SQL")
+
+
+def test_screen_job_cancels_suitability_when_work_preferences_fail():
+    fake_llm = AsyncFakeLLM(
+        {
+            "seasoned HR expert": "## Python, SQL",
+            "work preferences align": '{"match": false, "reason": "on-site only"}',
+            "Score: [numerical score]": "Score: 8\nReasoning: Strong Python background",
+        }
+    )
+    suitability_calls = []
+    acall = fake_llm.acall
+
+    async def slow_suitability(messages):
+        if "Score: [numerical score]" in messages.to_string():
+            suitability_calls.append("started")
+            await asyncio.sleep(1)
+            suitability_calls.append("finished")
+        return await acall(messages)
+
+    fake_llm.acall = slow_suitability
+    answerer = make_answerer(fake_llm)
+    answerer.job_application_profile.work_preferences.__dict__ = {}
+
+    screening = answerer.screen_job(MagicMock(description="Senior Python developer"), {"remote": True})
+
+    assert screening.work_preferences_match is False
+    assert (screening.is_suitable, screening.score, screening.reasoning) == (False, None, None)
+    assert screening.summary == "Python, SQL"
+    assert suitability_calls == ["started"]
+
+
+def test_worker_copies_screen_on_their_own_client_and_loop():
+    fake_llm = AsyncFakeLLM(
+        {
+            "seasoned HR expert": "## Python",
+            "work preferences align": '{"match": true, "reason": ""}',
+            "Score: [numerical score]": "Score: 8\nReasoning: Good fit",
+        }
+    )
+    with patch("llm.ai_answerer.AIAdapter", side_effect=lambda *args: MagicMock()), \
+         patch("llm.ai_answerer.TensorZeroChatModelWrapper", return_value=fake_llm):
+        answerer = AiAnswerer({}, "api_key")
+        worker = answerer.worker_copy()
+    for each in (answerer, worker):
+        each.set_resume(MagicMock())
+        each.set_job_application_profile(MagicMock())
+        each.job_application_profile.work_preferences.__dict__ = {}
+
+    assert worker.ai_adapter is not answerer.ai_adapter
+    assert worker.chains is not answerer.chains
+    answerer.screen_job(MagicMock(description="Python developer"), {})
+    worker.screen_job(MagicMock(description="Python developer"), {})
+    assert worker._loop is not answerer._loop
@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from llm.llm_manager import CachedTensorZeroChatModelWrapper
+from utils.sqlite_cache import SqliteLRUCache
+
+
+def make_llm(temperature=0.4):
+    llm = MagicMock(model_name="tensorzero::function_name::generate_haiku", temperature=temperature)
+    llm.invoke.side_effect = lambda messages: AIMessage(content=f"reply {llm.invoke.call_count}")
+    return llm
+
+
+def test_repeated_requests_are_served_from_cache(tmp_path):
+    llm = make_llm()
+    wrapper = CachedTensorZeroChatModelWrapper(llm, SqliteLRUCache(tmp_path / "responses.db"))
+
+    first = wrapper([HumanMessage(content="Resume or cover letter?")])
+    second = wrapper([HumanMessage(content="Resume or cover letter?")])
+    other = wrapper([HumanMessage(content="Upload resume")])
+
+    assert first.content == second.content == "reply 1"
+    assert other.content == "reply 2"
+    assert llm.invoke.call_count == 2
+    assert wrapper.stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+
+def test_cache_key_depends_on_sampling_settings_and_accepts_prompt_values(tmp_path):
+    cache = SqliteLRUCache(tmp_path / "responses.db")
+    prompt_value = ChatPromptTemplate.from_template("phrase: {phrase}").invoke({"phrase": "upload"})
+    messages = [HumanMessage(content="phrase: upload")]
+
+    wrapper = CachedTensorZeroChatModelWrapper(make_llm(), cache)
+    cold_wrapper = CachedTensorZeroChatModelWrapper(make_llm(temperature=0), cache)
+
+    assert wrapper.cache_key(prompt_value) == wrapper.cache_key(messages)
+    assert wrapper.cache_key(messages) != cold_wrapper.cache_key(messages)
+
+
+def test_replies_survive_reopening_the_cache(tmp_path):
+    CachedTensorZeroChatModelWrapper(make_llm(), SqliteLRUCache(tmp_path / "responses.db"))(
+        [HumanMessage(content="Which section?")]
+    )
+
+    llm = make_llm()
+    wrapper = CachedTensorZeroChatModelWrapper(llm, SqliteLRUCache(tmp_path / "responses.db"))
+    assert wrapper([HumanMessage(content="Which section?")]).content == "reply 1"
+    llm.invoke.assert_not_called()
+
+
+def test_async_calls_share_the_cache(tmp_path):
+    llm = make_llm()
+    llm.ainvoke = AsyncMock(return_value=AIMessage(content="async reply"))
+    wrapper = CachedTensorZeroChatModelWrapper(llm, SqliteLRUCache(tmp_path / "responses.db"))
+    messages = [HumanMessage(content="Which section?")]
+
+    assert asyncio.run(wrapper.acall(messages)).content == "async reply"
+    assert wrapper(messages).content == "async reply"
+    llm.invoke.assert_not_called()
+    assert wrapper.stats()["hits"] == 1
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+from services.cached_search_engine import TIME_RANGE_PARAM, CachedSearchEngine
+from services.web_search_engine import PaginatedSearchResponse, SearchQueryBuilder, SearchResult, SearchTimeRange, WebSearchEngine
+from utils.sqlite_cache import SqliteLRUCache
+
+
+class FakeEngine(WebSearchEngine):
+    NAME = "google"
+
+    def __init__(self):
+        self.calls = []
+
+    @property
+    def DEFAULT_SEARCH_LIMIT(self) -> int:
+        return 10
+
+    def build_query(self, query):
+        params = {"gl": query.gl}
+        if query.date_range:
+            params["dateRestrict"] = query.date_range.value
+        return SearchQueryBuilder.build_final_query_string(query), params
+
+    def search(self, query, params={}, offset=0, limit=10):
+        self.calls.append((query, dict(params), offset))
+        params["key"] = "secret"
+        return PaginatedSearchResponse(
+            results=[SearchResult(title="Engineer", link=f"https://jobs.lever.co/acme/{offset}", snippet="", raw_data={"rank": 1})],
+            engine_name="Google",
+            offset=offset,
+            limit=limit,
+            total_results=42,
+        )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SqliteLRUCache(tmp_path / "search.db")
+    yield cache
+    cache.close()
+
+
+def _query(date_range=None):
+    builder = SearchQueryBuilder.create().add_to_keywords("python").set_geolocation("de")
+    if date_range:
+        builder.set_date_range(date_range)
+    return builder.build_unified_query()
+
+
+def test_pages_are_cached_per_query_and_offset(cache):
+    engine = FakeEngine()
+    cached = CachedSearchEngine(engine, cache)
+    query, params = cached.build_query(_query(SearchTimeRange.LAST_WEEK))
+
+    first = cached.search(query, params, offset=0)
+    second = cached.search(query, params, offset=0)
+    cached.search(query, params, offset=10)
+
+    assert second == first
+    assert second.results[0].raw_data == {"rank": 1}
+    assert [call[2] for call in engine.calls] == [0, 10]
+    assert engine.calls[0][1] == {"gl": "de", "dateRestrict": "last_week"}
+    assert TIME_RANGE_PARAM in params and "key" not in params
+    assert cached.stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+
+def test_pages_expire_with_the_ttl_of_their_date_range(cache, monkeypatch):
+    monkeypatch.setattr("config.SEARCH_CACHE_TTL_SECONDS", {"last_24_hours": 60, "last_month": 3600, None: 3600})
+    engine = FakeEngine()
+    cached = CachedSearchEngine(engine, cache)
+    recent = cached.build_query(_query(SearchTimeRange.LAST_24_HOURS))
+    older = cached.build_query(_query(SearchTimeRange.LAST_MONTH))
+    cached.search(*recent)
+    cached.search(*older)
+
+    later = time.time() + 120
+    monkeypatch.setattr("utils.sqlite_cache.time.time", lambda: later)
+    cached.search(*recent)
+    cached.search(*older)
+
+    assert len(engine.calls) == 3
+
+
+def test_cache_only_mode_never_calls_the_engine(cache):
+    engine = FakeEngine()
+    query, params = CachedSearchEngine(engine, cache).build_query(_query())
+    CachedSearchEngine(engine, cache).search(query, params)
+
+    offline = CachedSearchEngine(engine, cache, cache_only=True)
+    assert offline.search(query, params).total_results == 42
+    assert offline.search(query, params, offset=10).results == []
+    assert len(engine.calls) == 1
@@ -0,0 +1,144 @@
+import threading
+from datetime import date
+
+import pytest
+
+from services.federated_search_engine import ENGINE_QUERIES, FederatedSearchEngine, SearchQuota
+from services.web_search_engine import PaginatedSearchResponse, SearchQueryBuilder, SearchResult, WebSearchEngine
+
+
+class FakeEngine(WebSearchEngine):
+    def __init__(self, name, links, total_results=None, error=None, release=None):
+        self.NAME = name
+        self.links = links
+        self.total_results = total_results
+        self.error = error
+        self.release = release
+        self.queries = []
+
+    @property
+    def DEFAULT_SEARCH_LIMIT(self) -> int:
+        return 10
+
+    def build_query(self, query):
+        return f"{self.NAME}:{SearchQueryBuilder.build_final_query_string(query)}", {"engine": self.NAME}
+
+    def search(self, query, params={}, offset=0, limit=10):
+        self.queries.append((query, params))
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error:
+            raise self.error
+        return PaginatedSearchResponse(
+            results=[SearchResult(title=link, link=link, snippet="") for link in self.links],
+            engine_name=self.NAME,
+            offset=offset,
+            limit=limit,
+            total_results=self.total_results,
+        )
+
+
+def _search(engine):
+    query, params = engine.build_query(SearchQueryBuilder.create().add_to_keywords("python").build_unified_query())
+    return engine.search(query, params)
+
+
+def test_results_are_merged_by_canonical_link():
+    google = FakeEngine("google", ["https://jobs.lever.co/acme/1", "https://jobs.lever.co/acme/2"], total_results=30)
+    bing = FakeEngine("bing", ["https://jobs.lever.co/Acme/1/apply", "https://jobs.lever.co/acme/3"], total_results=50)
+    engine = FederatedSearchEngine([google, bing], fan_out=2, hedge_after=0)
+
+    response = _search(engine)
+
+    assert [result.link for result in response.results] == [
+        "https://jobs.lever.co/acme/1", "https://jobs.lever.co/acme/2", "https://jobs.lever.co/acme/3",
+    ]
+    assert response.engine_name == "google+bing"
+    assert response.total_results == 50
+    assert google.queries == [('google:python', {"engine": "google"})]
+    assert bing.queries == [('bing:python', {"engine": "bing"})]
+
+
+def test_failing_engine_fails_over_to_the_next_one():
+    google = FakeEngine("google", [], error=RuntimeError("quota exceeded"))
+    bing = FakeEngine("bing", ["https://jobs.lever.co/acme/1"])
+    engine = FederatedSearchEngine([google, bing], fan_out=1, hedge_after=0)
+
+    response = _search(engine)
+
+    assert [result.link for result in response.results] == ["https://jobs.lever.co/acme/1"]
+    assert engine.stats["google"].failures == 1
+
+
+def test_all_engines_failing_raises():
+    engine = FederatedSearchEngine([FakeEngine("google", [], error=RuntimeError("down"))], fan_out=1, hedge_after=0)
+
+    with pytest.raises(RuntimeError):
+        _search(engine)
+
+
+def test_slow_engine_is_hedged():
+    release = threading.Event()
+    google = FakeEngine("google", ["https://jobs.lever.co/acme/slow"], release=release)
+    bing = FakeEngine("bing", ["https://jobs.lever.co/acme/fast"])
+    engine = FederatedSearchEngine([google, bing], fan_out=1, hedge_after=0.05)
+
+    try:
+        response = _search(engine)
+    finally:
+        release.set()
+
+    assert [result.link for result in response.results] == ["https://jobs.lever.co/acme/fast"]
+
+
+def test_engines_are_ranked_by_latency_and_quota():
+    google, bing, brave = FakeEngine("google", []), FakeEngine("bing", []), FakeEngine("brave", [])
+    quota = SearchQuota({"google": 1})
+    engine = FederatedSearchEngine([google, bing, brave], quota=quota, fan_out=1, hedge_after=0)
+    engine.stats["bing"].record(2.0)
+    engine.stats["brave"].record(0.5)
+
+    assert [e.NAME for e in engine.ranked_engines()] == ["google", "brave", "bing"]
+    quota.consume("google")
+    assert [e.NAME for e in engine.ranked_engines()] == ["brave", "bing"]
+
+
+def test_failing_engines_are_ranked_last():
+    google = FakeEngine("google", [], error=RuntimeError("forbidden"))
+    bing = FakeEngine("bing", ["https://jobs.lever.co/acme/1"])
+    brave = FakeEngine("brave", ["https://jobs.lever.co/acme/2"])
+    engine = FederatedSearchEngine([google, bing, brave], fan_out=1, hedge_after=0)
+    engine.stats["bing"].record(0.5)
+    engine.stats["bing"].record(0.5, failed=True)
+    engine.stats["brave"].record(0.6)
+
+    _search(engine)
+
+    assert engine.stats["google"].latency is None
+    assert [e.NAME for e in engine.ranked_engines()] == ["brave", "bing", "google"]
+    _search(engine)
+    assert len(google.queries) == 1
+
+
+def test_search_quota_persists_and_resets_daily(tmp_path):
+    quota_file = tmp_path / "quota.json"
+    today = date(2026, 1, 1)
+    quota = SearchQuota({"google": 2}, quota_file, today=lambda: today)
+
+    assert quota.consume("google")
+    assert SearchQuota({"google": 2}, quota_file, today=lambda: today).remaining("google") == 1
+    assert quota.consume("google")
+    assert not quota.consume("google")
+    assert quota.remaining("bing") is None and quota.consume("bing")
+
+    today = date(2026, 1, 2)
+    assert quota.remaining("google") == 2
+
+
+def test_search_skips_engines_without_quota():
+    google = FakeEngine("google", ["https://jobs.lever.co/acme/1"])
+    engine = FederatedSearchEngine([google], quota=SearchQuota({"google": 0}), fan_out=1, hedge_after=0)
+
+    response = _search(engine)
+
+    assert response.results == [] and google.queries == []
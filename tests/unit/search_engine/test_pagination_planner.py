@@ -0,0 +1,77 @@
+from services.pagination_planner import PaginationPlanner
+from services.web_search_engine import PaginatedSearchResponse, SearchResult
+
+
+def _page(offset, links, limit=10, total_results=None):
+    return PaginatedSearchResponse(
+        results=[SearchResult(title="Engineer", link=link, snippet="") for link in links],
+        offset=offset,
+        limit=limit,
+        total_results=total_results,
+    )
+
+
+def _links(start, count=10):
+    return [f"https://jobs.lever.co/acme/{i}" for i in range(start, start + count)]
+
+
+def test_unknown_query_has_next_page():
+    assert PaginationPlanner().has_next_page("python")
+
+
+def test_stops_at_the_engine_cap():
+    planner = PaginationPlanner(max_results=20)
+
+    planner.record_page("python", _page(0, _links(0)), _links(0))
+    assert planner.has_next_page("python")
+    planner.record_page("python", _page(10, _links(10)), _links(10))
+    assert not planner.has_next_page("python")
+
+
+def test_stops_at_total_results_and_on_short_pages():
+    planner = PaginationPlanner()
+
+    planner.record_page("python", _page(0, _links(0), total_results=10), _links(0))
+    planner.record_page("go", _page(0, _links(100, 4)), _links(100, 4))
+
+    assert not planner.has_next_page("python")
+    assert not planner.has_next_page("go")
+
+
+def test_stops_after_consecutive_pages_without_new_candidates():
+    planner = PaginationPlanner(max_unproductive_pages=2)
+    planner.record_page("python", _page(0, _links(0)), _links(0))
+    planner.record_page("go", _page(0, _links(0)), _links(0))
+
+    # Same postings again, then a page of rejected (e.g. blacklisted) postings
+    assert planner.record_page("go", _page(10, _links(0)), _links(0)) == 0
+    assert planner.has_next_page("go")
+    assert planner.record_page("go", _page(20, _links(50)), []) == 0
+    assert not planner.has_next_page("go")
+    assert planner.has_next_page("python")
+
+
+def test_links_are_new_per_query():
+    planner = PaginationPlanner()
+    planner.record_page("python", _page(0, _links(0)), _links(0))
+
+    assert planner.record_page("go", _page(0, _links(0)), _links(0)) == 10
+
+
+def test_restarted_search_starts_from_scratch():
+    planner = PaginationPlanner()
+    planner.record_page("python", _page(0, _links(0), total_results=10), _links(0))
+    assert not planner.has_next_page("python")
+
+    assert planner.record_page("python", _page(0, _links(0)), _links(0)) == 10
+    assert planner.has_next_page("python")
+
+
+def test_productive_page_resets_the_count():
+    planner = PaginationPlanner(max_unproductive_pages=2)
+
+    planner.record_page("python", _page(0, _links(0)), [])
+    planner.record_page("python", _page(10, _links(10)), _links(10))
+    planner.record_page("python", _page(20, _links(20)), [])
+
+    assert planner.has_next_page("python")
@@ -0,0 +1,25 @@
+from services.query_planner import match_position, or_group, pack_terms
+
+
+def test_or_group_parenthesizes_multi_word_terms():
+    assert or_group(["data engineer", "dba"]) == "((data engineer) OR dba)"
+    assert or_group(["data engineer"]) == "data engineer"
+
+
+def test_pack_terms_respects_budget_and_max_terms():
+    terms = ["data engineer", "analytics engineer", "ml engineer", "sre"]
+
+    assert pack_terms(terms, budget=1000) == [terms]
+    assert pack_terms(terms, budget=1000, max_terms=3) == [terms[:3], terms[3:]]
+    assert pack_terms(terms, budget=len(or_group(terms[:2]))) == [terms[:2], terms[2:]]
+    # Terms longer than the budget still get searched on their own
+    assert pack_terms(terms, budget=5) == [[term] for term in terms]
+
+
+def test_match_position_prefers_full_and_longer_matches():
+    positions = ["engineer", "data engineer", "analytics engineer"]
+
+    assert match_position("Senior Data Engineer (Remote)", positions) == "data engineer"
+    assert match_position("Platform Engineer", positions) == "engineer"
+    assert match_position("Analytics Lead", ["data engineer", "analytics engineer"]) == "analytics engineer"
+    assert match_position("Office Manager", positions) is None
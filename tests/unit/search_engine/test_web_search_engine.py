@@ -1,9 +1,10 @@
 import pytest
 from unittest.mock import patch, MagicMock
+import config
 from services.web_search_engine import GoogleSearchEngine, BingSearchEngine, BraveSearchEngine
 
 # Unit test for GoogleSearchEngine
-@patch("requests.get")
+@patch("requests.Session.get")
 @patch("config.GOOGLE_API_KEY", "mock_api_key")  # Mocking the Google API key
 @patch("config.GOOGLE_SEARCH_ENGINE_ID", "mock_id")  # Mocking the Google Search Engine ID
 def test_google_search_engine(mock_get):
@@ -24,6 +25,7 @@ def test_google_search_engine(mock_get):
     mock_get.assert_called_once_with(
         "https://www.googleapis.com/customsearch/v1",
         params={"key": "mock_api_key", "cx": "mock_id", "q": "test query", "start": 1, "num": 10},
+        timeout=config.HTTP_TIMEOUT_SECONDS,
     )
     assert len(result.results) == 2
     assert result.results[0].title == "result1"
@@ -31,7 +33,7 @@ def test_google_search_engine(mock_get):
     assert result.results[0].snippet == "Snippet 1"
 
 # Unit test for BingSearchEngine
-@patch("requests.get")
+@patch("requests.Session.get")
 @patch("config.BING_API_KEY", "mock_bing_api_key")  # Mocking the Bing API key
 def test_bing_search_engine(mock_get):
     mock_response = MagicMock()
@@ -54,6 +56,7 @@ def test_bing_search_engine(mock_get):
         "https://api.bing.microsoft.com/v7.0/search",
         headers={"Ocp-Apim-Subscription-Key": "mock_bing_api_key"},
         params={"q": "test query", "count": 10, "offset": 0},
+        timeout=config.HTTP_TIMEOUT_SECONDS,
     )
     assert len(result.results) == 2
     assert result.results[0].title == "result1"
@@ -61,7 +64,7 @@ def test_bing_search_engine(mock_get):
     assert result.results[0].snippet == "Snippet 1"
 
 # Unit test for BraveSearchEngine
-@patch("requests.get")
+@patch("requests.Session.get")
 @patch("config.BRAVE_API_KEY", "mock_brave_api_key")  # Mocking the Brave API key
 def test_brave_search_engine(mock_get):
     mock_response = MagicMock()
@@ -83,6 +86,7 @@ def test_brave_search_engine(mock_get):
         "https://api.search.brave.com/res/v1/web/search",
         headers={"Authorization": f"Bearer mock_brave_api_key"},
         params={"q": "test query", "offset": 0, "limit": 10},
+        timeout=config.HTTP_TIMEOUT_SECONDS,
     )
     assert len(result.results) == 2
     assert result.results[0].title == "result1"
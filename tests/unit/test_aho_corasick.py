@@ -0,0 +1,21 @@
+from utils.aho_corasick import AhoCorasick
+
+
+def test_finds_all_keywords_in_one_pass_including_overlaps():
+    matcher = AhoCorasick(["he", "she", "his", "hers", "Python"])
+
+    assert matcher.find_all("ushers love PYTHON") == ["she", "he", "hers", "Python"]
+    assert list(matcher.iter_matches("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_whole_words_mode():
+    keywords = ["java", "c++", "machine learning"]
+
+    assert AhoCorasick(keywords).find_all("JavaScript and C++") == ["java", "c++"]
+    assert AhoCorasick(keywords, whole_words=True).find_all("JavaScript and C++") == ["c++"]
+    assert AhoCorasick(keywords, whole_words=True).find_all("Machine learning, Java.") == ["machine learning", "java"]
+
+
+def test_empty_keywords_and_text():
+    assert not AhoCorasick(["", "  "])
+    assert AhoCorasick(["python"]).find_all(None) == []
@@ -0,0 +1,124 @@
+import json
+
+from answer_cache import AnswerCache, sanitize_question
+
+
+def test_sanitize_question():
+    assert sanitize_question('  What is your "Name"?\n,') == "what is your name?"
+
+
+def test_get_matches_sanitized_question_and_type(tmp_path):
+    answers_file = tmp_path / "answers.json"
+    answers_file.write_text(json.dumps([
+        {"type": "radio", "question": "Are you Authorized to work?", "answer": "Yes"},
+        {"type": "text", "question": "City", "answer": "Milan"},
+    ]))
+    cache = AnswerCache(str(answers_file))
+
+    assert cache.get('  are you "authorized" to work?', "radio")["answer"] == "Yes"
+    assert cache.get("are you authorized to work?", "dropdown") is None
+    assert cache.get("country", "text") is None
+
+
+def test_add_appends_to_existing_file_without_reload(tmp_path):
+    answers_file = tmp_path / "answers.json"
+    answers_file.write_text(json.dumps([{"type": "text", "question": "city", "answer": "Milan"}], indent=4))
+    cache = AnswerCache(str(answers_file))
+
+    assert cache.add({"type": "numeric", "question": "Years of Python?", "answer": "5"})
+    assert not cache.add({"type": "radio", "question": "years of python?", "answer": "5"})
+
+    assert cache.get("years of python?", "numeric")["answer"] == "5"
+    assert json.loads(answers_file.read_text()) == [
+        {"type": "text", "question": "city", "answer": "Milan"},
+        {"type": "numeric", "question": "years of python?", "answer": "5"},
+    ]
+
+
+def test_add_creates_missing_and_empty_files(tmp_path):
+    for content in (None, "", "[]"):
+        answers_file = tmp_path / "answers.json"
+        if content is None:
+            answers_file.unlink(missing_ok=True)
+        else:
+            answers_file.write_text(content)
+        cache = AnswerCache(str(answers_file))
+
+        cache.add({"type": "text", "question": "City", "answer": "Milan"})
+        cache.add({"type": "text", "question": "Country", "answer": "Italy"})
+
+        assert [item["question"] for item in json.loads(answers_file.read_text())] == ["city", "country"]
+        assert len(cache) == 2
+
+
+def _similarity_cache(tmp_path):
+    answers_file = tmp_path / "answers.json"
+    answers_file.write_text(json.dumps([
+        {"type": "radio", "question": "are you legally authorized to work in the us?", "answer": "yes"},
+        {"type": "numeric", "question": "how many years of python experience do you have?", "answer": "5"},
+    ]))
+    return AnswerCache(str(answers_file))
+
+
+def test_find_similar_reuses_reworded_question(tmp_path):
+    cache = _similarity_cache(tmp_path)
+
+    match = cache.find_similar(
+        "Are you authorized to work in the United States?", "radio", 0.85, ["Yes", "No"]
+    )
+
+    assert match["answer"] == "Yes"
+
+
+def test_find_similar_rejects_different_meaning_type_and_options(tmp_path):
+    cache = _similarity_cache(tmp_path)
+
+    assert cache.find_similar("How many years of Java experience do you have?", "numeric", 0.85) is None
+    assert cache.find_similar("Are you legally authorized to work in Canada?", "radio", 0.85, ["Yes", "No"]) is None
+    assert cache.find_similar("Are you authorized to work in the United States?", "dropdown", 0.85) is None
+    assert cache.find_similar(
+        "Are you authorized to work in the United States?", "radio", 0.85, ["Authorized", "Not authorized"]
+    ) is None
+
+
+def test_find_similar_sees_answers_added_after_load(tmp_path):
+    cache = _similarity_cache(tmp_path)
+    cache.add({"type": "text", "question": "What is your LinkedIn profile URL?", "answer": "https://linkedin.com/in/me"})
+
+    assert cache.find_similar("LinkedIn profile URL", "text", 0.85)["answer"] == "https://linkedin.com/in/me"
+
+
+def _answers_cache(tmp_path, *questions):
+    answers_file = tmp_path / "answers.json"
+    answers_file.write_text(json.dumps([{"type": "radio", "question": q, "answer": "Yes"} for q in questions]))
+    return AnswerCache(str(answers_file))
+
+
+def test_find_similar_never_reuses_negated_questions(tmp_path):
+    cache = _answers_cache(
+        tmp_path,
+        "Will you require visa sponsorship now or in the future?",
+        "Are you a US citizen?",
+        "Do you have a criminal record?",
+    )
+
+    for question in (
+        "Will you not require visa sponsorship now or in the future?",
+        "Are you not a US citizen?",
+        "Don't you have a criminal record?",
+    ):
+        assert cache.find_similar(question, "radio", 0.85, ["Yes", "No"]) is None
+    assert cache.find_similar("Will you require visa sponsorship, now or in future?", "radio", 0.85, ["Yes", "No"])
+
+
+def test_find_similar_requires_same_numbers_and_entities(tmp_path):
+    cache = _answers_cache(
+        tmp_path,
+        "Do you have at least 5 years of experience with Python?",
+        "Have you worked at Acme Corp before?",
+    )
+
+    assert cache.find_similar("Do you have at least 3 years of experience with Python?", "radio", 0.8) is None
+    assert cache.find_similar("Do you have at least 5 years of experience with Java?", "radio", 0.8) is None
+    assert cache.find_similar("Have you worked at Acme Inc before?", "radio", 0.8) is None
+    assert cache.find_similar("Have you ever worked at Acme Corp before?", "radio", 0.8)
@@ -0,0 +1,92 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from driver_pool import DriverPool
+from job import Job
+from job_manager import AIHawkJobManager
+from utils import browser_utils
+
+
+def test_driver_pool_starts_browsers_on_first_use():
+    main_driver = MagicMock(name="main")
+    factory = MagicMock(side_effect=lambda index: MagicMock(name=f"worker {index}"))
+    pool = DriverPool(3, factory, main_driver)
+
+    assert pool.get(0) is main_driver
+    assert pool.get(2) is pool.get(2)
+    factory.assert_called_once_with(2)
+    with pytest.raises(IndexError):
+        pool.get(3)
+
+    worker_driver = pool.get(2)
+    pool.quit()
+    worker_driver.quit.assert_called_once()
+    main_driver.quit.assert_not_called()
+
+
+def test_use_driver_is_scoped_to_the_thread():
+    default_driver, worker_driver = MagicMock(name="default"), MagicMock(name="worker")
+    browser_utils.set_default_driver(default_driver)
+    seen = {}
+
+    def other_thread():
+        seen["other"] = browser_utils._get_driver(None)
+
+    with browser_utils.use_driver(worker_driver):
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+        assert browser_utils._get_driver(None) is worker_driver
+
+    assert seen["other"] is default_driver
+    assert browser_utils._get_driver(None) is default_driver
+    browser_utils.set_default_driver(None)
+
+
+def _pooled_manager(size):
+    manager = AIHawkJobManager(MagicMock())
+    manager.easy_applier_component = MagicMock(name="applier 0")
+    manager.gpt_answerer = MagicMock()
+    manager.resume_path = None
+    manager.workPreferences = {}
+    manager.resume_generator_manager = MagicMock()
+    manager.write_to_file = MagicMock()
+    drivers = [MagicMock(name=f"driver {index}") for index in range(size)]
+    manager.set_driver_pool(DriverPool(size, lambda index: drivers[index], drivers[0]), MagicMock())
+    return manager, drivers
+
+
+def test_apply_screened_jobs_spreads_jobs_over_the_workers():
+    manager, drivers = _pooled_manager(3)
+    applied = []
+
+    def job_apply(job, screening):
+        time.sleep(0.05)
+        applied.append((job.title, browser_utils._get_driver(None)))
+
+    with patch("job_manager.AIHawkJobApplier") as applier_class:
+        manager.easy_applier_component.job_apply.side_effect = job_apply
+        applier_class.return_value.job_apply.side_effect = job_apply
+        manager.apply_screened_jobs([(Job(title=f"job {i}", company=f"company {i}"), None) for i in range(6)])
+
+    assert sorted(title for title, _ in applied) == [f"job {i}" for i in range(6)]
+    # Every worker ran with its own browser
+    assert {driver for _, driver in applied} == set(drivers)
+    assert applier_class.call_count == 2
+    assert applier_class.call_args.kwargs["answers_cache"] is manager.easy_applier_component.answers_cache
+    assert manager.write_to_file.call_count == 6
+
+
+def test_apply_screened_jobs_applies_once_per_company_across_workers():
+    manager, _ = _pooled_manager(2)
+
+    with patch("job_manager.AIHawkJobApplier") as applier_class, patch("job_manager.config.APPLY_ONCE_PER_COMPANY", True):
+        manager.easy_applier_component.job_apply.side_effect = lambda job, screening: time.sleep(0.2)
+        applier_class.return_value.job_apply.side_effect = lambda job, screening: time.sleep(0.2)
+        manager.apply_screened_jobs([(Job(title=f"job {i}", company="acme"), None) for i in range(2)])
+
+    statuses = sorted(call.args[1] for call in manager.write_to_file.call_args_list)
+    assert statuses == ["skipped", "success"]
@@ -0,0 +1,134 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from job import Job
+from job_discovery import JobDiscovery
+from job_portals.base_job_portal import BaseJobsPage
+from job_manager import AIHawkJobManager
+from services.web_search_engine import SearchResult
+
+
+class FakeJobsPage:
+    """Two pages of results per search; the same posting shows up in several searches."""
+
+    def __init__(self, failing=(), exhausted=()):
+        self.failing = failing
+        self.exhausted = exhausted
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def search_page(self, position, location, page_number):
+        with self.lock:
+            self.calls.append((position, location, page_number))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        if (position, location) in self.failing:
+            raise RuntimeError("quota exceeded")
+        if page_number >= 2:
+            return []
+        return [
+            SearchResult(title=position, link=f"https://jobs.lever.co/acme/{position}-{page_number}/apply", snippet=""),
+            SearchResult(title="Shared", link="https://jobs.lever.co/acme/shared/", snippet=""),
+        ]
+
+    def has_next_page(self, position, location):
+        return (position, location) not in self.exhausted
+
+    def job_tile_to_job(self, job_tile):
+        return Job(title=job_tile.title, link=job_tile.link.rstrip("/"))
+
+
+def test_discover_runs_searches_concurrently_and_deduplicates():
+    jobs_page = FakeJobsPage()
+    searches = [("python", "berlin"), ("python", "paris"), ("go", "berlin")]
+
+    jobs = JobDiscovery(jobs_page, max_workers=4, max_pages=10).discover(searches)
+
+    assert jobs_page.max_in_flight > 1
+    # Pages are requested until a search returns an empty page
+    assert sorted(call[2] for call in jobs_page.calls) == [0, 0, 0, 1, 1, 1, 2, 2, 2]
+    assert [job.title for job in jobs] == ["python", "Shared", "python", "go", "go"]
+    assert len({job.link for job in jobs}) == len(jobs)
+
+
+def test_discover_respects_max_pages_and_survives_failed_searches():
+    jobs_page = FakeJobsPage(failing={("python", "paris")})
+
+    jobs = JobDiscovery(jobs_page, max_workers=2, max_pages=1).discover([("python", "berlin"), ("python", "paris")])
+
+    assert sorted(jobs_page.calls) == [("python", "berlin", 0), ("python", "paris", 0)]
+    assert [job.title for job in jobs] == ["python", "Shared"]
+
+
+def test_discover_stops_searches_without_useful_next_page():
+    jobs_page = FakeJobsPage(exhausted={("go", "berlin")})
+
+    JobDiscovery(jobs_page, max_workers=2, max_pages=10).discover([("python", "berlin"), ("go", "berlin")])
+
+    assert sorted(call[2] for call in jobs_page.calls if call[0] == "go") == [0]
+    assert sorted(call[2] for call in jobs_page.calls if call[0] == "python") == [0, 1, 2]
+
+
+def test_apply_discovered_jobs_applies_in_batches(monkeypatch):
+    monkeypatch.setattr("job_manager.config.DISCOVERY_APPLY_BATCH_SIZE", 3)
+    monkeypatch.setattr("job_manager.config.MINIMUM_WAIT_TIME_IN_SECONDS", 0)
+    job_portal = MagicMock()
+    job_portal.jobs_page = FakeJobsPage()
+    manager = AIHawkJobManager(job_portal)
+    manager.apply_jobs = MagicMock()
+
+    manager.apply_discovered_jobs([("python", "berlin"), ("go", "berlin")])
+
+    assert [len(call.args[0]) for call in manager.apply_jobs.call_args_list] == [3, 2]
+
+
+class PagedJobsPage(BaseJobsPage):
+    """BaseJobsPage over FakeJobsPage's pages, recording when each page is requested."""
+
+    def __init__(self, exhausted=()):
+        super().__init__(driver=None, work_preferences={})
+        self.fake = FakeJobsPage(exhausted=exhausted)
+        self.requested = []
+
+    def search_page(self, position, location, page_number):
+        self.requested.append(page_number)
+        return self.fake.search_page(position, location, page_number)
+
+    def has_next_page(self, position, location):
+        return self.fake.has_next_page(position, location)
+
+    def job_tile_to_job(self, job_tile):
+        return self.fake.job_tile_to_job(job_tile)
+
+    def next_job_page(self, position, location, page_number):
+        raise NotImplementedError
+
+    def get_jobs_from_page(self, scroll=False):
+        raise NotImplementedError
+
+
+def test_iter_jobs_prefetches_the_next_page_while_consuming():
+    jobs_page = PagedJobsPage()
+    jobs = jobs_page.iter_jobs("python", "berlin")
+
+    first = next(jobs)
+    # Page 1 is requested while the consumer still holds the first job of page 0
+    time.sleep(0.1)
+    assert sorted(jobs_page.requested) == [0, 1]
+
+    assert [first.title] + [job.title for job in jobs] == ["python", "Shared", "python", "Shared"]
+
+
+def test_iter_job_pages_stops_when_no_next_page_is_worth_it():
+    jobs_page = PagedJobsPage(exhausted={("python", "berlin")})
+
+    pages = list(jobs_page.iter_job_pages("python", "berlin"))
+
+    assert len(pages) == 1
+    assert sorted(jobs_page.requested) == [0]
@@ -0,0 +1,146 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from job import Job
+from job_applier import AIHawkJobApplier
+from job_portals.application_form_elements import FormField, FormFieldKind, TextBoxQuestion, TextBoxQuestionType
+from job_manager import AIHawkJobManager
+from llm.ai_answerer import JobScreening
+from outcome_store import OutcomeIndex
+
+
+def _screening(match=True, suitable=True, score=8):
+    return JobScreening("summary", match, suitable, score, "reasoning")
+
+
+@pytest.fixture
+def applier():
+    job_portal = MagicMock()
+    job_portal.job_page.fetch_job_details.side_effect = lambda job: job.link != "unreachable"
+    applier = AIHawkJobApplier(job_portal, None, [], MagicMock(), {"keywords_whitelist": ["python"]}, MagicMock())
+    return applier
+
+
+def test_screen_jobs_batches_fetched_jobs_and_splits_results(applier):
+    jobs = {
+        name: Job(title=name, company=name, link=name, description=f"{name} python role")
+        for name in ("suitable", "remote_only", "low_score", "unreachable")
+    }
+    jobs["no_keywords"] = Job(title="no_keywords", link="no_keywords", description="java role")
+    applier.gpt_answerer.screen_jobs.return_value = [
+        _screening(),
+        _screening(match=False),
+        _screening(suitable=False, score=3),
+    ]
+
+    to_apply, rejected = applier.screen_jobs(list(jobs.values()))
+
+    screened = applier.gpt_answerer.screen_jobs.call_args.args[0]
+    assert [job.title for job in screened] == ["suitable", "remote_only", "low_score"]
+    assert [(job.title, screening is not None) for job, screening in to_apply] == [
+        ("unreachable", False),
+        ("suitable", True),
+    ]
+    assert [job.title for job, _ in rejected] == ["no_keywords", "remote_only", "low_score"]
+    assert "score 3" in rejected[2][1]
+
+
+def test_job_apply_skips_checks_for_screened_jobs(applier):
+    job = Job(title="suitable", link="suitable", description="python role")
+    applier._fill_application_form = MagicMock()
+
+    with patch("job_applier.time_utils"), patch("job_applier.wait_utils"):
+        applier.job_apply(job, _screening())
+
+    applier.job_page.get_job_description.assert_not_called()
+    applier.gpt_answerer.screen_job.assert_not_called()
+    applier.gpt_answerer.set_job.assert_called_once_with(job, summarize=False)
+    applier._fill_application_form.assert_called_once()
+
+
+def test_manager_records_rejected_jobs_and_falls_back_on_errors():
+    manager = AIHawkJobManager(MagicMock())
+    manager.easy_applier_component = MagicMock()
+    manager.write_to_file = MagicMock()
+    suitable, unsuitable = Job(title="suitable"), Job(title="unsuitable")
+    manager.easy_applier_component.screen_jobs.return_value = (
+        [(suitable, _screening())],
+        [(unsuitable, "Job is not suitable")],
+    )
+
+    with patch("job_manager.config.SCREEN_JOBS_BEFORE_APPLYING", True):
+        assert manager.screen_jobs([suitable, unsuitable]) == [(suitable, _screening())]
+        manager.write_to_file.assert_called_once_with(unsuitable, "skipped", "Job is not suitable")
+
+        manager.easy_applier_component.screen_jobs.side_effect = RuntimeError("gateway down")
+        assert manager.screen_jobs([suitable]) == [(suitable, None)]
+
+
+def test_only_successful_applications_count_as_already_applied():
+    manager = AIHawkJobManager(MagicMock())
+    manager.outcome_index = OutcomeIndex()
+    manager.outcome_index.add("success", {"link": "https://jobs.lever.co/acme/1"})
+    manager.outcome_index.add("skipped", {"link": "https://jobs.lever.co/acme/2"})
+
+    assert manager.is_already_applied_to_job("a", "acme", "https://jobs.eu.lever.co/Acme/1/apply/?lever-source=x")
+    assert not manager.is_already_applied_to_job("b", "acme", "https://jobs.lever.co/acme/2")
+
+
+def test_keywords_whitelist_records_matched_keywords():
+    job_portal = MagicMock()
+    applier = AIHawkJobApplier(job_portal, None, [], MagicMock(), {"keywords_whitelist": ["Python", "SQL", "Go"]}, MagicMock())
+    job = Job(title="data", description="We use sql and python daily")
+
+    assert applier._check_keywords_whitelist(job) == (True, None)
+    assert job.matched_keywords == ["SQL", "Python"]
+    assert applier._check_keywords_whitelist(Job(description="Rust only"))[0] is False
+
+
+def test_form_sections_are_filled_from_snapshots(applier):
+    textbox = TextBoxQuestion(question="Name", type=TextBoxQuestionType.TEXT, required=True)
+    form_field = FormField(kind=FormFieldKind.TEXTBOX, text="Name", label="Name", question=textbox, element="li")
+    applier.job_application_page.snapshot_form_fields.return_value = [form_field, form_field]
+    applier._handle_textbox_question = MagicMock()
+    job_context = MagicMock()
+
+    with patch("job_applier.browser_utils") as browser_utils, patch("job_applier.time_utils"), \
+            patch("job_applier.FORM_SNAPSHOT_PARSING", True):
+        applier._process_form_section(job_context, MagicMock())
+
+    applier.job_application_page.get_input_elements.assert_not_called()
+    applier.job_application_page.is_textbox_question.assert_not_called()
+    browser_utils.handle_security_checks.assert_called_once_with()
+    applier.job_application_page.wait_until_ready.assert_called_once_with()
+    job_context.job_application.add_question_to_form.assert_called_with("Name")
+    applier._handle_textbox_question.assert_called_with(job_context, "li", textbox)
+    assert applier._handle_textbox_question.call_count == 2
+
+
+def test_screen_job_fetches_details_and_scrapes_only_on_failure(applier):
+    applier.gpt_answerer.screen_job.return_value = _screening()
+    applier.job_page.fetch_job_details.side_effect = lambda job: job.link == "reachable"
+    reachable = Job(title="reachable", link="reachable", description="python role")
+    unreachable = Job(title="unreachable", link="unreachable")
+    applier.job_page.get_job_description.return_value = "python role"
+
+    applier._screen_job(reachable)
+    applier.job_page.get_job_description.assert_not_called()
+
+    applier._screen_job(unreachable)
+    applier.job_page.get_job_description.assert_called_once_with(unreachable)
+    assert unreachable.description == "python role"
+
+
+def test_screen_job_does_not_refetch_jobs_screen_jobs_could_not_fetch(applier):
+    applier.gpt_answerer.screen_jobs.return_value = []
+    job = Job(title="unreachable", link="unreachable")
+    applier.screen_jobs([job])
+    applier.job_page.fetch_job_details.reset_mock()
+    applier.job_page.get_job_description.return_value = "python role"
+    applier.gpt_answerer.screen_job.return_value = _screening()
+
+    applier._screen_job(job)
+
+    applier.job_page.fetch_job_details.assert_not_called()
+    applier.job_page.get_job_description.assert_called_once_with(job)
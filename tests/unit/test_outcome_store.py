@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from constants import OUTCOME_STORE_JSONL, OUTCOME_STORE_SQLITE
+from outcome_store import (
+    JsonLinesOutcomeStore,
+    OutcomeIndex,
+    SqliteOutcomeStore,
+    create_outcome_store,
+    import_json_array,
+    migrate_legacy_json_logs,
+)
+
+
+@pytest.fixture(params=[OUTCOME_STORE_JSONL, OUTCOME_STORE_SQLITE])
+def store(request, tmp_path):
+    store = create_outcome_store(tmp_path, request.param)
+    yield store
+    store.close()
+
+
+def _record(link, company, title="Engineer"):
+    return {"link": link, "company": company, "title": title}
+
+
+def test_create_outcome_store_backends(tmp_path):
+    assert isinstance(create_outcome_store(tmp_path, OUTCOME_STORE_JSONL), JsonLinesOutcomeStore)
+    assert isinstance(create_outcome_store(tmp_path, OUTCOME_STORE_SQLITE), SqliteOutcomeStore)
+    with pytest.raises(ValueError):
+        create_outcome_store(tmp_path, "csv")
+
+
+def test_lookups_by_link_company_and_status(store):
+    store.append("success", _record("https://jobs.lever.co/acme/1", "Acme"))
+    store.append("failed", _record("https://jobs.lever.co/acme/2", "Acme"))
+    store.append("skipped", _record("https://jobs.lever.co/globex/3", "Globex"))
+
+    assert store.find_by_link("https://jobs.lever.co/acme/2") == [_record("https://jobs.lever.co/acme/2", "Acme")]
+    assert store.find_by_link("https://jobs.lever.co/acme/2", "success") == []
+    assert len(store.find_by_company(" ACME ")) == 2
+    assert len(store.find_by_company("acme", "success")) == 1
+    assert [r["company"] for r in store.find_by_status("skipped")] == ["Globex"]
+    assert sorted(status for status, _ in store.iter_records()) == ["failed", "skipped", "success"]
+
+
+def test_records_survive_reopening(tmp_path):
+    for backend in (OUTCOME_STORE_JSONL, OUTCOME_STORE_SQLITE):
+        store = create_outcome_store(tmp_path, backend)
+        store.append("success", _record("link-1", "Acme"))
+        store.close()
+
+        reopened = create_outcome_store(tmp_path, backend)
+        assert reopened.find_by_link("link-1", "success") == [_record("link-1", "Acme")]
+        reopened.close()
+
+
+def test_jsonl_store_appends_one_line_per_record(tmp_path):
+    store = JsonLinesOutcomeStore(tmp_path)
+    store.append("skipped", _record("link-1", "Acme"))
+    store.append("skipped", _record("link-2", "Acme"))
+
+    lines = (tmp_path / "skipped.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["link"] for line in lines] == ["link-1", "link-2"]
+
+
+def test_import_json_array(store, tmp_path):
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(json.dumps([_record("link-1", "Acme"), _record("link-2", "Globex")]), encoding="utf-8")
+
+    assert import_json_array(store, legacy, "success") == 2
+    assert len(store.find_by_status("success")) == 2
+
+
+def test_import_json_array_ignores_invalid_file(store, tmp_path):
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text("{not json", encoding="utf-8")
+
+    assert import_json_array(store, legacy, "success") == 0
+
+
+def test_migrate_legacy_json_logs_runs_once(tmp_path):
+    (tmp_path / "success.json").write_text(json.dumps([_record("link-1", "Acme")]), encoding="utf-8")
+    (tmp_path / "failed.json").write_text(json.dumps([_record("link-2", "Globex")]), encoding="utf-8")
+    (tmp_path / "open_ai_calls.json").write_text("[]", encoding="utf-8")
+    store = JsonLinesOutcomeStore(tmp_path)
+
+    assert migrate_legacy_json_logs(store, tmp_path) == 2
+    assert migrate_legacy_json_logs(store, tmp_path) == 0
+    assert (tmp_path / "success.json.imported").exists()
+    assert (tmp_path / "open_ai_calls.json").exists()
+    assert store.find_by_link("link-2", "failed") == [_record("link-2", "Globex")]
+
+
+def test_outcome_index_loads_from_store_and_tracks_appends(store, tmp_path):
+    store.append("failed", _record("https://jobs.lever.co/Acme/1/apply", "Acme"))
+    store.append("success", _record("https://jobs.lever.co/globex/2", " Globex "))
+    store.close()
+    store = create_outcome_store(tmp_path, OUTCOME_STORE_SQLITE if isinstance(store, SqliteOutcomeStore) else OUTCOME_STORE_JSONL)
+    index = store.index
+
+    assert index.has_link("https://jobs.lever.co/acme/1/", "failed")
+    assert not index.has_link("https://jobs.lever.co/acme/1", "success")
+    assert index.has_company("GLOBEX", "success")
+    assert not index.has_company("Acme", "success")
+
+    store.append("success", _record("https://jobs.lever.co/acme/3", "Acme"))
+    assert index.has_company("acme", "success")
+    assert len(index) == 3
+    store.close()
+
+
+def test_outcome_index_lookups_do_not_grow_the_index():
+    index = OutcomeIndex()
+    index.add("success", _record("link-1", "Acme"))
+
+    assert not index.has_link("link-1", "failed")
+    assert not index.has_company("Acme", "skipped")
+    assert index.statuses() == ["success"]
+    assert index._links.keys() == index._companies.keys() == {"success"}
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_burst_is_free_then_calls_are_spaced_by_the_rate():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(4):
+        limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_tokens_refill_while_idle():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=1, clock=clock, sleep=clock.sleep)
+
+    limiter.acquire()
+    clock.now += 5
+    limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_concurrent_callers_queue_up():
+    clock = FakeClock()
+    waits = []
+    limiter = RateLimiter(rate=10, burst=1, clock=clock, sleep=waits.append)
+
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits) == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
@@ -1,7 +1,9 @@
+import re
+
 import pytest
 
 from job_manager import AIHawkJobManager
-from regex_utils import look_ahead_patterns
+from regex_utils import BlacklistMatcher, KeywordMatcher, look_ahead_patterns
 
 apply_component = AIHawkJobManager(None) # For this test we dont need the web driver
 
@@ -11,10 +13,8 @@ company_blacklist = ["ABC Corp", "XYZ Inc"]
 location_blacklist = ["Brazil"]
 seen_jobs = set()
 
-# Creating regex patterns
-apply_component.title_blacklist_patterns = look_ahead_patterns(title_blacklist)
-apply_component.company_blacklist_patterns = look_ahead_patterns(company_blacklist)
-apply_component.location_blacklist_patterns = look_ahead_patterns(location_blacklist)
+# Compiling the blacklists, as set_parameters does
+apply_component.blacklist_matcher = BlacklistMatcher(title_blacklist, company_blacklist, location_blacklist)
 
 test_cases = [
     # Blacklist matches for "Data Engineer" in various forms
@@ -49,3 +49,28 @@ def test_is_blacklisted(job_title, company, link, job_location, expected_output)
     actual_output = apply_component.is_blacklisted(job_title, company, link, job_location)
 
     assert actual_output == expected_output, f"Failed for case: {job_title} at {company} in {job_location} (link: {link})"
+
+
+@pytest.mark.parametrize("job_title, company, link, job_location, expected_output", test_cases)
+def test_matcher_agrees_with_look_ahead_patterns(job_title, company, link, job_location, expected_output):
+    regex_output = any(
+        re.search(pattern, text, re.IGNORECASE)
+        for patterns, text in (
+            (look_ahead_patterns(title_blacklist), job_title),
+            (look_ahead_patterns(company_blacklist), company),
+            (look_ahead_patterns(location_blacklist), job_location),
+        )
+        for pattern in patterns
+    )
+
+    assert regex_output == expected_output
+
+
+def test_keyword_matcher_reports_the_matching_term():
+    matcher = KeywordMatcher(["Data Engineer", "C++ Developer", "Brazil"])
+
+    assert matcher.search("Engineer, Data") == "Data Engineer"
+    assert matcher.search("Senior C++ Developer") == "C++ Developer"
+    assert matcher.search("Senior C Developer") is None
+    assert matcher.search("") is None
+    assert not KeywordMatcher([])
@@ -0,0 +1,61 @@
+from utils.sqlite_cache import SqliteLRUCache
+
+
+def test_get_and_set_round_trip_json_values(tmp_path):
+    cache = SqliteLRUCache(tmp_path / "cache.db")
+    cache.set("summary", "Python, SQL")
+    cache.set("parsed", {"match": True})
+
+    assert cache.get("summary") == "Python, SQL"
+    assert cache.get("parsed") == {"match": True}
+    assert cache.get("missing", "default") == "default"
+    assert len(cache) == 2
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = SqliteLRUCache(tmp_path / "cache.db", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_overwriting_a_key_does_not_grow_the_cache(tmp_path):
+    cache = SqliteLRUCache(tmp_path / "cache.db", max_entries=2)
+    cache.set("a", 1)
+    cache.set("a", 2)
+
+    assert cache.get("a") == 2
+    assert len(cache) == 1
+
+
+def test_entries_and_recency_survive_reopening(tmp_path):
+    cache = SqliteLRUCache(tmp_path / "cache.db", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.close()
+
+    reopened = SqliteLRUCache(tmp_path / "cache.db", max_entries=2)
+    reopened.set("c", 3)
+    assert reopened.get("a") == 1
+    assert reopened.get("b") is None
+    reopened.close()
+
+
+def test_expired_entries_are_dropped(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("utils.sqlite_cache.time.time", lambda: now[0])
+    cache = SqliteLRUCache(tmp_path / "cache.db", ttl_seconds=60)
+    cache.set("a", 1)
+
+    now[0] += 30
+    assert cache.get("a") == 1
+    now[0] += 31
+    assert cache.get("a") is None
+    assert len(cache) == 0
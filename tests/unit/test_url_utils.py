@@ -0,0 +1,35 @@
+import pytest
+
+from utils.url_utils import canonical_job_link, normalize_job_url
+
+
+@pytest.mark.parametrize(
+    "link",
+    [
+        "https://jobs.lever.co/acme/123",
+        "https://jobs.lever.co/Acme/123/apply",
+        "https://jobs.lever.co/acme/123/apply/",
+        "http://jobs.lever.co/acme/123/",
+        "https://jobs.lever.co/acme/123?lever-source=LinkedIn",
+        "https://jobs.lever.co/acme/123/apply?lever-origin=applied&lever-source%5B%5D=Indeed#top",
+        "https://jobs.eu.lever.co/acme/123",
+        "jobs.lever.co/acme/123",
+    ],
+)
+def test_variants_of_a_posting_share_one_canonical_link(link):
+    assert canonical_job_link(link) == "https://jobs.lever.co/acme/123"
+
+
+def test_normalized_url_keeps_the_regional_host():
+    assert normalize_job_url("https://jobs.eu.lever.co/Acme/123/apply/?lever-source=x") == "https://jobs.eu.lever.co/acme/123"
+
+
+def test_non_lever_links_keep_meaningful_query_parameters():
+    link = "https://www.boards.greenhouse.io/acme/jobs/1?gh_jid=1&utm_source=google&gh_src=abc"
+
+    assert canonical_job_link(link) == "https://boards.greenhouse.io/acme/jobs/1?gh_jid=1"
+
+
+def test_empty_links():
+    assert canonical_job_link(None) == ""
+    assert normalize_job_url("  ") == ""
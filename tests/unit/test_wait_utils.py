@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+from utils import time_utils, wait_utils
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _settle(states, timeout=5, idle_seconds=0.5):
+    clock = FakeClock()
+    driver = MagicMock()
+    driver.execute_script.side_effect = states
+    settled = wait_utils.wait_for_page_settled(
+        driver, timeout=timeout, idle_seconds=idle_seconds, clock=clock, sleep=clock.sleep
+    )
+    return settled, clock.now, driver.execute_script.call_count
+
+
+def test_page_settles_once_the_network_is_quiet_for_the_idle_window():
+    states = [["loading", 2, 0.0], ["complete", 1, 0.0], ["complete", 0, 0.1], ["complete", 0, 0.6]]
+
+    settled, elapsed, calls = _settle(states)
+
+    assert settled
+    assert calls == 4
+    assert round(elapsed, 1) == 0.3
+
+
+def test_page_with_a_request_in_flight_times_out():
+    # A long poll keeps a request open even though nothing completed for a while
+    states = [["complete", 1, 10.0]] * 100
+
+    settled, elapsed, _ = _settle(states, timeout=2)
+
+    assert not settled
+    assert round(elapsed, 1) == 2.0
+
+
+def test_page_state_errors_during_navigation_are_retried():
+    states = [RuntimeError("document unloaded"), ["complete", 0, 0.1], ["complete", 0, 0.3]]
+
+    settled, _, calls = _settle(states, idle_seconds=0.2)
+
+    assert settled
+    assert calls == 3
+
+
+def test_wait_for_upload_waits_for_the_file_input_value():
+    file_input = MagicMock(tag_name="input")
+    file_input.get_attribute.side_effect = ["", "", "C:\\fakepath\\resume.pdf"]
+
+    with patch("utils.wait_utils.wait_for_page_settled", return_value=True) as settled, \
+            patch("utils.wait_utils.config.WAIT_POLL_SECONDS", 0.01):
+        assert wait_utils.wait_for_upload(MagicMock(), file_input, timeout=1)
+
+    assert file_input.get_attribute.call_count == 3
+    settled.assert_called_once()
+
+
+def test_fast_mode_turns_human_jitter_off(monkeypatch):
+    sleep = MagicMock()
+    monkeypatch.setattr("utils.time_utils.time.sleep", sleep)
+
+    monkeypatch.setattr("config.FAST_MODE", True)
+    time_utils.tiny_sleep()
+    time_utils.medium_sleep()
+    sleep.assert_not_called()
+
+    monkeypatch.setattr("config.HUMAN_JITTER", True)
+    time_utils.short_sleep()
+    assert 1.2 <= sleep.call_args.args[0] <= 3
+
+    monkeypatch.setattr("config.FAST_MODE", False)
+    monkeypatch.setattr("config.HUMAN_JITTER", False)
+    assert not time_utils.human_jitter_enabled()